@@ -0,0 +1,47 @@
+import os
+import random
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+
+
+def make_tree(root, dirs=200, files_per_dir=50, depth=4, file_size=(0, 4096), seed=1, age=3600):
+    # Builds a deterministic tree of `dirs` directories spread over `depth`
+    # levels, each holding `files_per_dir` files of random size. Timestamps are
+    # backdated by `age` seconds so the tree looks settled to mtime-based caches.
+    rng = random.Random(seed)
+    paths = [root]
+    for i in range(dirs):
+        parent = rng.choice(paths[-depth * 8:]) if len(paths) > 1 else root
+        path = os.path.join(parent, f"d{i:05d}")
+        os.makedirs(path, exist_ok=True)
+        paths.append(path)
+    payload = os.urandom(file_size[1])
+    total = 0
+    for path in paths:
+        for j in range(files_per_dir):
+            size = rng.randint(*file_size)
+            with open(os.path.join(path, f"f{j:04d}.tmp"), "wb") as f:
+                f.write(payload[:size])
+            total += size
+    stamp = time.time() - age
+    for path in reversed(paths):
+        os.utime(path, (stamp, stamp))
+    return paths, total
+
+
+@contextmanager
+def temp_tree(**kwargs):
+    root = tempfile.mkdtemp(prefix="turboclean-bench-")
+    try:
+        paths, total = make_tree(root, **kwargs)
+        yield root, paths, total
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
@@ -0,0 +1,48 @@
+import argparse
+import os
+import shutil
+import tempfile
+
+from benchmarks._tree import timed
+from turboclean.assets import ASSET_DIRS, ASSET_MAP, AssetStore
+
+# Sizes the GUI asks for: sidebar icons, logo, status and disk icons
+REQUESTS = [("logo", (30, 30)), ("scan_shield", (20, 20)), ("clean_sparkle", (20, 20)), ("logo", (20, 20)),
+            ("program_box", (20, 20)), ("scan_shield", (30, 30)), ("disk", (20, 20))]
+
+
+def legacy_load(requests):
+    # The pre-AssetStore get_image: probe every candidate path, then decode the full-size file
+    from PIL import Image
+
+    images = []
+    for key, size in requests:
+        path = next((os.path.join(d, n) for d in ASSET_DIRS for n in ASSET_MAP[key] if os.path.exists(os.path.join(d, n))), None)
+        if path:
+            image = Image.open(path)
+            image.load()
+            images.append(image.resize(size))
+    return images
+
+
+def store_load(store, requests):
+    return [store.render(key, size) for key, size in requests if store.path(key)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GUI image loading: full-resolution decode vs. the pre-scaled asset cache")
+    parser.parse_args()
+    tmp = tempfile.mkdtemp(prefix="turboclean-bench-")
+    try:
+        legacy, images = timed(legacy_load, REQUESTS)
+        print(f"legacy decode      {legacy * 1000:8.1f} ms  ({len(images)} images)")
+        cold, images = timed(store_load, AssetStore(cache_dir=tmp), REQUESTS)
+        print(f"asset store, cold  {cold * 1000:8.1f} ms  (decode, downscale, write cache)")
+        warm, images = timed(store_load, AssetStore(cache_dir=tmp), REQUESTS)
+        print(f"asset store, warm  {warm * 1000:8.1f} ms  ({warm / legacy:.1%} of legacy, all off the UI thread)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
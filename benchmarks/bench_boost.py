@@ -0,0 +1,48 @@
+import argparse
+import statistics
+import sys
+import time
+
+# Needs a display; run on the desktop the app targets
+
+
+def widgets(w):
+    return 1 + sum(widgets(c) for c in w.winfo_children())
+
+
+def build(app, expand):
+    # Seconds to build (and optionally expand every section of) a BoostFrame, and its widget count
+    from turboclean.gui import BoostFrame
+    start = time.perf_counter()
+    frame = BoostFrame(app)
+    if expand:
+        # Every option row materialised: what each section used to build up front
+        for acc in frame.accordions:
+            acc.toggle()
+    app.update_idletasks()
+    elapsed = time.perf_counter() - start
+    count = widgets(frame)
+    frame.destroy()
+    return elapsed, count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BoostFrame build time and widget count: all option rows vs. lazily built sections")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    from turboclean.gui import TurboCleanApp
+    app = TurboCleanApp()
+    app.withdraw()
+    results = {}
+    for label, expand in (("all rows built", True), ("lazy sections", False)):
+        runs = [build(app, expand) for _ in range(args.repeat)]
+        results[label] = statistics.median(t for t, _ in runs)
+        print(f"{label:<16} median {results[label] * 1000:7.1f} ms   {runs[0][1]} widgets")
+    app.destroy()
+    print(f"lazy sections build in {results['lazy sections'] / results['all rows built']:.1%} of the time")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
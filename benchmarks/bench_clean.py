@@ -0,0 +1,54 @@
+import argparse
+import os
+import shutil
+
+from benchmarks._tree import temp_tree, timed
+from turboclean.cleaner import clean_targets
+from turboclean.scanner import scan_targets
+
+
+def legacy_clean(path):
+    # The pre-engine CleanFrame.run_clean loop
+    for item in os.listdir(path):
+        item_path = os.path.join(path, item)
+        try:
+            if os.path.isfile(item_path) or os.path.islink(item_path):
+                os.unlink(item_path)
+            elif os.path.isdir(item_path):
+                shutil.rmtree(item_path)
+        except Exception:
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Legacy listdir/rmtree loop vs. the bulk-delete engine")
+    parser.add_argument("--dirs", type=int, default=1000)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with temp_tree(dirs=args.dirs, files_per_dir=args.files) as (root, paths, total):
+        files = len(paths) * args.files
+        legacy, _ = timed(legacy_clean, root)
+        print(f"tree: {len(paths)} dirs, {files} files, {total / 1024**2:.1f} MB")
+        print(f"legacy loop  {legacy * 1000:8.1f} ms  ({files / legacy:,.0f} files/s)")
+
+    with temp_tree(dirs=args.dirs, files_per_dir=args.files) as (root, paths, total):
+        engine, (result,) = timed(clean_targets, [("bench", root)], args.workers)
+        assert result.files_deleted == files and result.bytes_freed == total, result
+        assert result.dirs_removed == len(paths) - 1 and not os.listdir(root)
+        print(f"engine       {engine * 1000:8.1f} ms  ({files / engine:,.0f} files/s)")
+        print(f"report: {result.as_dict()}")
+
+    # GUI flow: the scan records a manifest and the clean deletes from it
+    with temp_tree(dirs=args.dirs, files_per_dir=args.files) as (root, paths, total):
+        (scanned,) = scan_targets([("bench", root)], record=True)
+        manifest = scanned.manifest
+        from_manifest, (result,) = timed(clean_targets, [("bench", root)], args.workers, manifests={root: manifest})
+        assert result.files_deleted == files and not os.listdir(root), result
+        print(f"manifest     {from_manifest * 1000:8.1f} ms  ({files / from_manifest:,.0f} files/s), "
+              f"manifest holds {len(manifest):,} files in {manifest.nbytes() / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Needs a display; run on the desktop the app targets
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter: builds the app, forces the first paint and
+# reports it on stdout. "eager" rebuilds the pre-lazy start-up: every frame
+# constructed before the first paint and disk info read on the UI thread.
+CHILD = """
+import queue, sys
+from turboclean import gui
+
+eager = sys.argv[1] == "eager"
+
+class App(gui.TurboCleanApp):
+    def setup_frames(self):
+        super().setup_frames()
+        if eager:
+            for name in self.frame_types:
+                self.get_frame(name)
+            disks = queue.Queue()
+            self.frames["scan"].read_disks(disks)
+            self.frames["scan"].poll_disks(disks)
+
+def widgets(w):
+    return 1 + sum(widgets(c) for c in w.winfo_children())
+
+app = App()
+app.update()
+print("painted", widgets(app), flush=True)
+app.destroy()
+"""
+
+
+def cold_start(mode):
+    # Seconds from process spawn to the first painted window, and the widget count then
+    start = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, "-c", CHILD, mode], cwd=ROOT, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True)
+    line = proc.stdout.readline()
+    elapsed = time.perf_counter() - start
+    _, err = proc.communicate()
+    if not line.startswith("painted"):
+        raise RuntimeError((err.strip().splitlines() or ["no output"])[-1])
+    return elapsed, int(line.split()[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start to first paint: all frames built up front vs. lazily")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("eager", "lazy"):
+        try:
+            runs = [cold_start(mode) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{mode:<6} unavailable ({e})")
+            return 1
+        times = [t for t, _ in runs]
+        results[mode] = statistics.median(times)
+        print(f"{mode:<6} best {min(times) * 1000:7.1f} ms   median {results[mode] * 1000:7.1f} ms   "
+              f"{runs[0][1]} widgets at first paint")
+    print(f"lazy frames: {results['lazy'] / results['eager']:.1%} of the eager cold start")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
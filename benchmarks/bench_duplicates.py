@@ -0,0 +1,86 @@
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from turboclean.duplicates import PARTIAL_BYTES, find_duplicates
+
+
+def make_corpus(root, files, dup_ratio, max_size, seed=1):
+    # Writes `files` files of which about dup_ratio are extra copies of earlier
+    # ones. Some originals get a same-size sibling that differs only in the
+    # middle, so the partial hash cannot tell them apart and the full hash must.
+    # Returns (total bytes, {frozenset(copies)}) for the expected groups.
+    rng = random.Random(seed)
+    originals = []
+    copies = {}
+    total = 0
+    for i in range(files):
+        folder = os.path.join(root, f"d{i % 40:02d}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"f{i:06d}.bin")
+        if originals and rng.random() < dup_ratio:
+            source = rng.choice(originals)
+            shutil.copyfile(source, path)
+            copies.setdefault(source, {source}).add(path)
+        elif originals and rng.random() < 0.1:
+            source = rng.choice(originals)
+            with open(source, "rb") as f:
+                data = bytearray(f.read())
+            if len(data) <= 2 * PARTIAL_BYTES:
+                data = bytearray(os.urandom(len(data)))
+            else:
+                # Stamp the file number mid-file so siblings differ from each other too
+                mid = len(data) // 2
+                data[mid:mid + 4] = bytes(a ^ b for a, b in zip(data[mid:mid + 4], (i + 1).to_bytes(4, "little")))
+            with open(path, "wb") as f:
+                f.write(data)
+        else:
+            with open(path, "wb") as f:
+                f.write(os.urandom(rng.randint(1, max_size)))
+            originals.append(path)
+        total += os.path.getsize(path)
+    return total, {frozenset(paths) for paths in copies.values()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Duplicate finder throughput on a tree with a known duplicate ratio")
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--dup-ratio", type=float, default=0.25)
+    parser.add_argument("--max-size", type=int, default=1024 * 1024, help="largest file in bytes")
+    parser.add_argument("--processes", type=int, default=None)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="turboclean-bench-")
+    try:
+        total, expected = make_corpus(root, args.files, args.dup_ratio, args.max_size)
+        print(f"corpus: {args.files} files, {total / 1024**2:.1f} MB, {len(expected)} duplicate groups")
+
+        marks = {}
+        def progress(stage, done, count):
+            marks.setdefault(stage, time.perf_counter())
+            marks[stage + " end"] = time.perf_counter()
+
+        start = time.perf_counter()
+        report = find_duplicates([root], processes=args.processes, on_progress=progress)
+        elapsed = time.perf_counter() - start
+
+        found = {frozenset(g.paths) for g in report.groups}
+        assert found == expected, (len(found), len(expected))
+
+        full = marks.get("full end", start) - marks.get("partial end", start)
+        print(f"size pass:    {report.size_candidates} of {report.files} files share a size")
+        print(f"partial pass: {report.partial_hashed} files, {report.full_hashed} left for full hashing")
+        if report.full_hashed and full > 0:
+            print(f"full pass:    {report.full_hashed_bytes / 1024**2:.1f} MB in {full * 1000:.0f} ms "
+                  f"({report.full_hashed_bytes / 1024**2 / full:.0f} MB/s)")
+        print(f"total:        {elapsed * 1000:.0f} ms, {total / 1024**2 / elapsed:.0f} MB/s of corpus, "
+              f"{report.wasted / 1024**2:.1f} MB reclaimable")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+import argparse
+import gc
+import heapq
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from array import array
+
+import psutil
+
+from turboclean.fileindex import DAY_NS, FileIndex
+
+ROOT = os.path.join("C:\\" if os.name == "nt" else "/", "Users", "bench", "AppData", "Local", "Temp")
+FILES_PER_DIR = 50
+
+
+def synthetic_dirs(entries, seed=1):
+    # (dir path, names, sizes, mtimes) blocks shaped like a browser cache
+    rng = random.Random(seed)
+    now = time.time_ns()
+    for d in range(0, entries, FILES_PER_DIR):
+        count = min(FILES_PER_DIR, entries - d)
+        path = os.path.join(ROOT, f"{d // 2500:04x}", f"{d // FILES_PER_DIR:06x}")
+        names = [f"f_{d + i:08x}.tmp" for i in range(count)]
+        sizes = [rng.randrange(1 << 20) for _ in range(count)]
+        mtimes = [now - rng.randrange(400 * DAY_NS) for _ in range(count)]
+        yield path, names, sizes, mtimes
+
+
+def build_tuples(entries):
+    # The shape run_scan uses for items: (name, path, size_str, size)
+    rows = []
+    for path, names, sizes, _ in synthetic_dirs(entries):
+        for name, size in zip(names, sizes):
+            rows.append((name, os.path.join(path, name), f"{size / (1024*1024):.1f} MB", size))
+    return rows
+
+
+def build_index(entries):
+    index = FileIndex()
+    index.add_dir(ROOT)
+    seen = {ROOT}
+    for path, names, sizes, mtimes in synthetic_dirs(entries):
+        parent = os.path.dirname(path)
+        if parent not in seen:
+            seen.add(parent)
+            index.add_dir(parent)
+        index.add_dir(path, names, array("Q", sizes), array("q", mtimes))
+    index.seal()
+    return index
+
+
+def measure(case, entries):
+    gc.collect()
+    process = psutil.Process()
+    before = process.memory_info().rss
+    start = time.perf_counter()
+    data = build_tuples(entries) if case == "tuples" else build_index(entries)
+    build = time.perf_counter() - start
+    gc.collect()
+    rss = process.memory_info().rss - before
+
+    queries = {}
+    start = time.perf_counter()
+    if case == "tuples":
+        sum(row[3] for row in data)
+        queries["total"] = time.perf_counter() - start
+        start = time.perf_counter()
+        heapq.nlargest(20, data, key=lambda row: row[3])
+        queries["top20"] = time.perf_counter() - start
+    else:
+        data.totals_by_root()
+        queries["total"] = time.perf_counter() - start
+        start = time.perf_counter()
+        data.top_n(20)
+        queries["top20"] = time.perf_counter() - start
+        start = time.perf_counter()
+        data.age_histogram()
+        queries["age"] = time.perf_counter() - start
+    return {"case": case, "entries": entries, "rss": rss, "build": build, "queries": queries}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of the columnar FileIndex vs. a list of tuples")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--case", choices=("tuples", "index"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # Child process: one measurement in a clean interpreter
+        print(json.dumps(measure(args.case, args.entries[0])))
+        return
+
+    for entries in args.entries:
+        rows = {}
+        for case in ("tuples", "index"):
+            out = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_fileindex", "--case", case, "--entries", str(entries)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            rows[case] = json.loads(out)
+        for case, row in rows.items():
+            q = ", ".join(f"{k} {v * 1000:.0f} ms" for k, v in row["queries"].items())
+            print(f"{entries:>9,} {case:<7} rss {row['rss'] / 1024**2:8.1f} MiB "
+                  f"({row['rss'] / entries:6.1f} B/entry)  build {row['build']:.2f}s  {q}")
+        print(f"{'':>9} index uses {rows['index']['rss'] / rows['tuples']['rss']:.1%} of the tuple list's memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import argparse
+import os
+import random
+import shutil
+import tempfile
+
+from benchmarks._tree import timed
+from turboclean.programs import UNINSTALL_KEYS, VALUE_NAMES, ProgramInventory
+from turboclean.registry import MemoryRegistry
+
+
+def make_registry(entries, latency, seed=1):
+    rng = random.Random(seed)
+    backend = MemoryRegistry()
+    keys = []
+    for i in range(entries):
+        hive, path = UNINSTALL_KEYS[i % len(UNINSTALL_KEYS)]
+        key = f"{path}\\{{{i:08X}-PROGRAM}}"
+        values = {"DisplayName": f"Program {i}"}
+        if rng.random() < 0.8:
+            values["InstallDate"] = f"{rng.randint(2015, 2025)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+        backend.create_key(hive, key, values)
+        keys.append((hive, key))
+    backend.latency = latency
+    return backend, keys
+
+
+def legacy_fetch(backend):
+    # The pre-inventory fetch_programs: every subkey of every hive, one by one
+    names = []
+    for hive, path in UNINSTALL_KEYS:
+        for name, _ in backend.enum_subkeys(hive, path):
+            values = backend.read_values(hive, f"{path}\\{name}", VALUE_NAMES)
+            if "DisplayName" in values:
+                names.append(values["DisplayName"])
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Program inventory refresh: serial full read vs. cached, concurrent inventory")
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--latency-us", type=float, default=100, help="simulated cost of one registry call")
+    parser.add_argument("--changes", type=int, default=50, help="programs updated before the incremental refresh")
+    args = parser.parse_args()
+
+    backend, keys = make_registry(args.entries, args.latency_us / 10**6)
+    tmp = tempfile.mkdtemp(prefix="turboclean-bench-")
+    try:
+        inventory = ProgramInventory(backend, os.path.join(tmp, "inventory.db"))
+
+        legacy, names = timed(legacy_fetch, backend)
+        print(f"{args.entries} programs, {args.latency_us:.0f} us per registry call")
+        print(f"legacy serial     {legacy * 1000:8.1f} ms  ({len(names)} keys read)")
+
+        cold, programs = timed(inventory.refresh)
+        assert sorted(p.name for p in programs) == sorted(names)
+        print(f"cold inventory    {cold * 1000:8.1f} ms  ({inventory.reread} keys read)")
+
+        warm, programs = timed(inventory.refresh)
+        assert sorted(p.name for p in programs) == sorted(names)
+        print(f"warm inventory    {warm * 1000:8.1f} ms  ({inventory.reread} keys read, {warm / legacy:.1%} of legacy)")
+
+        for hive, key in random.Random(2).sample(keys, args.changes):
+            backend.set_value(hive, key, "DisplayVersion", "2.0")
+        changed, programs = timed(inventory.refresh)
+        assert len(programs) == len(names)
+        print(f"{args.changes} changed        {changed * 1000:8.1f} ms  ({inventory.reread} keys read)")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+import argparse
+import random
+import sys
+import time
+from fnmatch import fnmatchcase
+
+from turboclean.fileindex import DAY_NS
+from turboclean.rules import Matcher, Rule
+
+# Throughput of the compiled rule matcher against checking each rule's globs
+# with fnmatch in turn, on the same file names. Exits non-zero if the two
+# ever disagree.
+
+EXTENSIONS = ["tmp", "log", "bak", "old", "dmp", "etl", "cab", "chk", "gid", "part", "crdownload", "cache",
+              "db-wal", "db-shm", "lock", "txt", "dat", "json", "js", "png", "jpg", "dll", "exe", "msi"]
+PREFIXES = ["~$", "~wr", "tmp", "cache_", "thumbcache_", "f_", "data_", "index", "crash", "log"]
+
+
+def make_rules(count, rng):
+    # A mix of the shapes real cleanup policies use: "*.ext", "prefix*",
+    # exact names and a few full globs, most with excludes or limits
+    rules = []
+    for i in range(count):
+        shape = i % 5
+        if shape in (0, 1):
+            include = [f"*.{rng.choice(EXTENSIONS)}{i}" if i >= len(EXTENSIONS) else f"*.{EXTENSIONS[i]}"]
+        elif shape == 2:
+            include = [f"{rng.choice(PREFIXES)}{i}*"]
+        elif shape == 3:
+            include = [f"file{i}.dat", f"report{i}.txt"]
+        else:
+            include = [f"cache_{i:03d}_??.b[io]n", f"*_{i}.part*"]
+        exclude = ["*.lock"] if i % 3 == 0 else []
+        older = rng.choice([None, 1, 7, 30])
+        min_size = rng.choice([None, None, 4096])
+        rules.append(Rule(include, exclude, older, min_size))
+    return rules
+
+
+def make_files(count, rules, rng, now_ns):
+    # Names that hit one of the rules about half the time
+    files = []
+    for i in range(count):
+        rule = rules[rng.randrange(len(rules))]
+        glob = rng.choice(rule.include)
+        if rng.random() < 0.5:
+            name = glob.replace("*", f"x{i}").replace("??", "ab").replace("[io]", "i")
+        else:
+            name = f"f_{i:08x}.{rng.choice(EXTENSIONS)}"
+        if rng.random() < 0.1:
+            name = name.upper()
+        files.append((name, rng.randrange(1 << 16), now_ns - rng.randrange(60 * DAY_NS), now_ns - rng.randrange(60 * DAY_NS)))
+    return files
+
+
+def naive(rules, now_ns):
+    def match(name, size, mtime, atime):
+        name = name.lower()
+        used = max(mtime, atime)
+        for rule in rules:
+            if not any(fnmatchcase(name, g.lower()) for g in rule.include):
+                continue
+            if any(fnmatchcase(name, g.lower()) for g in rule.exclude):
+                continue
+            if rule.older_than_days is not None and used >= now_ns - int(rule.older_than_days * DAY_NS):
+                continue
+            if rule.min_size is not None and size < rule.min_size:
+                continue
+            if rule.max_size is not None and size > rule.max_size:
+                continue
+            return True
+        return False
+    return match
+
+
+def run(match, files):
+    start = time.perf_counter()
+    out = [match(*f) for f in files]
+    return time.perf_counter() - start, out
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compiled rule matcher vs. per-rule fnmatch")
+    parser.add_argument("--rules", type=int, nargs="+", default=[10, 100, 250])
+    parser.add_argument("--files", type=int, default=200_000)
+    args = parser.parse_args()
+
+    now_ns = time.time_ns()
+    failed = False
+    for count in args.rules:
+        rng = random.Random(count)
+        rules = make_rules(count, rng)
+        files = make_files(args.files, rules, rng, now_ns)
+        compile_time, matcher = run(lambda: Matcher(rules, now_ns), [()])
+        matcher = matcher[0]
+        slow, expected = run(naive(rules, now_ns), files)
+        fast, got = run(matcher.match, files)
+        mismatches = sum(a != b for a, b in zip(expected, got))
+        failed |= bool(mismatches)
+        print(f"{count:>4} rules  fnmatch {args.files / slow / 1000:8.0f}k files/s  "
+              f"compiled {args.files / fast / 1000:8.0f}k files/s  ({slow / fast:.1f}x, compile {compile_time * 1000:.1f} ms, "
+              f"{sum(got)} of {args.files} selected{f', {mismatches} MISMATCHES' if mismatches else ''})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
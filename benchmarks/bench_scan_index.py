@@ -0,0 +1,42 @@
+import argparse
+import os
+import tempfile
+
+from benchmarks._tree import temp_tree, timed
+from turboclean.index import ScanIndex
+from turboclean.scanner import scan_targets
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold vs. repeat scan with the incremental scan index")
+    parser.add_argument("--dirs", type=int, default=2000)
+    parser.add_argument("--files", type=int, default=50)
+    args = parser.parse_args()
+
+    with temp_tree(dirs=args.dirs, files_per_dir=args.files) as (root, paths, total), \
+            tempfile.TemporaryDirectory(prefix="turboclean-index-") as db_dir:
+        targets = [("bench", root)]
+        index = ScanIndex(os.path.join(db_dir, "scan_index.db"))
+
+        plain, _ = timed(scan_targets, targets)
+        cold, (cold_result,) = timed(scan_targets, targets, index=index)
+        warm, (warm_result,) = timed(scan_targets, targets, index=index)
+
+        # Touch one leaf directory and rescan: only that directory is re-listed
+        with open(os.path.join(paths[-1], "new.tmp"), "wb") as f:
+            f.write(b"x" * 100)
+        changed, (changed_result,) = timed(scan_targets, targets, index=index)
+
+        assert cold_result.size == warm_result.size == total, (cold_result.size, warm_result.size, total)
+        assert changed_result.size == total + 100
+
+        print(f"tree: {len(paths)} dirs, {cold_result.files} files, {total / 1024**2:.1f} MB")
+        print(f"no index     {plain * 1000:8.1f} ms")
+        print(f"cold index   {cold * 1000:8.1f} ms")
+        print(f"warm index   {warm * 1000:8.1f} ms  ({warm / cold:.1%} of cold)")
+        print(f"one changed  {changed * 1000:8.1f} ms")
+        print(f"index: {index.stats()}")
+
+
+if __name__ == "__main__":
+    main()
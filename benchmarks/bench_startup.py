@@ -0,0 +1,62 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUI_MODULES = ("tkinter", "_tkinter", "customtkinter", "PIL", "turboclean.gui")
+
+# Each probe runs in a fresh interpreter so import caches do not carry over
+HEADLESS = "import turboclean.cli"
+GUI = "import turboclean.gui"
+GUI_DEPS = "import customtkinter, psutil; from PIL import Image"
+LEAK_CHECK = (
+    "import sys, turboclean.cli; "
+    f"print(','.join(m for m in {GUI_MODULES!r} if m in sys.modules))"
+)
+
+
+def run(code):
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    return time.perf_counter() - start, proc
+
+
+def measure(label, code, repeat):
+    times = []
+    for _ in range(repeat):
+        elapsed, proc = run(code)
+        if proc.returncode != 0:
+            print(f"{label:<28} unavailable ({proc.stderr.strip().splitlines()[-1]})")
+            return None
+        times.append(elapsed)
+    best, median = min(times), statistics.median(times)
+    print(f"{label:<28} best {best * 1000:7.1f} ms   median {median * 1000:7.1f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Process start-up cost of the headless CLI vs. the GUI")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = measure("python (empty)", "pass", args.repeat)
+    headless = measure("headless (turboclean.cli)", HEADLESS, args.repeat)
+    measure("GUI dependencies only", GUI_DEPS, args.repeat)
+    gui = measure("GUI (turboclean.gui)", GUI, args.repeat)
+
+    _, proc = run(LEAK_CHECK)
+    leaked = proc.stdout.strip()
+    print(f"GUI modules loaded by headless path: {leaked or 'none'}")
+
+    if headless is not None and baseline is not None:
+        print(f"headless overhead over bare interpreter: {(headless - baseline) * 1000:.1f} ms")
+    if headless is not None and gui is not None:
+        print(f"GUI start-up is {gui / headless:.1f}x the headless path")
+    return 1 if leaked else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import argparse
+import sys
+import time
+
+import customtkinter as ctk
+
+from turboclean.vlist import ListModel, VirtualList
+
+# Needs a display; run on the desktop the app targets
+
+ROW_HEIGHT = 60
+
+
+class Row:
+    # Same widgets as a ProgramsFrame row
+    def __init__(self, parent):
+        self.frame = ctk.CTkFrame(parent, corner_radius=8, height=ROW_HEIGHT)
+        self.frame.pack_propagate(False)
+        self.var = ctk.BooleanVar()
+        ctk.CTkCheckBox(self.frame, text="", variable=self.var, width=20).pack(side="left", padx=15, pady=15)
+        self.icon = ctk.CTkLabel(self.frame, text="📦", font=("Segoe UI", 20))
+        self.icon.pack(side="left", padx=10)
+        info = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info.pack(side="left", fill="x", expand=True)
+        self.name = ctk.CTkLabel(info, text="", font=("Segoe UI", 12, "bold"))
+        self.name.pack(anchor="w")
+        self.date = ctk.CTkLabel(info, text="", font=("Segoe UI", 10))
+        self.date.pack(anchor="w")
+        self.size = ctk.CTkLabel(self.frame, text="-- MB", font=("Segoe UI", 12, "bold"))
+        self.size.pack(side="right", padx=15)
+
+    def show(self, index, row, checked):
+        self.var.set(checked)
+        self.name.configure(text=row[0])
+        self.date.configure(text=row[1])
+
+
+def legacy_render(parent, rows):
+    # The pre-VirtualList display_programs loop: every row built up front
+    scroll = ctk.CTkScrollableFrame(parent)
+    scroll.pack(fill="both", expand=True)
+    for name, date, is_old in rows:
+        row = ctk.CTkFrame(scroll, corner_radius=8)
+        row.pack(fill="x", pady=5)
+        var = ctk.BooleanVar()
+        ctk.CTkCheckBox(row, text="", variable=var, width=20).pack(side="left", padx=15, pady=15)
+        ctk.CTkLabel(row, text="🏚️" if is_old else "📦", font=("Segoe UI", 20)).pack(side="left", padx=10)
+        info = ctk.CTkFrame(row, fg_color="transparent")
+        info.pack(side="left", fill="x", expand=True)
+        ctk.CTkLabel(info, text=name, font=("Segoe UI", 12, "bold")).pack(anchor="w")
+        ctk.CTkLabel(info, text=date, font=("Segoe UI", 10)).pack(anchor="w")
+        if is_old:
+            ctk.CTkLabel(row, text="Old", corner_radius=5, padx=5).pack(side="right", padx=15)
+        ctk.CTkLabel(row, text="-- MB", font=("Segoe UI", 12, "bold")).pack(side="right", padx=15)
+    return scroll
+
+
+def virtual_render(parent, rows):
+    vlist = VirtualList(parent, ListModel(rows), Row, row_height=ROW_HEIGHT)
+    vlist.pack(fill="both", expand=True)
+    return vlist
+
+
+def count_widgets(widget):
+    count = 0
+    pending = [widget]
+    while pending:
+        w = pending.pop()
+        count += 1
+        pending.extend(w.winfo_children())
+    return count
+
+
+def measure(app, render, rows):
+    holder = ctk.CTkFrame(app)
+    holder.pack(fill="both", expand=True)
+    start = time.perf_counter()
+    widget = render(holder, rows)
+    app.update()
+    elapsed = time.perf_counter() - start
+    widgets = count_widgets(widget)
+
+    # Time to scroll to the end and back, as a user dragging the scrollbar would
+    start = time.perf_counter()
+    for fraction in (0.25, 0.5, 0.75, 1.0, 0.0):
+        if isinstance(widget, VirtualList):
+            widget.yview("moveto", fraction)
+        else:
+            widget._parent_canvas.yview_moveto(fraction)
+        app.update()
+    scroll = time.perf_counter() - start
+    holder.destroy()
+    app.update()
+    return elapsed, widgets, scroll
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render time and widget count: per-row widgets vs. VirtualList")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--legacy-max", type=int, default=10000, help="skip the legacy list above this many rows")
+    args = parser.parse_args()
+
+    app = ctk.CTk()
+    app.geometry("900x600")
+    app.update()
+    print(f"{'rows':>6}  {'list':<8} {'render':>10} {'widgets':>8} {'scroll x5':>10}")
+    for n in args.rows:
+        rows = [(f"Program {i}", "Jan 01, 2020 • 2000 days old", i % 3 == 0) for i in range(n)]
+        cases = [("virtual", virtual_render)]
+        if n <= args.legacy_max:
+            cases.insert(0, ("legacy", legacy_render))
+        for label, render in cases:
+            elapsed, widgets, scroll = measure(app, render, rows)
+            print(f"{n:>6}  {label:<8} {elapsed * 1000:>8.0f}ms {widgets:>8} {scroll * 1000:>8.0f}ms")
+            sys.stdout.flush()
+    app.destroy()
+
+
+if __name__ == "__main__":
+    main()
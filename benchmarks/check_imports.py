@@ -0,0 +1,72 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# Fails (exit 1) when start-up imports grow past a budget, so import bloat
+# does not creep back in. Each entry point is imported under
+# `python -X importtime` in a fresh interpreter; the best of --repeat runs is
+# compared against its budget, and modules that belong to a single feature
+# (loaded when that feature is first used) must not show up at all.
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only one tab or button needs
+DEFERRED = ("psutil", "multiprocessing", "concurrent.futures.process", "turboclean.duplicates", "winreg")
+
+# (label, code, budget in ms, modules that must not be imported)
+ENTRY_POINTS = [
+    ("headless CLI", "import turbocleaner, turboclean.cli", 60,
+     DEFERRED + ("tkinter", "customtkinter", "PIL", "turboclean.gui")),
+    ("GUI", "import turbocleaner, turboclean.gui", 300, DEFERRED),
+]
+
+
+def import_times(code):
+    # ({module: cumulative us}, total us of the top-level imports) for one fresh interpreter
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError((proc.stderr.strip().splitlines() or ["failed"])[-1])
+    modules = {}
+    total = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+        if not name[1:].startswith(" "): # Top level: one space after the bar, no nesting
+            total += int(cumulative)
+    return modules, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check start-up import time against a budget")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every budget, e.g. for slow machines")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports listed per entry point")
+    args = parser.parse_args()
+
+    failed = False
+    for label, code, budget, forbidden in ENTRY_POINTS:
+        budget *= args.scale
+        try:
+            runs = [import_times(code) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"{label:<14} unavailable ({e})")
+            continue
+        modules, total = min(runs, key=lambda run: run[1])
+        ms = total / 1000
+        status = "ok" if ms <= budget else "OVER BUDGET"
+        print(f"{label:<14} {ms:7.1f} ms of {budget:.0f} ms budget  {status}")
+        leaked = [m for m in forbidden if m in modules]
+        if leaked:
+            print(f"{'':<14} imported at start-up but should be deferred: {', '.join(leaked)}")
+        if ms > budget or leaked:
+            failed = True
+            for name, us in sorted(modules.items(), key=lambda m: -m[1])[:args.top]:
+                print(f"{'':<14} {us / 1000:7.1f} ms  {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+from benchmarks._tree import make_tree, timed
+from turboclean.index import ScanIndex
+from turboclean.scanner import scan_targets
+
+# Exits non-zero unless scans of trees full of link cycles, links out of the
+# tree and hard links report exactly the real tree and finish in bounded time.
+# Directory links are symlinks, or junctions on Windows without the symlink
+# privilege.
+
+# A scan of the linked tree may take this many times the plain tree's scan
+# (plus one second of slack) before it counts as unbounded
+SLOWDOWN_LIMIT = 5
+
+
+def link_dir(target, link):
+    try:
+        os.symlink(target, link, target_is_directory=True)
+    except OSError:
+        if os.name != "nt":
+            raise
+        import _winapi
+        _winapi.CreateJunction(target, link)
+
+
+def add_links(paths, outside, every):
+    # Per `every`-th directory: a link to the root, one to its parent and one
+    # out of the tree, plus a hard link to one of its files. Returns the
+    # number of extra names created.
+    root = paths[0]
+    extra = 0
+    for i, path in enumerate(paths[1::every]):
+        link_dir(root, os.path.join(path, "loop_root"))
+        link_dir(os.path.dirname(path), os.path.join(path, "loop_parent"))
+        link_dir(outside, os.path.join(path, "outside"))
+        files = sorted(name for name in os.listdir(path) if name.endswith(".tmp"))
+        if files:
+            try:
+                os.link(os.path.join(path, files[0]), os.path.join(path, f"hardlink{i}.tmp"))
+                extra += 1
+            except OSError:
+                pass # Filesystem without hard links
+        extra += 3
+    return extra
+
+
+def bounded_scan(timeout, *args, **kwargs):
+    # scan_targets in a thread; None if it has not finished after `timeout` seconds
+    out = []
+    thread = threading.Thread(target=lambda: out.append(timed(scan_targets, *args, **kwargs)), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return out[0] if out else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check scans of trees with link cycles, links out of the tree and hard links")
+    parser.add_argument("--dirs", type=int, default=400)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--every", type=int, default=10, help="add links to every Nth directory")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="turboclean-bench-")
+    failures = []
+
+    def check(label, ok, detail):
+        print(f"{'ok  ' if ok else 'FAIL'} {label}: {detail}")
+        if not ok:
+            failures.append(label)
+
+    try:
+        root = os.path.join(tmp, "tree")
+        outside = os.path.join(tmp, "outside")
+        paths, total = make_tree(root, dirs=args.dirs, files_per_dir=args.files, depth=6, file_size=(1, 4096))
+        _, outside_total = make_tree(outside, dirs=20, files_per_dir=10, depth=2, file_size=(1, 4096), seed=2)
+        files = len(paths) * args.files
+        baseline, _ = timed(scan_targets, [("tree", root)])
+        try:
+            extra = add_links(paths, outside, args.every)
+        except OSError as e:
+            print(f"cannot create directory links here ({e.strerror}); nothing checked")
+            return 1
+        limit = SLOWDOWN_LIMIT * baseline + 1.0
+
+        run = bounded_scan(limit, [("tree", root)])
+        check("skip links", run is not None, f"{run[0] * 1000:.0f} ms" if run else f"no result after {limit:.1f} s")
+        if run:
+            result = run[1][0]
+            check("skip links: bytes", result.size == total, f"{result.size} of {total}")
+            check("skip links: files", result.files == files, f"{result.files} of {files} ({extra} extra names)")
+
+        run = bounded_scan(limit, [("tree", root)], follow_links=True)
+        check("follow links", run is not None, f"{run[0] * 1000:.0f} ms" if run else f"no result after {limit:.1f} s")
+        if run:
+            result = run[1][0]
+            check("follow links: bytes", result.size == total + outside_total,
+                  f"{result.size} of {total + outside_total} (tree plus the linked-to tree, once)")
+
+        index = ScanIndex(os.path.join(tmp, "index.db"))
+        for label in ("indexed, cold", "indexed, warm"):
+            run = bounded_scan(limit, [("tree", root)], index=index)
+            check(label, run is not None and run[1][0].size == total,
+                  f"{run[1][0].size} of {total}" if run else f"no result after {limit:.1f} s")
+
+        # Mixed warm/cold: a file with a name in two directories, one served
+        # from the index and one changed since, still counts once
+        settled, changed = paths[1], paths[-1]
+        first = sorted(name for name in os.listdir(settled) if name.endswith(".tmp"))[0]
+        try:
+            os.link(os.path.join(settled, first), os.path.join(changed, "crosslink.tmp"))
+        except OSError:
+            print("no hard links on this filesystem; mixed warm/cold not checked")
+        else:
+            stamp = os.stat(root).st_mtime
+            for path in paths:
+                os.utime(path, (stamp, stamp))
+            index = ScanIndex(os.path.join(tmp, "mixed.db"))
+            bounded_scan(limit, [("tree", root)], index=index)
+            with open(os.path.join(changed, "new.tmp"), "wb") as f:
+                f.write(b"x" * 100)
+            run = bounded_scan(limit, [("tree", root)], index=index)
+            check("indexed, mixed", run is not None and run[1][0].size == total + 100,
+                  f"{run[1][0].size} of {total + 100}" if run else f"no result after {limit:.1f} s")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"{len(failures)} failed" if failures else "all checks passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+import hashlib
+import io
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Image assets for the GUI. Paths are resolved once from a single listing of
+# each asset folder; decoding and downscaling happen on a background thread,
+# and every (source, size) is kept as a small pre-resized PNG in a disk cache
+# so later starts never decode the full-resolution originals again.
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(APP_DIR, "asset_cache")
+
+ASSET_DIRS = (os.path.join(APP_DIR, "assets"), os.path.join(APP_DIR, "Assets"))
+
+# Key -> candidate file names, first one found wins (emojis are used as fallback)
+ASSET_MAP = {
+    "logo": ["logo.png", "logo.jpg", "logo.webp"],
+    "scan_shield": ["scan.png", "shield.png", "shield-emoji.png"],
+    "disk": ["disk.png", "drive.png", "hdd.png"],
+    "clean_sparkle": ["sparkle.png", "clean.png", "sparkles.png"],
+    "trash": ["trash.png", "bin.png", "delete.png"],
+    "quick_clean_drive": ["clean_drive.png", "drive_clean.png"],
+    "quick_ping_test": ["ping.png", "network.png", "wifi.png"],
+    "quick_hardware_info": ["hardware.png", "info.png", "system.png"],
+    "program_box": ["box.png", "package.png", "programs.png"],
+    "program_old": ["old.png", "deprecated.png"],
+}
+
+# Images are stored at this multiple of their logical size so they stay sharp
+# on high-DPI displays; CustomTkinter scales them down from there
+PIXEL_SCALE = 2
+
+# Cached images are named <key>-<source digest>-<w>x<h>.png, where the digest
+# covers the source's size and mtime: a start-up with a warm cache stats each
+# source instead of reading and hashing it
+DIGEST_SIZE = 8
+
+
+class AssetStore:
+    # load(key, size, on_loaded, on_failed) returns at once; on_loaded(image)
+    # or, if the asset cannot be decoded, on_failed() runs on whichever thread
+    # calls deliver(), which the GUI does from its main loop. Each (key, size)
+    # is decoded at most once per process.
+
+    def __init__(self, asset_dirs=ASSET_DIRS, asset_map=ASSET_MAP, cache_dir=DEFAULT_CACHE_DIR, scale=PIXEL_SCALE):
+        self.asset_dirs = asset_dirs
+        self.asset_map = asset_map
+        self.cache_dir = cache_dir
+        self.scale = scale
+        self._files = None # Folder listing, read on first use
+        self._paths = {}
+        self._images = {} # (key, size) -> PIL image once decoded
+        self._failed = set() # (key, size) that could not be decoded
+        self._waiting = {} # (key, size) -> [(on_loaded, on_failed)]
+        self._done = queue.Queue() # (key, size, image) from the decode thread
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _listing(self):
+        if self._files is None:
+            files = {}
+            for folder in self.asset_dirs:
+                try:
+                    names = os.listdir(folder)
+                except OSError:
+                    continue
+                for name in names:
+                    files.setdefault((folder, name), os.path.join(folder, name))
+            self._files = files
+        return self._files
+
+    def path(self, key):
+        # Source file for `key`, or None if no candidate exists
+        if key not in self._paths:
+            files = self._listing()
+            self._paths[key] = next((files[folder, name] for folder in self.asset_dirs
+                                     for name in self.asset_map.get(key, ()) if (folder, name) in files), None)
+        return self._paths[key]
+
+    def load(self, key, size, on_loaded, on_failed=None):
+        # False if there is no such asset or it already failed to decode, so
+        # the caller can fall back at once
+        if self.path(key) is None:
+            return False
+        cache_key = (key, tuple(size))
+        if cache_key in self._failed:
+            return False
+        image = self._images.get(cache_key)
+        if image is not None:
+            on_loaded(image)
+            return True
+        with self._lock:
+            waiting = self._waiting.get(cache_key)
+            if waiting is not None:
+                waiting.append((on_loaded, on_failed))
+                return True
+            self._waiting[cache_key] = [(on_loaded, on_failed)]
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="turboclean-assets")
+        self._pool.submit(self._decode, cache_key)
+        return True
+
+    def pending(self):
+        return bool(self._waiting)
+
+    def deliver(self):
+        # Hands every image decoded since the last call to its callbacks
+        while True:
+            try:
+                cache_key, image = self._done.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                callbacks = self._waiting.pop(cache_key, [])
+            if image is None:
+                self._failed.add(cache_key)
+                for _, on_failed in callbacks:
+                    if on_failed is not None:
+                        on_failed()
+                continue
+            self._images[cache_key] = image
+            for on_loaded, _ in callbacks:
+                on_loaded(image)
+
+    def _decode(self, cache_key):
+        # Always queues a result, so the key leaves _waiting and pending() ends
+        try:
+            image = self.render(*cache_key)
+        except Exception:
+            image = None # Unreadable or corrupt asset (PIL raises more than OSError)
+        self._done.put((cache_key, image))
+
+    def render(self, key, size):
+        # PIL image of `key` at size * scale, from the disk cache when possible
+        from PIL import Image
+
+        source = self.path(key)
+        st = os.stat(source)
+        digest = hashlib.blake2b(f"{st.st_size}:{st.st_mtime_ns}".encode(), digest_size=DIGEST_SIZE).hexdigest()
+        pixels = (size[0] * self.scale, size[1] * self.scale)
+        cached = os.path.join(self.cache_dir, f"{key}-{digest}-{pixels[0]}x{pixels[1]}.png")
+        try:
+            with Image.open(cached) as image:
+                image.load()
+                return image.copy()
+        except OSError:
+            pass
+
+        with open(source, "rb") as f:
+            data = f.read()
+        image = Image.open(io.BytesIO(data))
+        image.draft("RGBA", pixels) # JPEGs decode straight at a reduced scale
+        image = image.convert("RGBA").resize(pixels, Image.LANCZOS)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{cached}.{os.getpid()}.tmp"
+            image.save(tmp, "PNG")
+            os.replace(tmp, cached)
+        except OSError:
+            pass # Only a cache
+        return image
@@ -0,0 +1,350 @@
+import errno
+import heapq
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from turboclean.scanner import FILE_ATTRIBUTE_REPARSE_POINT, QUARANTINE_DIR, default_workers, is_link
+
+# Files handed to a worker per task; large enough to amortise the executor
+# overhead, small enough that a slow batch does not hold up the whole target
+BATCH_FILES = 256
+
+# Paths kept per target to illustrate each failure reason
+MAX_ERROR_SAMPLES = 20
+
+
+class CleanResult:
+    __slots__ = ("name", "path", "bytes_freed", "files_deleted", "files_skipped",
+                 "dirs_removed", "dirs_kept", "quarantined", "errors", "error_samples")
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.bytes_freed = 0
+        self.files_deleted = 0
+        self.files_skipped = 0
+        self.dirs_removed = 0
+        self.dirs_kept = 0
+        self.quarantined = 0 # Entries moved to quarantine instead of deleted
+        self.errors = {} # reason -> count
+        self.error_samples = [] # (path, reason)
+
+    def add_error(self, path, reason):
+        self.errors[reason] = self.errors.get(reason, 0) + 1
+        if len(self.error_samples) < MAX_ERROR_SAMPLES:
+            self.error_samples.append((path, reason))
+
+    def as_dict(self):
+        return {
+            "name": self.name,
+            "path": self.path,
+            "bytes_freed": self.bytes_freed,
+            "files_deleted": self.files_deleted,
+            "files_skipped": self.files_skipped,
+            "dirs_removed": self.dirs_removed,
+            "dirs_kept": self.dirs_kept,
+            "quarantined": self.quarantined,
+            "errors": dict(self.errors),
+            "error_samples": [list(s) for s in self.error_samples],
+        }
+
+    def __repr__(self):
+        return f"CleanResult({self.name!r}, freed={self.bytes_freed}, deleted={self.files_deleted}, skipped={self.files_skipped})"
+
+
+def error_reason(exc):
+    winerror = getattr(exc, "winerror", None)
+    if winerror in (32, 33):
+        return "in use"
+    if isinstance(exc, FileNotFoundError):
+        return "already gone"
+    if isinstance(exc, PermissionError) or winerror == 5:
+        return "access denied"
+    return exc.strerror or type(exc).__name__
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+    except PermissionError as e:
+        # Read-only files cannot be deleted on Windows until the flag is cleared
+        if getattr(e, "winerror", None) != 5:
+            raise
+        os.chmod(path, stat.S_IWRITE)
+        os.unlink(path)
+
+
+def _is_link_stat(st):
+    # is_link() for an lstat() result
+    return stat.S_ISLNK(st.st_mode) or bool(getattr(st, "st_file_attributes", 0) & FILE_ATTRIBUTE_REPARSE_POINT)
+
+
+def _delete_batch(batch, progress=None, target=0):
+    # batch: (path, size, mtime_ns). With an mtime the file is only deleted if
+    # it still has the size and mtime the scan recorded, so files a running
+    # process rewrote since the scan are left alone. Links are recorded with
+    # size 0, so only their mtime is compared.
+    freed = deleted = 0
+    failures = []
+    for path, size, mtime in batch:
+        try:
+            if mtime is not None:
+                st = os.lstat(path)
+                if (st.st_size != size and not _is_link_stat(st)) or st.st_mtime_ns != mtime:
+                    failures.append((path, "changed since scan"))
+                    continue
+            _unlink(path)
+            freed += size
+            deleted += 1
+        except OSError as e:
+            failures.append((path, error_reason(e)))
+    if progress is not None:
+        progress.add(len(batch), freed, target=target)
+    return freed, deleted, failures
+
+
+def lru_victims(files, cap):
+    # files: iterable of (path, size, mtime_ns, last_used_ns), read once.
+    # Returns the least recently used files that must go for the rest to fit
+    # in cap bytes, oldest first, as (path, size, mtime_ns). No total is needed
+    # up front: a min-heap on last use holds the newest files that fit, and
+    # whatever it has to drop to stay under cap is a victim, as is every later
+    # file older than the newest victim so far.
+    kept = [] # (last_used, path, size, mtime_ns)
+    victims = []
+    newest = None # (last_used, path) of the newest victim
+    total = 0
+    for path, size, mtime, used in files:
+        if newest is not None and (used, path) < newest:
+            victims.append((used, path, size, mtime))
+            continue
+        heapq.heappush(kept, (used, path, size, mtime))
+        total += size
+        while total > cap:
+            victim = heapq.heappop(kept)
+            total -= victim[2]
+            victims.append(victim)
+            newest = victim[:2]
+    victims.sort()
+    return [(path, size, mtime) for _, path, size, mtime in victims]
+
+
+class Cleaner:
+    def __init__(self, max_workers=None, batch=BATCH_FILES):
+        self.max_workers = max_workers or default_workers()
+        self.batch = batch
+        self.progress = None # ProgressBus for the current clean(), if any
+        self.target = 0 # Index of the target being cleaned, for progress
+
+    def _collect(self, fut, result):
+        freed, deleted, failures = fut.result()
+        result.bytes_freed += freed
+        result.files_deleted += deleted
+        result.files_skipped += len(failures)
+        for path, reason in failures:
+            result.add_error(path, reason)
+
+    def clean_one(self, pool, name, path, matcher=None):
+        # Empties the target directory but keeps the directory itself. With a
+        # matcher only the files its rules select are deleted; directories
+        # still holding other files are kept.
+        result = CleanResult(name, path)
+        try:
+            st = os.lstat(path)
+        except OSError:
+            return result
+        if not stat.S_ISDIR(st.st_mode):
+            freed, deleted, failures = _delete_batch([(path, st.st_size, None)], self.progress, self.target)
+            result.bytes_freed, result.files_deleted = freed, deleted
+            for failed_path, reason in failures:
+                result.files_skipped += 1
+                result.add_error(failed_path, reason)
+            return result
+
+        # Single scandir pass; files go to the pool in batches while the rest
+        # of the tree is still being listed. Links (symlinks, junctions) are
+        # unlinked, never descended into, so cleaning cannot escape the target;
+        # os.unlink removes directory symlinks and junctions on Windows as well.
+        futures = []
+        batch = []
+        dirs = []
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.name == QUARANTINE_DIR and current == path:
+                            continue # Only the purge deletes the quarantine
+                        try:
+                            if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                                stack.append(entry.path)
+                                dirs.append(entry.path)
+                            else:
+                                st = entry.stat(follow_symlinks=False)
+                                if matcher is not None and not matcher.match(entry.name, st.st_size, st.st_mtime_ns, st.st_atime_ns):
+                                    continue
+                                batch.append((entry.path, st.st_size, None))
+                        except OSError as e:
+                            result.files_skipped += 1
+                            result.add_error(entry.path, error_reason(e))
+                            continue
+                        if len(batch) >= self.batch:
+                            futures.append(pool.submit(_delete_batch, batch, self.progress, self.target))
+                            batch = []
+            except OSError as e:
+                result.add_error(current, error_reason(e))
+        if batch:
+            futures.append(pool.submit(_delete_batch, batch, self.progress, self.target))
+
+        return self._finish(result, futures, dirs)
+
+    def _finish(self, result, futures, dirs):
+        wait(futures)
+        for fut in futures:
+            self._collect(fut, result)
+
+        # Children were discovered after their parents, so reverse order is bottom-up
+        for d in reversed(dirs):
+            try:
+                os.rmdir(d)
+                result.dirs_removed += 1
+            except OSError as e:
+                result.dirs_kept += 1
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST) and getattr(e, "winerror", None) != 145:
+                    result.add_error(d, error_reason(e))
+        return result
+
+    def _files(self, path, matcher=None, result=None):
+        # (path, size, mtime_ns, last_used_ns) of every file under path; links
+        # are neither followed nor listed. Last use is the access time unless
+        # access times are not kept (older than the modification), then mtime.
+        stack = [path]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if is_link(entry) or entry.name == QUARANTINE_DIR:
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError as e:
+                            if result is not None:
+                                result.add_error(entry.path, error_reason(e))
+                            continue
+                        if matcher is not None and not matcher.match(entry.name, st.st_size, st.st_mtime_ns, st.st_atime_ns):
+                            continue
+                        yield entry.path, st.st_size, st.st_mtime_ns, max(st.st_atime_ns, st.st_mtime_ns)
+            except OSError as e:
+                if result is not None:
+                    result.add_error(current, error_reason(e))
+
+    def clean_capped(self, pool, name, path, cap, matcher=None):
+        # Trims the target to cap bytes by deleting its least recently used
+        # files, keeping the rest (and every directory) warm for the next
+        # session. The tree is listed once, straight into lru_victims; files
+        # that cannot be read are reported. Files touched after they were
+        # picked are left alone.
+        result = CleanResult(name, path)
+        if not os.path.isdir(path):
+            return result
+        victims = lru_victims(self._files(path, matcher, result), cap)
+        futures = [pool.submit(_delete_batch, victims[i:i + self.batch], self.progress, self.target)
+                   for i in range(0, len(victims), self.batch)]
+        return self._finish(result, futures, [])
+
+    def clean_manifest(self, pool, name, manifest, matcher=None):
+        # Deletes what the scan recorded instead of listing the tree again.
+        # Files created after the scan are not in the manifest and are kept.
+        # The scan already applied the matcher to the files it recorded.
+        result = CleanResult(name, manifest.root)
+        futures = []
+        batch = []
+        dirs = []
+        for path, files in manifest.iter_dirs():
+            if path != manifest.root:
+                dirs.append(path) # The target directory itself is kept
+            if files is None:
+                # Served from the scan index, so never listed: list it now and
+                # leave anything modified after the scan started
+                files = []
+                try:
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            try:
+                                if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                                    continue
+                                st = entry.stat(follow_symlinks=False)
+                            except OSError as e:
+                                result.files_skipped += 1
+                                result.add_error(entry.path, error_reason(e))
+                                continue
+                            if matcher is not None and not matcher.match(entry.name, st.st_size, st.st_mtime_ns, st.st_atime_ns):
+                                continue
+                            if st.st_mtime_ns > manifest.scanned_at_ns:
+                                result.files_skipped += 1
+                                result.add_error(entry.path, "changed since scan")
+                            else:
+                                files.append((entry.name, 0 if is_link(entry) else st.st_size, st.st_mtime_ns))
+                except OSError as e:
+                    result.add_error(path, error_reason(e))
+
+            for file_name, size, mtime in files:
+                batch.append((os.path.join(path, file_name), size, mtime))
+                if len(batch) >= self.batch:
+                    futures.append(pool.submit(_delete_batch, batch, self.progress, self.target))
+                    batch = []
+        if batch:
+            futures.append(pool.submit(_delete_batch, batch, self.progress, self.target))
+
+        return self._finish(result, futures, dirs)
+
+    def clean(self, targets, on_result=None, manifests=None, progress=None, matchers=None, caps=None, quarantine=None):
+        # targets: iterable of (name, path). Files are deleted by the pool while
+        # the next part of the tree is still being listed. manifests maps a
+        # target path to the Manifest its scan recorded, if there is one, and
+        # matchers a target path to the rules.Matcher of its file rules.
+        # Targets in caps (path -> bytes) are trimmed to that size instead.
+        # With quarantine(name, path) -> CleanResult, whole-directory targets
+        # are handed to it rather than deleted; targets with rules or a cap
+        # are still cleaned file by file.
+        # progress (a ProgressBus) gets files handled and bytes freed per batch
+        # and one step per finished target; call its expect() first for
+        # work-weighted progress.
+        targets = list(targets)
+        results = []
+        self.progress = progress
+        if progress is not None:
+            progress.total = len(targets)
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="turboclean-clean") as pool:
+            for idx, (name, path) in enumerate(targets):
+                self.target = idx
+                if progress is not None:
+                    progress.current = name
+                manifest = manifests.get(path) if manifests else None
+                matcher = matchers.get(path) if matchers else None
+                cap = caps.get(path) if caps else None
+                if cap is not None:
+                    result = self.clean_capped(pool, name, path, cap, matcher)
+                elif quarantine is not None and matcher is None:
+                    result = quarantine(name, path)
+                elif manifest is not None:
+                    result = self.clean_manifest(pool, name, manifest, matcher)
+                else:
+                    result = self.clean_one(pool, name, path, matcher)
+                results.append(result)
+                if progress is not None:
+                    progress.add(done=1, target=idx)
+                if on_result:
+                    on_result(result)
+        return results
+
+
+def clean_targets(targets, max_workers=None, on_result=None, manifests=None, progress=None, matchers=None, caps=None,
+                  quarantine=None):
+    return Cleaner(max_workers).clean(targets, on_result, manifests, progress, matchers, caps, quarantine)
@@ -0,0 +1,271 @@
+import argparse
+import json
+import sys
+import time
+
+from turboclean import engine, registry
+from turboclean.index import ScanIndex
+from turboclean.programs import ProgramInventory, ProgramSizer
+from turboclean.rules import ConfigError
+from turboclean.stats import TOP_FILES
+from turboclean.tweaks import CATALOG, TweakEngine, clear_snapshot, load_snapshot, save_snapshot
+
+# Headless entry point: `python turbocleaner.py scan|clean [--json]`.
+# Must stay free of GUI imports (see engine.py).
+
+
+def _select(targets, names):
+    if not names:
+        return targets
+    wanted = {n.lower() for n in names}
+    return [(name, path) for name, path in targets if name.lower() in wanted]
+
+
+def _emit(args, payload, lines):
+    if args.json:
+        json.dump(payload, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        for line in lines:
+            print(line)
+
+
+def _scan_entry(result, top):
+    entry = {"name": result.name, "path": result.path, "exists": result.exists, "size": result.size,
+             "files": result.files, "dirs": result.dirs, "errors": result.errors}
+    if result.stats is not None:
+        old_files, old_size = result.stats.old()
+        entry["old_files"] = old_files
+        entry["old_bytes"] = old_size
+        entry["age_histogram"] = [{"age": label, "files": files, "bytes": size}
+                                  for label, files, size in result.stats.histogram()]
+        entry["largest"] = [{"path": path, "size": size} for size, path in result.stats.top(top)]
+    return entry
+
+
+def cmd_scan(args):
+    start = time.perf_counter()
+    index = None if args.no_index else ScanIndex()
+    issues = engine.check_issues()
+    results = engine.scan(_select(engine.default_targets(), args.target), index=index, stats=True)
+    report = issues.result()
+    elapsed = time.perf_counter() - start
+
+    total = sum(r.size for r in results)
+    payload = {
+        "targets": [_scan_entry(r, args.top) for r in results],
+        "total_size": total,
+        "issues": len(report),
+        **report.as_dict(),
+        "elapsed": round(elapsed, 3),
+    }
+    lines = []
+    for r in results:
+        if not r.exists:
+            continue
+        old_files, old_size = r.stats.old()
+        lines.append(f"{r.name:<24} {engine.format_size(r.size):>10} {r.files:>9} files  "
+                     f"{old_files} old ({engine.format_size(old_size)})  {r.path}")
+        for size, path in r.stats.top(args.top):
+            lines.append(f"    {engine.format_size(size):>10}  {path}")
+    lines.append(f"{'Total':<24} {engine.format_size(total):>10}")
+    for finding in report.findings:
+        lines.append(f"Issue: {finding.title} [{finding.severity}]" + (f"  (fix: tweaks {finding.fix} --apply)" if finding.fix else ""))
+        for detail in finding.details:
+            lines.append(f"    {detail}")
+    for rule, reason in report.errors:
+        lines.append(f"Issue check {rule} failed: {reason}")
+    lines.append(f"{len(report)} issues found in {elapsed:.2f}s")
+    _emit(args, payload, lines)
+    return 0
+
+
+def cmd_clean(args):
+    start = time.perf_counter()
+    targets = _select(engine.default_targets(), args.target)
+
+    if args.dry_run:
+        # Report what a clean would delete, from a fresh walk
+        results = engine.scan(targets)
+        caps = engine.default_caps()
+        elapsed = time.perf_counter() - start
+        entries = []
+        lines = []
+        for r in results:
+            entry = {"name": r.name, "path": r.path, "bytes": r.size, "files": r.files}
+            cap = caps.get(r.path)
+            if cap is not None:
+                entry["cap"] = cap
+                entry["bytes"] = engine.over_cap(r.size, cap)
+                if r.exists:
+                    lines.append(f"Would evict {engine.format_size(entry['bytes'])} from {r.name} to reach its "
+                                 f"{engine.format_size(cap)} cap ({engine.format_size(r.size)} in {r.files} files)")
+            elif r.exists:
+                lines.append(f"Would clean {r.name}: {engine.format_size(r.size)} in {r.files} files")
+            entries.append(entry)
+        payload = {
+            "dry_run": True,
+            "targets": entries,
+            "elapsed": round(elapsed, 3),
+        }
+        _emit(args, payload, lines)
+        return 0
+
+    results = engine.clean(targets, quarantine=args.quarantine)
+    elapsed = time.perf_counter() - start
+    payload = {
+        "dry_run": False,
+        "targets": [r.as_dict() for r in results],
+        "bytes_freed": sum(r.bytes_freed for r in results),
+        "elapsed": round(elapsed, 3),
+    }
+    lines = [engine.describe_clean(r) for r in results]
+    if args.quarantine:
+        # Earlier quarantines that are due get purged now, in the background,
+        # so scheduled runs free space without the app ever being opened
+        engine.start_purge()
+        lines.append("Quarantined entries can be restored with `quarantine restore` until they are purged")
+    lines.append(f"Freed {engine.format_size(payload['bytes_freed'])} in {elapsed:.2f}s")
+    _emit(args, payload, lines)
+    return 1 if any(r.files_skipped for r in results) else 0
+
+
+def cmd_duplicates(args):
+    start = time.perf_counter()
+    report = engine.duplicates(args.path or None, min_size=args.min_size)
+    elapsed = time.perf_counter() - start
+
+    payload = report.as_dict()
+    payload["elapsed"] = round(elapsed, 3)
+    lines = []
+    for group in report.groups[:args.limit]:
+        lines.append(f"{engine.format_size(group.wasted):>10} wasted  {len(group.paths)} x {engine.format_size(group.size)}")
+        lines.extend(f"    {path}" for path in group.paths)
+    lines.append(f"{len(report.groups)} duplicate groups, {engine.format_size(report.wasted)} reclaimable "
+                 f"({report.files} files, {report.full_hashed} fully hashed) in {elapsed:.2f}s")
+    _emit(args, payload, lines)
+    return 0
+
+
+def cmd_programs(args):
+    start = time.perf_counter()
+    inventory = ProgramInventory(registry.default_backend())
+    programs = inventory.installed()
+    sizes = ProgramSizer(inventory).sizes(programs) if args.sizes else {}
+    elapsed = time.perf_counter() - start
+
+    entries = []
+    for program in programs:
+        date_str, is_old = program.describe()
+        entries.append({"name": program.name, "key": f"{program.hive}\\{program.key}", "installed": date_str, "old": is_old,
+                        "size": sizes.get(program)})
+    payload = {"programs": entries, "reread": inventory.reread, "elapsed": round(elapsed, 3)}
+    lines = [f"{'old' if e['old'] else '':<4}{e['name']:<50} {e['installed']:<32} "
+             f"{engine.format_size(e['size']) if e['size'] is not None else ''}" for e in entries]
+    lines.append(f"{len(entries)} programs ({inventory.reread} registry keys read) in {elapsed:.2f}s")
+    _emit(args, payload, lines)
+    return 0
+
+
+def cmd_tweaks(args):
+    tweak_engine = TweakEngine(registry.default_backend())
+    if args.rollback:
+        errors = tweak_engine.rollback(load_snapshot())
+        if not errors:
+            clear_snapshot()
+        payload = {"rollback": True, "errors": [list(e) for e in errors]}
+        lines = [f"{loc}: {reason}" for loc, reason in errors] or ["Previous values restored."]
+        _emit(args, payload, lines)
+        return 1 if errors else 0
+
+    if not args.key:
+        # Catalog with what is already in place
+        status = tweak_engine.status()
+        payload = {"tweaks": [{"key": t.key, "title": t.title, "applied": status[t.key]} for t in CATALOG]}
+        lines = [f"{'[x]' if status[t.key] else '[ ]'} {t.key:<22} {t.title}" for t in CATALOG]
+        _emit(args, payload, lines)
+        return 0
+
+    run = tweak_engine.apply(args.key, dry_run=not args.apply, revert=args.revert)
+    if args.apply:
+        save_snapshot(run)
+    lines = []
+    for result in run.results:
+        lines.append(f"{result.title}: {result.status}")
+        lines.extend(f"    {c.describe()}" for c in result.changes)
+        lines.extend(f"    {loc}: {reason}" for loc, reason in result.errors)
+    if not args.apply:
+        lines.append("Dry run; pass --apply to write these changes")
+    _emit(args, run.as_dict(), lines)
+    return 1 if run.count("failed") else 0
+
+
+def cmd_index(args):
+    from turboclean.index import main as index_main
+    return index_main(args.rest)
+
+
+def cmd_quarantine(args):
+    from turboclean.quarantine import main as quarantine_main
+    return quarantine_main(args.rest)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="turbocleaner.py", description="TurboClean headless scan and clean")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    scan = sub.add_parser("scan", help="measure junk locations")
+    scan.add_argument("--json", action="store_true", help="print machine-readable output")
+    scan.add_argument("--target", action="append", metavar="NAME", help="only this target (repeatable)")
+    scan.add_argument("--no-index", action="store_true", help="ignore the incremental scan index")
+    scan.add_argument("--top", type=int, default=0, metavar="N", help="list the N largest files per target (max %d)" % TOP_FILES)
+    scan.set_defaults(func=cmd_scan)
+
+    clean = sub.add_parser("clean", help="delete the contents of junk locations")
+    clean.add_argument("--json", action="store_true", help="print machine-readable output")
+    clean.add_argument("--target", action="append", metavar="NAME", help="only this target (repeatable)")
+    clean.add_argument("--dry-run", action="store_true", help="list what would be cleaned without deleting")
+    clean.add_argument("--quarantine", action="store_true", help="move contents aside (restorable) instead of deleting")
+    clean.set_defaults(func=cmd_clean)
+
+    dupes = sub.add_parser("duplicates", help="find files with identical content")
+    dupes.add_argument("path", nargs="*", help="directories to search (default: the user profile)")
+    dupes.add_argument("--json", action="store_true", help="print machine-readable output")
+    dupes.add_argument("--min-size", type=int, default=1, metavar="BYTES", help="ignore files smaller than this")
+    dupes.add_argument("--limit", type=int, default=20, metavar="N", help="groups to list in text output")
+    dupes.set_defaults(func=cmd_duplicates)
+
+    programs = sub.add_parser("programs", help="list installed programs")
+    programs.add_argument("--json", action="store_true", help="print machine-readable output")
+    programs.add_argument("--sizes", action="store_true", help="also compute install sizes")
+    programs.set_defaults(func=cmd_programs)
+
+    tweaks = sub.add_parser("tweaks", help="list, preview, apply or roll back Boost tweaks")
+    tweaks.add_argument("key", nargs="*", help="tweak keys (omit to list the catalog)")
+    tweaks.add_argument("--json", action="store_true", help="print machine-readable output")
+    tweaks.add_argument("--apply", action="store_true", help="write the changes (default is a dry run)")
+    tweaks.add_argument("--revert", action="store_true", help="plan the tweaks' revert values instead")
+    tweaks.add_argument("--rollback", action="store_true", help="restore the values saved by the last --apply")
+    tweaks.set_defaults(func=cmd_tweaks)
+
+    index = sub.add_parser("index", help="inspect or invalidate the scan index", add_help=False)
+    index.add_argument("rest", nargs=argparse.REMAINDER)
+    index.set_defaults(func=cmd_index)
+
+    quarantine = sub.add_parser("quarantine", help="list, restore or purge quarantined files", add_help=False)
+    quarantine.add_argument("rest", nargs=argparse.REMAINDER)
+    quarantine.set_defaults(func=cmd_quarantine)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except ConfigError as e:
+        print(f"turbocleaner.py: invalid targets: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
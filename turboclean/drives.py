@@ -0,0 +1,155 @@
+import os
+
+from turboclean.rules import Rule
+
+# Which physical disk each drive lives on, and the junk folders looked for at
+# the root of every drive the user selects. Drives on one disk share a scan
+# pool; drives on different disks are walked in parallel.
+
+# Temp folders at a drive root are shared with installers and services, so
+# only files nobody has used for a while are taken from them
+ROOT_TEMP_AGE_DAYS = 7
+
+# (name, folder under the drive root, file rules or None to empty it); only
+# the ones that exist are scanned. {sid} is the current user's SID: the other
+# users' recycle bins are not ours to empty.
+DRIVE_JUNK = [
+    ("Recycle Bin", os.path.join("$Recycle.Bin", "{sid}"), None),
+    ("Temp", "Temp", [Rule(older_than_days=ROOT_TEMP_AGE_DAYS)]),
+    ("Tmp", "tmp", [Rule(older_than_days=ROOT_TEMP_AGE_DAYS)]),
+    ("Windows Upgrade Files", "$WINDOWS.~BT", None),
+    ("Windows Upgrade Files", "$Windows.~WS", None),
+]
+
+TOKEN_QUERY = 0x0008
+TOKEN_USER = 1
+
+IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS = 0x00560000
+FILE_SHARE_READ_WRITE = 0x3
+OPEN_EXISTING = 3
+MAX_EXTENTS = 8
+
+
+def _windows_disks(mountpoint):
+    # Disk numbers behind a volume, e.g. (0,) for C:, or None if the volume
+    # cannot be opened (no admin needed: access 0 only queries)
+    import ctypes
+    from ctypes import wintypes
+
+    class DiskExtent(ctypes.Structure):
+        _fields_ = [("disk_number", wintypes.DWORD), ("starting_offset", ctypes.c_longlong),
+                    ("extent_length", ctypes.c_longlong)]
+
+    class VolumeDiskExtents(ctypes.Structure):
+        _fields_ = [("count", wintypes.DWORD), ("extents", DiskExtent * MAX_EXTENTS)]
+
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.CreateFileW.restype = wintypes.HANDLE
+    volume = "\\\\.\\" + os.path.splitdrive(mountpoint)[0]
+    handle = kernel32.CreateFileW(volume, 0, FILE_SHARE_READ_WRITE, None, OPEN_EXISTING, 0, None)
+    if handle in (None, wintypes.HANDLE(-1).value):
+        return None
+    try:
+        out = VolumeDiskExtents()
+        returned = wintypes.DWORD()
+        if not kernel32.DeviceIoControl(wintypes.HANDLE(handle), IOCTL_VOLUME_GET_VOLUME_DISK_EXTENTS, None, 0,
+                                        ctypes.byref(out), ctypes.sizeof(out), ctypes.byref(returned), None):
+            return None
+        return tuple(sorted({out.extents[i].disk_number for i in range(min(out.count, MAX_EXTENTS))}))
+    finally:
+        kernel32.CloseHandle(wintypes.HANDLE(handle))
+
+
+def _linux_disk(mountpoint):
+    # Parent block device of the partition holding mountpoint, e.g. "sda"
+    st = os.stat(mountpoint)
+    sys_path = os.path.realpath(f"/sys/dev/block/{os.major(st.st_dev)}:{os.minor(st.st_dev)}")
+    if not os.path.exists(sys_path):
+        return None
+    if os.path.exists(os.path.join(sys_path, "partition")):
+        sys_path = os.path.dirname(sys_path)
+    return os.path.basename(sys_path)
+
+
+def current_user_sid():
+    # "S-1-5-21-..." of the user running the app, or None if unknown
+    if os.name != "nt":
+        return None
+    import ctypes
+    from ctypes import wintypes
+
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(kernel32.GetCurrentProcess(), TOKEN_QUERY, ctypes.byref(token)):
+        return None
+    try:
+        needed = wintypes.DWORD()
+        advapi32.GetTokenInformation(token, TOKEN_USER, None, 0, ctypes.byref(needed))
+        buf = ctypes.create_string_buffer(needed.value)
+        if not needed.value or not advapi32.GetTokenInformation(token, TOKEN_USER, buf, needed, ctypes.byref(needed)):
+            return None
+        sid = ctypes.c_void_p.from_buffer(buf).value # TOKEN_USER starts with the SID pointer
+        text = wintypes.LPWSTR()
+        if not advapi32.ConvertSidToStringSidW(ctypes.c_void_p(sid), ctypes.byref(text)):
+            return None
+        try:
+            return text.value
+        finally:
+            kernel32.LocalFree(text)
+    finally:
+        kernel32.CloseHandle(token)
+
+
+def junk_folders():
+    # DRIVE_JUNK with the user's SID filled in; the Recycle Bin is left out
+    # when the SID cannot be read rather than emptied for every user
+    try:
+        sid = current_user_sid()
+    except (OSError, AttributeError, ValueError):
+        sid = None
+    for name, folder, rules in DRIVE_JUNK:
+        if "{sid}" in folder:
+            if sid is None:
+                continue
+            folder = folder.format(sid=sid)
+        yield name, folder, rules
+
+
+def junk_rules(path):
+    # File rules of the DRIVE_JUNK folder at path, if it is one that has them
+    parent, folder = os.path.split(os.path.normpath(path))
+    for _, junk, rules in DRIVE_JUNK:
+        if rules and os.path.normcase(folder) == os.path.normcase(junk) and os.path.ismount(parent):
+            return rules
+    return None
+
+
+def physical_device(mountpoint):
+    # Hashable key shared by every drive on the same physical disk. When the
+    # disk cannot be determined the drive is treated as a disk of its own.
+    try:
+        if os.name == "nt":
+            disks = _windows_disks(mountpoint)
+        else:
+            disks = _linux_disk(mountpoint)
+    except (OSError, AttributeError, ValueError):
+        disks = None
+    return ("disk", disks) if disks else ("volume", os.path.normcase(mountpoint))
+
+
+def drive_of(path, mountpoints):
+    # The mountpoint path lives on (longest match), or None
+    path = os.path.normcase(os.path.abspath(path))
+    best = None
+    for mountpoint in mountpoints:
+        prefix = os.path.normcase(mountpoint).rstrip("\\/")
+        if path == prefix or path.startswith(prefix + os.sep):
+            if best is None or len(mountpoint) > len(best):
+                best = mountpoint
+    return best
+
+
+def drive_label(mountpoint):
+    return os.path.splitdrive(mountpoint)[0] or mountpoint
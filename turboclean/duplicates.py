@@ -0,0 +1,319 @@
+import hashlib
+import mmap
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from turboclean.scanner import default_workers, scan_targets
+
+# Bytes hashed from each end of a file in the partial pass. Files no larger
+# than twice this are covered completely, so they never need a full hash.
+PARTIAL_BYTES = 4096
+
+# Files at least this large are hashed through a memory map; smaller ones
+# through large buffered reads
+MMAP_MIN_BYTES = 1024 * 1024
+READ_CHUNK = 1024 * 1024
+
+# Work handed to one process per task; large enough to amortise pickling the
+# paths and results, small enough to keep every process busy
+FULL_BATCH_BYTES = 64 * 1024 * 1024
+
+# Below this much full hashing the process pool costs more than it saves
+POOL_MIN_BYTES = 32 * 1024 * 1024
+
+DIGEST_SIZE = 20
+
+# Partial hashes between progress callbacks
+PROGRESS_EVERY = 1024
+
+
+def _new_hash():
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def partial_hash(path, size):
+    # Digest of the first and last PARTIAL_BYTES of the file (the whole file
+    # when it is small). None if it cannot be read or no longer has that size.
+    h = _new_hash()
+    try:
+        with open(path, "rb") as f:
+            if size <= 2 * PARTIAL_BYTES:
+                data = f.read(size + 1)
+                if len(data) != size:
+                    return None
+                h.update(data)
+            else:
+                h.update(f.read(PARTIAL_BYTES))
+                f.seek(size - PARTIAL_BYTES)
+                tail = f.read(PARTIAL_BYTES + 1)
+                if len(tail) != PARTIAL_BYTES:
+                    return None
+                h.update(tail)
+    except OSError:
+        return None
+    return h.digest()
+
+
+def full_hash(path, size):
+    h = _new_hash()
+    try:
+        with open(path, "rb") as f:
+            if size >= MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                    if len(m) != size:
+                        return None
+                    # hashlib releases the GIL for large buffers
+                    h.update(m)
+            else:
+                buf = bytearray(READ_CHUNK)
+                view = memoryview(buf)
+                read = 0
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    h.update(view[:n])
+                    read += n
+                if read != size:
+                    return None
+    except (OSError, ValueError):
+        return None
+    return h.digest()
+
+
+def _file_id(path):
+    # What identifies the file's data: (st_dev, st_ino) when it has several
+    # names, else the path itself. None if it cannot be read.
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino) if st.st_nlink > 1 else path
+
+
+def _full_hash_batch(batch):
+    # Runs in a worker process: [(path, size)] -> [digest or None]
+    return [full_hash(path, size) for path, size in batch]
+
+
+class DuplicateGroup:
+    __slots__ = ("size", "digest", "paths")
+
+    def __init__(self, size, digest, paths):
+        self.size = size
+        self.digest = digest
+        self.paths = paths
+
+    @property
+    def wasted(self):
+        # Bytes freed by keeping one copy
+        return self.size * (len(self.paths) - 1)
+
+    def as_dict(self):
+        return {"size": self.size, "digest": self.digest.hex(), "wasted": self.wasted, "paths": list(self.paths)}
+
+    def __repr__(self):
+        return f"DuplicateGroup(size={self.size}, copies={len(self.paths)})"
+
+
+class DuplicateReport:
+    # Groups plus how many files each stage had to look at
+    __slots__ = ("groups", "files", "bytes", "size_candidates", "hardlinks", "partial_hashed",
+                 "full_hashed", "full_hashed_bytes", "errors")
+
+    def __init__(self):
+        self.groups = []
+        self.files = 0
+        self.bytes = 0
+        self.size_candidates = 0
+        self.hardlinks = 0 # Candidate names left out as links to a file already kept
+        self.partial_hashed = 0
+        self.full_hashed = 0
+        self.full_hashed_bytes = 0
+        self.errors = 0
+
+    @property
+    def wasted(self):
+        return sum(g.wasted for g in self.groups)
+
+    def as_dict(self):
+        return {
+            "files": self.files,
+            "bytes": self.bytes,
+            "size_candidates": self.size_candidates,
+            "hardlinks": self.hardlinks,
+            "partial_hashed": self.partial_hashed,
+            "full_hashed": self.full_hashed,
+            "full_hashed_bytes": self.full_hashed_bytes,
+            "errors": self.errors,
+            "wasted": self.wasted,
+            "groups": [g.as_dict() for g in self.groups],
+        }
+
+
+def _size_candidates(indexes, min_size):
+    # {size: [path, ...]} for sizes shared by two or more files. Counting runs
+    # over the flat size columns; paths are only built for files that qualify.
+    counts = Counter()
+    for fi in indexes:
+        counts.update(fi.sizes)
+    shared = {size for size, n in counts.items() if n > 1 and size >= min_size}
+    buckets = {}
+    for fi in indexes:
+        if not shared.isdisjoint(fi.sizes):
+            for d, path in enumerate(fi.dir_paths()):
+                start = fi.dir_first[d]
+                names = None
+                for i in range(start, start + fi.dir_count[d]):
+                    size = fi.sizes[i]
+                    if size in shared:
+                        if names is None:
+                            names = fi.dir_file_names(d)
+                        buckets.setdefault(size, []).append(os.path.join(path, names[i - start]))
+    return buckets
+
+
+def _split(groups, hashes):
+    # Flat per-file results back into one list per group
+    out = []
+    pos = 0
+    for _, paths in groups:
+        out.append(hashes[pos:pos + len(paths)])
+        pos += len(paths)
+    return out
+
+
+def _regroup(groups, digests):
+    # Split each (size, paths) group by digest, keeping only repeats
+    out = []
+    for (size, paths), hashes in zip(groups, digests):
+        by_digest = {}
+        for path, digest in zip(paths, hashes):
+            if digest is not None:
+                by_digest.setdefault(digest, []).append(path)
+        out.extend((size, digest, same) for digest, same in by_digest.items() if len(same) > 1)
+    return out
+
+
+class DuplicateFinder:
+    # Three passes, each only over what the previous one could not rule out:
+    #   1. size: files come from a recorded scan, grouped by exact size
+    #   2. partial: hash of the first and last PARTIAL_BYTES, on a thread pool
+    #      (small reads, latency bound)
+    #   3. full: whole-file hash through mmap/large reads on a process pool, so
+    #      hashing is not bound to one core by the GIL
+    # Hard links are not copies: before hashing, each size group keeps one name
+    # per (st_dev, st_ino), so links are neither hashed nor counted as wasted.
+
+    def __init__(self, max_workers=None, processes=None, min_size=1):
+        self.max_workers = max_workers or default_workers()
+        self.processes = processes or os.cpu_count() or 1
+        self.min_size = max(1, min_size)
+
+    def find(self, roots, on_progress=None):
+        # roots: iterable of directories. on_progress(stage, done, total) fires
+        # from the calling thread; stage is "scan", "partial" or "full".
+        report = DuplicateReport()
+        roots = list(roots)
+        if on_progress:
+            on_progress("scan", 0, len(roots))
+        scanned = scan_targets([(root, root) for root in roots], self.max_workers, record=True)
+        indexes = [r.manifest for r in scanned if r.manifest is not None]
+        for r in scanned:
+            report.files += r.files
+            report.bytes += r.size
+            report.errors += r.errors
+        if on_progress:
+            on_progress("scan", len(roots), len(roots))
+
+        buckets = _size_candidates(indexes, self.min_size)
+        groups = list(buckets.items())
+        report.size_candidates = sum(len(paths) for _, paths in groups)
+        groups = self._distinct(groups, report)
+
+        partial = self._partial(groups, report, on_progress)
+        confirmed = [g for g in partial if g[0] <= 2 * PARTIAL_BYTES]
+        pending = [(size, paths) for size, _, paths in partial if size > 2 * PARTIAL_BYTES]
+        confirmed.extend(self._full(pending, report, on_progress))
+
+        report.groups = sorted((DuplicateGroup(size, digest, paths) for size, digest, paths in confirmed),
+                               key=lambda g: g.wasted, reverse=True)
+        return report
+
+    def _distinct(self, groups, report):
+        # Each size group with one name per file, dropping groups left with one
+        files = [path for _, paths in groups for path in paths]
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="turboclean-dupes") as pool:
+            ids = list(pool.map(_file_id, files)) if files else []
+        out = []
+        for (size, paths), group_ids in zip(groups, _split(groups, ids)):
+            seen = set()
+            kept = []
+            for path, file_id in zip(paths, group_ids):
+                if file_id is None:
+                    report.errors += 1
+                elif file_id in seen:
+                    report.hardlinks += 1
+                else:
+                    seen.add(file_id)
+                    kept.append(path)
+            if len(kept) > 1:
+                out.append((size, kept))
+        return out
+
+    def _partial(self, groups, report, on_progress):
+        files = [(path, size) for size, paths in groups for path in paths]
+        hashes = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="turboclean-dupes") as pool:
+            for digest in pool.map(partial_hash, *zip(*files)) if files else ():
+                hashes.append(digest)
+                if on_progress and len(hashes) % PROGRESS_EVERY == 0:
+                    on_progress("partial", len(hashes), len(files))
+        if on_progress:
+            on_progress("partial", len(hashes), len(files))
+        report.partial_hashed = len(files)
+        report.errors += hashes.count(None)
+        return _regroup(groups, _split(groups, hashes))
+
+    def _full(self, groups, report, on_progress):
+        files = [(path, size) for size, paths in groups for path in paths]
+        total_bytes = sum(size for _, size in files)
+        report.full_hashed = len(files)
+        report.full_hashed_bytes = total_bytes
+        if not files:
+            return []
+
+        batches = []
+        batch = []
+        batch_bytes = 0
+        for item in files:
+            batch.append(item)
+            batch_bytes += item[1]
+            if batch_bytes >= FULL_BATCH_BYTES:
+                batches.append(batch)
+                batch = []
+                batch_bytes = 0
+        if batch:
+            batches.append(batch)
+
+        hashes = []
+        if self.processes > 1 and total_bytes >= POOL_MIN_BYTES:
+            # Pulls in multiprocessing, so only imported when it is used
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=min(self.processes, len(batches))) as pool:
+                for part in pool.map(_full_hash_batch, batches):
+                    hashes.extend(part)
+                    if on_progress:
+                        on_progress("full", len(hashes), len(files))
+        else:
+            for part in map(_full_hash_batch, batches):
+                hashes.extend(part)
+                if on_progress:
+                    on_progress("full", len(hashes), len(files))
+        report.errors += hashes.count(None)
+        return _regroup(groups, _split(groups, hashes))
+
+
+def find_duplicates(roots, max_workers=None, processes=None, min_size=1, on_progress=None):
+    return DuplicateFinder(max_workers, processes, min_size).find(roots, on_progress)
@@ -0,0 +1,158 @@
+import os
+
+from turboclean.cleaner import clean_targets
+from turboclean.drives import drive_label, drive_of, junk_folders, junk_rules, physical_device
+from turboclean.issues import issue_session
+from turboclean.quarantine import Journal, quarantine_target, restore, start_background_purge
+from turboclean.rules import Matcher, load_targets
+from turboclean.scanner import scan_targets
+
+# Headless scan/clean logic shared by the GUI and the CLI. Nothing in here may
+# import Tk, customtkinter, PIL or the GUI module: scheduled runs import only this.
+
+
+def default_targets():
+    # (name, path) of every target in targets.json; raises rules.ConfigError
+    return [(spec.name, spec.path) for spec in load_targets()]
+
+
+def default_matchers(targets=()):
+    # Target path -> Matcher for the configured targets that have file rules,
+    # and for the drive junk folders among targets that have them
+    matchers = {}
+    for _, path in targets:
+        rules = junk_rules(path)
+        if rules:
+            matchers[path] = Matcher(rules)
+    matchers.update((spec.path, spec.matcher) for spec in load_targets() if spec.matcher is not None)
+    return matchers
+
+
+def default_caps():
+    # Target path -> bytes to keep, for the configured targets trimmed by cap
+    # (least recently used files first) rather than emptied
+    return {spec.path: spec.cap for spec in load_targets() if spec.cap is not None}
+
+
+def over_cap(size, cap):
+    # Bytes a clean will evict from a target of this size to get under cap
+    return max(0, size - cap)
+
+
+def drive_targets(selected, drives=None):
+    # Targets for a scan of the selected drives: the default targets that live
+    # on one of them (or on no known drive), plus the junk folders at the root
+    # of each. Returns (targets, target_drives), the mountpoint per target.
+    drives = list(selected) if drives is None else list(drives)
+    targets, target_drives, seen = [], [], set()
+
+    def add(name, path, drive):
+        key = os.path.normcase(os.path.abspath(path))
+        if key not in seen:
+            seen.add(key)
+            targets.append((name, path))
+            target_drives.append(drive)
+
+    for name, path in default_targets():
+        drive = drive_of(path, drives)
+        if drive is None or drive in selected:
+            add(name, path, drive)
+    junk = list(junk_folders())
+    for drive in selected:
+        for name, folder, _ in junk:
+            path = os.path.join(drive, folder)
+            if os.path.isdir(path):
+                add(f"{name} ({drive_label(drive)})", path, drive)
+    return targets, target_drives
+
+
+def target_devices(target_drives):
+    # Physical disk per target, for scan(devices=...). Looked up once per drive;
+    # targets on no known drive share one group.
+    found = {}
+    for drive in target_drives:
+        if drive is not None and drive not in found:
+            found[drive] = physical_device(drive)
+    return [found.get(drive) for drive in target_drives]
+
+
+def format_size(size):
+    if size > 1024*1024*1024:
+        return f"{size / (1024*1024*1024):.2f} GB"
+    return f"{size / (1024*1024):.1f} MB"
+
+
+def scan(targets=None, index=None, on_result=None, record=False, stats=False, progress=None, devices=None, matchers=None):
+    # record=True keeps a Manifest per target so clean() can skip re-listing;
+    # stats=True adds a ScanStats (age histogram, largest files) to each result;
+    # progress is a ProgressBus the walk reports to; devices (see
+    # target_devices) walks targets on different disks with separate workers.
+    # matchers (target path -> Matcher) defaults to the configured rules.
+    targets = default_targets() if targets is None else targets
+    return scan_targets(targets, on_result=on_result, index=index,
+                        record=record, stats=stats, progress=progress, devices=devices,
+                        matchers=default_matchers(targets) if matchers is None else matchers)
+
+
+def estimate_work(targets, index=None):
+    # (entries, bytes) per target from the last scan, None where unknown;
+    # feeds ProgressBus.expect so progress follows the work, not the target count
+    if index is None:
+        return [None for _ in targets]
+    return [index.estimate(path) for _, path in targets]
+
+
+def default_duplicate_roots():
+    # The user profile is where copies of documents, downloads and media pile up
+    return [os.environ.get('USERPROFILE') or os.path.expanduser('~')]
+
+
+def duplicates(roots=None, min_size=1, on_progress=None):
+    from turboclean.duplicates import find_duplicates
+    return find_duplicates(default_duplicate_roots() if roots is None else roots, min_size=min_size, on_progress=on_progress)
+
+
+def check_issues(backend=None):
+    # Starts the issue rules in the background and returns the session; its
+    # result() is the IssueReport. Start it before a scan so the two overlap.
+    return issue_session(backend).start()
+
+
+def clean(targets, on_result=None, manifests=None, progress=None, matchers=None, caps=None, quarantine=False, sizes=None):
+    # matchers and caps default to the configured ones, like scan(). With
+    # quarantine, whole-directory targets are moved aside (restorable until the
+    # purge) instead of deleted; sizes (path -> bytes) is recorded with them.
+    hook = None
+    if quarantine:
+        journal = Journal()
+        sizes = sizes or {}
+        hook = lambda name, path: quarantine_target(name, path, journal, sizes.get(path))
+    return clean_targets(targets, on_result=on_result, manifests=manifests, progress=progress,
+                         matchers=default_matchers(targets) if matchers is None else matchers,
+                         caps=default_caps() if caps is None else caps, quarantine=hook)
+
+
+def restore_quarantine(entry_ids=None):
+    # [(entry, moved, failures)] for each quarantined entry moved back
+    return restore(entry_ids)
+
+
+def start_purge():
+    # Deletes quarantine entries that are due, from an idle-priority process
+    return start_background_purge()
+
+
+def clean_target(name, path):
+    return clean([(name, path)])[0]
+
+
+def describe_clean(result):
+    # One line per target for summaries, e.g. "Chrome Cache: 1.2 GB freed, 3201 deleted, 12 skipped (in use: 10)"
+    if result.quarantined:
+        line = f"{result.name}: {result.quarantined} items moved to quarantine, {result.files_skipped} skipped"
+    else:
+        line = f"{result.name}: {format_size(result.bytes_freed)} freed, {result.files_deleted} deleted, {result.files_skipped} skipped"
+    if result.errors:
+        reasons = ", ".join(f"{reason}: {count}" for reason, count in sorted(result.errors.items(), key=lambda kv: -kv[1]))
+        line += f" ({reasons})"
+    return line
@@ -0,0 +1,167 @@
+import heapq
+import os
+import time
+from array import array
+from bisect import bisect_right
+from functools import partial
+from itertools import compress
+
+# Names are kept as UTF-8 in one buffer; surrogatepass lets undecodable
+# filenames (surrogate-escaped on POSIX, lone surrogates on Windows) round-trip
+NAME_ENCODING = ("utf-8", "surrogatepass")
+
+DAY_NS = 86400 * 10**9
+
+# Upper edges, in days, of the age buckets: <7d, 7-30d, 30-90d, 90-365d, >=365d
+AGE_EDGES_DAYS = (7, 30, 90, 365)
+
+
+def _dir_key(path):
+    return path.rstrip(os.sep)
+
+
+class FileIndex:
+    # Columnar per-file store for multi-million-entry scans.
+    #
+    # Directories form an interned table: each row holds its parent's index and
+    # its own name (roots hold their full path), so a path is stored once no
+    # matter how many files live under it. A directory's files are contiguous,
+    # so per-file data is just a few flat arrays plus the name bytes:
+    #
+    #   sizes   array('Q')   mtimes  array('q')   names  one bytearray, each
+    #   directory's names NUL-terminated in file order
+    #
+    # That is about 17 bytes plus the UTF-8 name per file.
+
+    def __init__(self):
+        self.dir_parent = array("i")
+        self.dir_names = []
+        self.dir_first = array("Q")
+        self.dir_count = array("I")
+        self.dir_bytes = array("Q")
+        self.dir_name_off = array("Q")
+        self.sizes = array("Q")
+        self.mtimes = array("q")
+        self.names = bytearray()
+        self._dir_ids = {} # Only needed while directories are being added
+
+    # Building
+
+    def add_dir(self, path, names=(), sizes=(), mtimes=()):
+        # Parents must be added before their children; a directory whose parent
+        # is unknown becomes a root
+        parent = self._dir_ids.get(_dir_key(os.path.dirname(path)), -1)
+        d = len(self.dir_parent)
+        self._dir_ids[_dir_key(path)] = d
+        self.dir_parent.append(parent)
+        self.dir_names.append(path if parent < 0 else os.path.basename(path))
+        self.dir_first.append(len(self.sizes))
+        self.dir_count.append(len(names))
+        self.dir_name_off.append(len(self.names))
+        if names:
+            self.names += "\0".join(names).encode(*NAME_ENCODING)
+            self.names += b"\0"
+            self.sizes.extend(sizes)
+            self.mtimes.extend(mtimes)
+            self.dir_bytes.append(sum(sizes))
+        else:
+            self.dir_bytes.append(0)
+        return d
+
+    def seal(self):
+        # Drop the build-time path lookup once the scan is done
+        self._dir_ids = None
+
+    # Access
+
+    def __len__(self):
+        return len(self.sizes)
+
+    @property
+    def dir_total(self):
+        return len(self.dir_parent)
+
+    def dir_paths(self):
+        # Full path of every directory, in table order (parents first)
+        paths = []
+        for parent, name in zip(self.dir_parent, self.dir_names):
+            paths.append(name if parent < 0 else os.path.join(paths[parent], name))
+        return paths
+
+    def dir_path(self, d):
+        parts = []
+        while d >= 0:
+            parts.append(self.dir_names[d])
+            d = self.dir_parent[d]
+        return os.path.join(*reversed(parts))
+
+    def dir_file_names(self, d):
+        start = self.dir_name_off[d]
+        end = self.dir_name_off[d + 1] if d + 1 < len(self.dir_name_off) else len(self.names)
+        if start == end:
+            return []
+        return self.names[start:end - 1].decode(*NAME_ENCODING).split("\0")
+
+    def dir_files(self, d):
+        # (name, size, mtime_ns) for each file directly in directory d
+        start = self.dir_first[d]
+        end = start + self.dir_count[d]
+        return list(zip(self.dir_file_names(d), self.sizes[start:end], self.mtimes[start:end]))
+
+    def file_dir(self, i):
+        # Last directory whose first file is at or before i; empty directories
+        # share their successor's offset, so this lands on the owning one
+        return bisect_right(self.dir_first, i) - 1
+
+    def file_path(self, i):
+        d = self.file_dir(i)
+        return os.path.join(self.dir_path(d), self.dir_file_names(d)[i - self.dir_first[d]])
+
+    # Aggregates
+
+    def total_size(self):
+        return sum(self.dir_bytes)
+
+    def roots(self):
+        # Root directory of every directory, by index
+        root = array("i")
+        for d, parent in enumerate(self.dir_parent):
+            root.append(d if parent < 0 else root[parent])
+        return root
+
+    def totals_by_root(self):
+        # {root path: (files, bytes)}; one entry per scanned target
+        totals = {}
+        for d, r in enumerate(self.roots()):
+            files, size = totals.get(r, (0, 0))
+            totals[r] = (files + self.dir_count[d], size + self.dir_bytes[d])
+        return {self.dir_names[r]: t for r, t in totals.items()}
+
+    def age_buckets(self, now_ns=None, edges_days=AGE_EDGES_DAYS, times=None):
+        # One byte per file: how many cutoffs it is newer than, so the oldest
+        # bucket is 0 and the youngest is len(edges_days)
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        cutoffs = sorted(now_ns - days * DAY_NS for days in edges_days)
+        return bytes(map(partial(bisect_right, cutoffs), self.mtimes if times is None else times))
+
+    def age_histogram(self, now_ns=None, edges_days=AGE_EDGES_DAYS, times=None):
+        # [(files, bytes)] per age bucket, youngest first. One bucketing pass
+        # over the timestamps; per-bucket counts and byte sums then run in C.
+        buckets = self.age_buckets(now_ns, edges_days, times)
+        histogram = []
+        for b in range(len(edges_days), -1, -1):
+            mask = buckets.translate(bytes(i == b for i in range(256)))
+            histogram.append((buckets.count(b), sum(compress(self.sizes, mask))))
+        return histogram
+
+    def top_n(self, n):
+        # [(size, path)] for the n largest files, biggest first
+        largest = heapq.nlargest(n, zip(self.sizes, range(len(self.sizes))))
+        return [(size, self.file_path(i)) for size, i in largest]
+
+    def nbytes(self):
+        # Approximate heap footprint of the columns and directory table
+        columns = (self.dir_parent, self.dir_first, self.dir_count, self.dir_bytes,
+                   self.dir_name_off, self.sizes, self.mtimes)
+        return (sum(a.itemsize * len(a) for a in columns) + len(self.names)
+                + sum(len(n) for n in self.dir_names))
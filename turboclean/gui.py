@@ -0,0 +1,1325 @@
+import customtkinter as ctk
+import queue
+import threading
+from datetime import datetime
+from tkinter import messagebox
+
+from turboclean import engine, registry
+from turboclean.assets import AssetStore
+from turboclean.index import ScanIndex
+from turboclean.programs import ProgramInventory, ProgramSizer
+from turboclean.progress import RENDER_MS, ProgressBus, format_eta
+from turboclean.quarantine import PURGE_AFTER_HOURS
+from turboclean.rules import ConfigError
+from turboclean.tweaks import TweakEngine, clear_snapshot, load_snapshot, save_snapshot
+from turboclean.vlist import ListModel, VirtualList
+
+# Configuration
+ctk.set_appearance_mode("Light")
+ctk.set_default_color_theme("blue")  
+# Constants
+BRAND_COLOR = "#FF2E38"
+BG_COLOR = "#F4F5F7"
+SIDEBAR_COLOR = "#FFFFFF"
+TEXT_COLOR = "#333333"
+CARD_COLOR = "#FFFFFF"
+
+# Duplicate groups shown in ScanFrame, largest waste first
+DUPLICATE_ROWS = 50
+
+# Quarantine entries due for deletion are purged this long after start-up,
+# once the window is up and settled
+PURGE_DELAY_MS = 30000
+
+class TurboCleanApp(ctk.CTk):
+    def __init__(self):
+        super().__init__()
+
+        self.title("TurboClean")
+        self.geometry("1100x700")
+        self.configure(fg_color=BG_COLOR)
+        
+        # Images load in the background (emojis are used as fallback)
+        self.assets = AssetStore()
+        self.image_cache = {} # (key, size) -> CTkImage, filled in once decoded; None if it failed
+        self.image_fallbacks = {} # (key, size) -> on_failed callbacks while the decode is pending
+        self.polling_assets = False
+        
+        # Data
+        self.scan_results = {"junk": 0, "old": 0, "issues": 0, "size": 0}
+        self.clean_targets = []
+        self.programs_list = []
+
+        # Layout
+        self.grid_columnconfigure(1, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self.setup_sidebar()
+        self.setup_frames()
+        
+        # Start on Scan page
+        self.show_frame("scan")
+        # Finding due entries lists every target's quarantine folder, so it runs
+        # on a worker like every other filesystem call, never on the Tk loop
+        self.after(PURGE_DELAY_MS, lambda: threading.Thread(target=engine.start_purge, daemon=True).start())
+
+    def get_image(self, key, size, on_failed=None):
+        # None if the asset does not exist or failed to decode. Otherwise a
+        # CTkImage that starts transparent and is filled in when the background
+        # decode finishes; if that fails, on_failed() runs so the widget can
+        # switch to its emoji or text fallback.
+        cache_key = (key, size)
+        if cache_key in self.image_cache:
+            if on_failed is not None and cache_key in self.image_fallbacks:
+                self.image_fallbacks[cache_key].append(on_failed)
+            return self.image_cache[cache_key]
+        if self.assets.path(key) is None:
+            return None
+
+        from PIL import Image
+        blank = Image.new("RGBA", (1, 1), (0, 0, 0, 0))
+        image = ctk.CTkImage(light_image=blank, dark_image=blank, size=size)
+
+        def loaded(pil_image):
+            self.image_fallbacks.pop(cache_key, None)
+            image.configure(light_image=pil_image, dark_image=pil_image)
+
+        self.image_fallbacks[cache_key] = [on_failed] if on_failed is not None else []
+        if not self.assets.load(key, size, loaded, lambda: self.image_failed(cache_key)):
+            self.image_fallbacks.pop(cache_key, None)
+            self.image_cache[cache_key] = None
+            return None
+        self.image_cache[cache_key] = image
+        if not self.polling_assets:
+            self.polling_assets = True
+            self.after(20, self.poll_assets)
+        return image
+
+    def image_failed(self, cache_key):
+        self.image_cache[cache_key] = None
+        for on_failed in self.image_fallbacks.pop(cache_key, []):
+            on_failed()
+
+    def poll_assets(self):
+        self.assets.deliver()
+        if self.assets.pending():
+            self.after(20, self.poll_assets)
+        else:
+            self.polling_assets = False
+
+    def setup_sidebar(self):
+        self.sidebar = ctk.CTkFrame(self, width=200, corner_radius=0, fg_color=SIDEBAR_COLOR)
+        self.sidebar.grid(row=0, column=0, sticky="nsew")
+        self.sidebar.grid_rowconfigure(6, weight=1)
+
+        # Logo
+        logo_img = self.get_image("logo", (30, 30), lambda: self.logo_label.configure(image=None, text="⚡ TurboClean"))
+        if logo_img:
+            self.logo_label = ctk.CTkLabel(self.sidebar, text=" TurboClean", image=logo_img, compound="left", font=("Segoe UI", 20, "bold"), text_color=TEXT_COLOR)
+            self.logo_image = logo_img
+        else:
+            self.logo_label = ctk.CTkLabel(self.sidebar, text="⚡ TurboClean", font=("Segoe UI", 20, "bold"), text_color=TEXT_COLOR)
+            
+        self.logo_label.grid(row=0, column=0, padx=20, pady=(20, 40), sticky="w")
+
+        # Navigation Buttons
+        self.nav_buttons = {}
+        buttons = [
+            ("Scan", "scan_shield", "scan", "🔍"), # Updated icon_key and added fallback emoji
+            ("Clean", "clean_sparkle", "clean", "✨"),
+            ("Boost", "logo", "boost", "⚡"), 
+            ("Programs", "program_box", "programs", "📦") # Added fallback emoji
+        ]
+
+        for i, (text, icon_key, name, fallback_emoji) in enumerate(buttons):
+            image = self.get_image(icon_key, (20, 20), # Smaller size for sidebar icons
+                                   lambda n=name, t=f"  {fallback_emoji}  {text}": self.nav_buttons[n].configure(image=None, text=t))
+            
+            # Use image if available, otherwise use emoji and set compound to "left"
+            if image:
+                button_text = f"  {text}"
+                compound_type = "left"
+            else:
+                button_text = f"  {fallback_emoji}  {text}"
+                compound_type = "left"
+
+            btn = ctk.CTkButton(
+                self.sidebar, 
+                text=button_text,
+                anchor="w",
+                fg_color="transparent", 
+                text_color=TEXT_COLOR,
+                hover_color="#F0F0F0",
+                font=("Segoe UI", 14),
+                height=40,
+                image=image,
+                compound=compound_type, 
+                command=lambda n=name: self.show_frame(n)
+            )
+            btn.grid(row=i+1, column=0, padx=10, pady=5, sticky="ew")
+            self.nav_buttons[name] = btn
+
+        # Version
+        self.version_label = ctk.CTkLabel(self.sidebar, text="Version 2.0.1", text_color="gray", font=("Segoe UI", 10))
+        self.version_label.grid(row=6, column=0, padx=20, pady=20, sticky="w")
+
+    def setup_frames(self):
+        # Frames are built the first time they are needed, and their
+        # background work (disk info, registry scan) starts on first show
+        self.frame_types = {"scan": ScanFrame, "clean": CleanFrame, "boost": BoostFrame, "programs": ProgramsFrame}
+        self.frames = {}
+        self.shown = set()
+        self.suggested_tweaks = set() # Boost options ticked by the last scan's issues
+
+    def suggest_tweaks(self, keys):
+        self.suggested_tweaks = set(keys)
+        if "boost" in self.frames:
+            self.frames["boost"].select_tweaks(keys)
+
+    def get_frame(self, name):
+        frame = self.frames.get(name)
+        if frame is None:
+            frame = self.frames[name] = self.frame_types[name](self)
+        return frame
+
+    def show_frame(self, name):
+        frame = self.get_frame(name)
+
+        # Hide all
+        for other in self.frames.values():
+            other.grid_remove()
+        
+        # Show selected
+        frame.grid(row=0, column=1, sticky="nsew", padx=20, pady=20)
+        if name not in self.shown:
+            self.shown.add(name)
+            start = getattr(frame, "on_first_show", None)
+            if start is not None:
+                self.after_idle(start) # After the frame's first paint
+        
+        # Update sidebar button styles
+        for btn_name, btn in self.nav_buttons.items():
+            if btn_name == name:
+                btn.configure(fg_color="#FFE5E5", text_color=BRAND_COLOR)
+            else:
+                btn.configure(fg_color="transparent", text_color=TEXT_COLOR)
+
+class ScanFrame(ctk.CTkFrame):
+    def __init__(self, master):
+        super().__init__(master, fg_color="transparent")
+        
+        # Header
+        self.title = ctk.CTkLabel(self, text="System Scan", font=("Segoe UI", 24, "bold"), text_color=TEXT_COLOR)
+        self.title.pack(anchor="w", pady=(0, 5))
+        
+        self.subtitle = ctk.CTkLabel(self, text="Analyzing your system for optimization opportunities", font=("Segoe UI", 12), text_color="gray")
+        self.subtitle.pack(anchor="w", pady=(0, 20))
+
+        # Status Card
+        self.status_card = ctk.CTkFrame(self, fg_color=CARD_COLOR, corner_radius=10)
+        self.status_card.pack(fill="x", pady=(0, 20), ipady=10)
+        
+        shield_img = self.master.get_image("scan_shield", (30, 30),
+                                           lambda: self.status_icon.configure(image=None, text="🛡️", font=("Segoe UI", 30)))
+        if shield_img:
+            self.status_icon = ctk.CTkLabel(self.status_card, text="", image=shield_img)
+        else:
+            self.status_icon = ctk.CTkLabel(self.status_card, text="🛡️", font=("Segoe UI", 30))
+        self.status_icon.pack(side="left", padx=20)
+        
+        self.status_text_frame = ctk.CTkFrame(self.status_card, fg_color="transparent")
+        self.status_text_frame.pack(side="left", fill="y")
+        
+        self.status_label = ctk.CTkLabel(self.status_text_frame, text="Ready to Scan", font=("Segoe UI", 16, "bold"), text_color=TEXT_COLOR)
+        self.status_label.pack(anchor="w")
+        self.status_sub = ctk.CTkLabel(self.status_text_frame, text="Ready to scan", font=("Segoe UI", 12), text_color="gray")
+        self.status_sub.pack(anchor="w")
+
+        self.progress_label = ctk.CTkLabel(self.status_card, text="0%", font=("Segoe UI", 24, "bold"), text_color=BRAND_COLOR)
+        self.progress_label.pack(side="right", padx=30)
+
+        # Progress Bar
+        self.progressbar = ctk.CTkProgressBar(self.status_card, progress_color=BRAND_COLOR, height=10)
+        self.progressbar.set(0)
+        self.progressbar.pack(side="bottom", fill="x", padx=20, pady=15)
+
+        # Info Cards Grid
+        self.grid_frame = ctk.CTkFrame(self.status_card, fg_color="transparent")
+        self.grid_frame.pack(fill="x", padx=20, pady=10)
+        
+        self.create_info_card(self.grid_frame, 0, "Junk Files", "junk_val")
+        self.create_info_card(self.grid_frame, 1, "Old Files", "old_val")
+        self.create_info_card(self.grid_frame, 2, "Issues Found", "issues_val")
+
+        # Action Buttons
+        self.btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.btn_frame.pack(fill="x", pady=10)
+        
+        self.scan_btn = ctk.CTkButton(self.btn_frame, text="Scan Now", fg_color=BRAND_COLOR, hover_color="#D92630", height=50, font=("Segoe UI", 16, "bold"), command=self.start_scan)
+        self.scan_btn.pack(side="left", fill="x", expand=True, padx=(0, 10))
+
+        self.dupes_btn = ctk.CTkButton(self.btn_frame, text="Find Duplicates", fg_color=CARD_COLOR, hover_color="#FFE5E5", text_color=BRAND_COLOR, border_color=BRAND_COLOR, border_width=2, height=50, font=("Segoe UI", 16, "bold"), command=self.start_duplicates)
+        self.dupes_btn.pack(side="left", fill="x", expand=True)
+
+        # Duplicate groups, filled by the Duplicates scan mode
+        self.dupes_frame = ctk.CTkScrollableFrame(self, fg_color=CARD_COLOR, corner_radius=10, height=200)
+        
+        # Disk Info Section
+        self.disk_frame = ctk.CTkFrame(self, fg_color="transparent")
+        self.disk_frame.pack(fill="x", pady=20)
+        
+        ctk.CTkLabel(self.disk_frame, text="Disk Information", font=("Segoe UI", 14, "bold"), text_color=TEXT_COLOR).pack(anchor="w", pady=(0, 10))
+        
+        self.scan_index = ScanIndex() # Reuses per-directory totals from earlier scans
+        self.scan_queue = queue.Queue() # Worker -> UI results, drained by poll_scan_queue
+        self.scan_items = []
+        self.total_junk_size = 0
+        self.scan_progress = None # ProgressBus of the running scan
+        self.scan_error = None # Message of an exception that ended the running scan early
+        self.drive_checkboxes = [] # To hold checkbox variables and drive info
+        self.drive_junk_labels = {} # mountpoint -> label showing that drive's junk
+        self.drive_junk = {} # mountpoint -> junk bytes found on it this scan
+        self.target_drives = {} # target path -> mountpoint it was scanned on
+        self.caps = {} # target path -> bytes a clean keeps (browser caches)
+
+    def on_first_show(self):
+        self.load_disk_info()
+
+    def load_disk_info(self):
+        # Clear previous entries
+        for widget in self.disk_frame.winfo_children():
+            if isinstance(widget, ctk.CTkFrame) and "drive_card" in widget.winfo_name(): # Only clear drive cards
+                widget.destroy()
+        self.drive_checkboxes = []
+        self.drive_junk_labels = {}
+
+        # psutil can stall on sleeping or network-backed drives; query off the UI thread
+        disk_queue = queue.Queue()
+        threading.Thread(target=self.read_disks, args=(disk_queue,), daemon=True).start()
+        self.after(50, self.poll_disks, disk_queue)
+
+    def read_disks(self, disk_queue):
+        disks = []
+        try:
+            import psutil
+            for p in psutil.disk_partitions():
+                if 'fixed' in p.opts:
+                    try:
+                        disks.append((p, psutil.disk_usage(p.mountpoint)))
+                    except Exception:
+                        pass
+        except Exception:
+            pass
+        disk_queue.put(disks)
+
+    def poll_disks(self, disk_queue):
+        try:
+            disks = disk_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self.poll_disks, disk_queue)
+            return
+
+        for p, usage in disks:
+            try:
+                card = ctk.CTkFrame(self.disk_frame, fg_color=CARD_COLOR, corner_radius=8, name="drive_card")
+                card.pack(fill="x", pady=5)
+                
+                # Checkbox for selection
+                var = ctk.BooleanVar(value=True) # Default to selected
+                cb = ctk.CTkCheckBox(card, text="", variable=var, width=24, checkbox_width=20, checkbox_height=20, border_color=BRAND_COLOR, fg_color=BRAND_COLOR)
+                cb.pack(side="left", padx=(15, 5), pady=15)
+                self.drive_checkboxes.append((var, p.mountpoint))
+                
+                icon = ctk.CTkLabel(card, text="💾", font=("Segoe UI", 20))
+                disk_img = self.master.get_image("disk", (20, 20), lambda label=icon: label.configure(image=None, text="💾"))
+                if disk_img:
+                    icon.configure(text="", image=disk_img)
+                icon.pack(side="left", padx=15, pady=15)
+                
+                info = ctk.CTkFrame(card, fg_color="transparent")
+                info.pack(side="left", fill="x", expand=True)
+                
+                ctk.CTkLabel(info, text=f"Local Disk ({p.device})", font=("Segoe UI", 12, "bold"), text_color=TEXT_COLOR).pack(anchor="w")
+                
+                # Progress bar for disk usage
+                percent = usage.percent
+                bar = ctk.CTkProgressBar(info, height=6, width=200, progress_color=BRAND_COLOR if percent < 90 else "#FF0000")
+                bar.set(percent / 100)
+                bar.pack(anchor="w", pady=5)
+                
+                free_gb = usage.free / (1024**3)
+                total_gb = usage.total / (1024**3)
+                ctk.CTkLabel(info, text=f"{free_gb:.1f} GB free of {total_gb:.1f} GB", font=("Segoe UI", 10), text_color="gray").pack(anchor="w")
+                junk = ctk.CTkLabel(info, text="", font=("Segoe UI", 10, "bold"), text_color=BRAND_COLOR)
+                junk.pack(anchor="w")
+                self.drive_junk_labels[p.mountpoint] = junk
+                
+            except Exception:
+                pass
+
+    def create_info_card(self, parent, col, title, attr_name):
+        frame = ctk.CTkFrame(parent, fg_color="#F8F9FA", corner_radius=8)
+        frame.grid(row=0, column=col, sticky="ew", padx=5, pady=5)
+        parent.grid_columnconfigure(col, weight=1)
+        
+        ctk.CTkLabel(frame, text=f"📂 {title}", font=("Segoe UI", 12), text_color="gray").pack(anchor="w", padx=10, pady=(10, 5))
+        lbl = ctk.CTkLabel(frame, text="-", font=("Segoe UI", 16, "bold"), text_color=TEXT_COLOR)
+        lbl.pack(anchor="w", padx=10, pady=(0, 10))
+        setattr(self, attr_name, lbl)
+
+    def start_scan(self):
+        # Every checked drive is scanned; before the drive list has loaded, or
+        # with nothing checked, fall back to the configured locations
+        drives = [mountpoint for _, mountpoint in self.drive_checkboxes]
+        selected = [mountpoint for var, mountpoint in self.drive_checkboxes if var.get()]
+        try:
+            if selected:
+                targets, target_drives = engine.drive_targets(selected, drives)
+            else:
+                targets = engine.default_targets()
+                target_drives = [None] * len(targets)
+            self.caps = engine.default_caps()
+        except ConfigError as e:
+            messagebox.showerror("Invalid Scan Targets", str(e))
+            return
+
+        self.scan_btn.configure(state="disabled", text="Scanning...")
+        self.dupes_btn.configure(state="disabled")
+        self.status_label.configure(text="Scanning System...")
+        self.status_sub.configure(text="Results appear as each location finishes")
+        self.progressbar.set(0)
+        self.progress_label.configure(text="0%")
+        self.junk_val.configure(text="-")
+        self.old_val.configure(text="-")
+        self.issues_val.configure(text="-")
+
+        self.target_drives = {path: drive for (_, path), drive in zip(targets, target_drives)}
+        self.drive_junk = {}
+        for label in self.drive_junk_labels.values():
+            label.configure(text="")
+        self.scan_items = []
+        self.total_junk_size = 0
+        self.old_files = 0
+        self.old_size = 0
+        self.scan_progress = ProgressBus()
+        self.scan_error = None
+        self.master.get_frame("clean").clear_items()
+
+        threading.Thread(target=self.run_scan, args=(targets, target_drives, self.scan_progress), daemon=True).start()
+        self.after(RENDER_MS, self.poll_scan_queue)
+
+    def start_duplicates(self):
+        self.scan_btn.configure(state="disabled")
+        self.dupes_btn.configure(state="disabled", text="Searching...")
+        self.status_label.configure(text="Finding Duplicates...")
+        self.status_sub.configure(text="Listing files")
+        self.progressbar.set(0)
+        self.progress_label.configure(text="0%")
+        for widget in self.dupes_frame.winfo_children():
+            widget.destroy()
+        self.dupes_frame.pack_forget()
+
+        threading.Thread(target=self.run_duplicates, daemon=True).start()
+        self.after(50, self.poll_scan_queue)
+
+    def run_duplicates(self):
+        def progress(stage, done, total):
+            self.scan_queue.put(("dupes_progress", (stage, done, total)))
+        try:
+            report = engine.duplicates(on_progress=progress)
+        except Exception:
+            report = None
+        self.scan_queue.put(("dupes_done", report))
+
+    def show_duplicates_progress(self, stage, done, total):
+        # Listing is the first third of the bar, partial hashing the second, full hashing the last
+        texts = {"scan": "Listing files", "partial": "Comparing file starts and ends", "full": "Comparing full contents"}
+        offset = {"scan": 0, "partial": 1, "full": 2}[stage]
+        progress = (offset + (done / total if total else 1)) / 3
+        self.status_sub.configure(text=f"{texts[stage]} ({done}/{total})" if stage != "scan" else texts[stage])
+        self.progressbar.set(progress)
+        self.progress_label.configure(text=f"{int(progress * 100)}%")
+
+    def finish_duplicates(self, report):
+        self.scan_btn.configure(state="normal")
+        self.dupes_btn.configure(state="normal", text="Find Duplicates")
+        self.progressbar.set(1.0)
+        self.progress_label.configure(text="100%")
+        if report is None:
+            self.status_label.configure(text="Duplicate Search Failed")
+            self.status_sub.configure(text="")
+            return
+
+        self.status_label.configure(text="Duplicate Search Complete")
+        self.status_sub.configure(text=f"{len(report.groups)} groups, {engine.format_size(report.wasted)} reclaimable")
+        self.dupes_frame.pack(fill="x", pady=(0, 10), after=self.btn_frame)
+        for group in report.groups[:DUPLICATE_ROWS]:
+            row = ctk.CTkFrame(self.dupes_frame, fg_color="transparent")
+            row.pack(fill="x", padx=10, pady=4)
+            ctk.CTkLabel(row, text=f"{len(group.paths)} x {engine.format_size(group.size)}", font=("Segoe UI", 12, "bold"), text_color=TEXT_COLOR).pack(anchor="w")
+            for path in group.paths:
+                ctk.CTkLabel(row, text=path, font=("Segoe UI", 10), text_color="gray").pack(anchor="w")
+            ctk.CTkLabel(row, text=f"{engine.format_size(group.wasted)} reclaimable", font=("Segoe UI", 10), text_color=BRAND_COLOR).pack(anchor="w")
+
+    def poll_scan_queue(self):
+        # Runs on the Tk main loop; the scan worker only ever touches the queue
+        try:
+            while True:
+                kind, payload = self.scan_queue.get_nowait()
+                if kind == "result":
+                    self.add_scan_result(payload)
+                elif kind == "error":
+                    self.scan_error = payload
+                elif kind == "done":
+                    self.finish_scan(payload)
+                    return
+                elif kind == "dupes_progress":
+                    self.show_duplicates_progress(*payload)
+                elif kind == "dupes_done":
+                    self.finish_duplicates(payload)
+                    return
+        except queue.Empty:
+            pass
+        if self.scan_progress is not None:
+            self.show_scan_progress(self.scan_progress.snapshot())
+        self.after(RENDER_MS, self.poll_scan_queue)
+
+    def show_scan_progress(self, snap):
+        # Once per frame, however many updates the workers posted since the last one
+        progress = snap.fraction
+        self.progressbar.set(progress)
+        self.progress_label.configure(text=f"{int(progress * 100)}%")
+        eta = format_eta(snap.eta)
+        self.status_sub.configure(text=f"{snap.current or 'Starting'} • {snap.entries:,} items, {engine.format_size(snap.bytes)}"
+                                       + (f" • {eta}" if eta else ""))
+
+    def add_scan_result(self, result):
+        if result.stats is not None:
+            old_files, old_size = result.stats.old()
+            self.old_files += old_files
+            self.old_size += old_size
+
+        # A capped target only loses what is over its cap
+        cap = self.caps.get(result.path)
+        size = result.size if cap is None else engine.over_cap(result.size, cap)
+        if size <= 0:
+            return
+        size_str = f"{size / (1024*1024):.1f} MB"
+        if size > 1024*1024*1024:
+            size_str = f"{size / (1024*1024*1024):.2f} GB"
+        if cap is not None:
+            size_str += " will be evicted to reach cap"
+
+        self.scan_items.append((result.name, result.path, size_str, size))
+        self.total_junk_size += size
+
+        total_str = f"{self.total_junk_size / (1024*1024):.1f} MB"
+        if self.total_junk_size > 1024*1024*1024:
+            total_str = f"{self.total_junk_size / (1024*1024*1024):.2f} GB"
+        self.junk_val.configure(text=total_str)
+        self.old_val.configure(text=self.old_files_text())
+
+        clean = self.master.get_frame("clean")
+        clean.add_item(result.name, result.path, size_str, size, result.manifest, result.files)
+        clean.update_selection()
+
+        # Drives are walked in parallel; results merge into their drive's card as they land
+        drive = self.target_drives.get(result.path)
+        if drive is not None:
+            self.drive_junk[drive] = self.drive_junk.get(drive, 0) + size
+            label = self.drive_junk_labels.get(drive)
+            if label is not None:
+                label.configure(text=f"{engine.format_size(self.drive_junk[drive])} junk found")
+
+    def old_files_text(self):
+        # Files not used for OLD_AFTER_DAYS, summed over every scanned location
+        return f"{self.old_files} ({engine.format_size(self.old_size)})"
+
+    def run_scan(self, targets, target_drives, progress):
+        # Issue rules run alongside the walk; each target is posted as soon as
+        # its walk finishes (targets run in parallel, each disk with its own
+        # workers), counters go to the bus
+        issues = engine.check_issues()
+        try:
+            devices = engine.target_devices(target_drives)
+            # Weight each target by what it held last time, so the bar tracks the work
+            progress.expect(engine.estimate_work(targets, self.scan_index))
+            engine.scan(targets, on_result=lambda result: self.scan_queue.put(("result", result)), index=self.scan_index, record=True, stats=True,
+                        progress=progress, devices=devices)
+        except Exception as e:
+            # Whatever finished has already been posted; still report issues
+            # and finish, but say the totals are partial
+            self.scan_queue.put(("error", str(e) or type(e).__name__))
+
+        # Pass results to main thread
+        self.scan_queue.put(("done", issues.result()))
+
+    def finish_scan(self, issues):
+        self.scan_progress = None
+        self.scan_btn.configure(state="normal", text="Scan Again")
+        self.dupes_btn.configure(state="normal")
+        if self.scan_error is None:
+            self.status_label.configure(text="Scan Complete")
+            self.status_sub.configure(text="Review results in Clean tab")
+        else:
+            self.status_label.configure(text="Scan Failed")
+            self.status_sub.configure(text=f"Results are partial: {self.scan_error}")
+        self.progressbar.set(1.0)
+        self.progress_label.configure(text="100%")
+        
+        # Format size
+        total_size = self.total_junk_size
+        size_str = f"{total_size / (1024*1024):.1f} MB"
+        if total_size > 1024*1024*1024:
+            size_str = f"{total_size / (1024*1024*1024):.2f} GB"
+            
+        self.junk_val.configure(text=size_str)
+        self.old_val.configure(text=self.old_files_text())
+        self.issues_val.configure(text=f"{len(issues)} Issues")
+        # Each issue maps to the Boost tweak that fixes it; have those ticked
+        self.master.suggest_tweaks([f.fix for f in issues.findings if f.fix])
+        
+        # Items were streamed into the Clean tab; show its empty state if none came
+        if not self.scan_items:
+            self.master.get_frame("clean").set_items([])
+        
+        # Switch to Clean Tab, unless the error above still needs reading
+        if self.scan_error is None:
+            self.master.show_frame("clean")
+
+
+class CleanRow:
+    # One recycled row of the Clean list
+    def __init__(self, parent, items):
+        self.items = items
+        self.index = -1
+        self.frame = ctk.CTkFrame(parent, fg_color=CARD_COLOR, corner_radius=8, height=64)
+        self.frame.pack_propagate(False)
+
+        self.var = ctk.BooleanVar()
+        ctk.CTkCheckBox(self.frame, text="", variable=self.var, width=24, checkbox_width=24, checkbox_height=24, border_color=BRAND_COLOR, fg_color=BRAND_COLOR, command=self.toggled).pack(side="left", padx=15, pady=15)
+        ctk.CTkLabel(self.frame, text="🗑️", font=("Segoe UI", 20)).pack(side="left", padx=10)
+
+        info = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info.pack(side="left", fill="x", expand=True)
+        self.name_lbl = ctk.CTkLabel(info, text="", font=("Segoe UI", 14, "bold"), text_color=TEXT_COLOR)
+        self.name_lbl.pack(anchor="w")
+        self.path_lbl = ctk.CTkLabel(info, text="", font=("Segoe UI", 10), text_color="gray")
+        self.path_lbl.pack(anchor="w")
+
+        self.size_lbl = ctk.CTkLabel(self.frame, text="", font=("Segoe UI", 14, "bold"), text_color=BRAND_COLOR)
+        self.size_lbl.pack(side="right", padx=20)
+
+    def show(self, index, row, checked):
+        name, path, size_str, _ = row
+        self.index = index
+        self.var.set(checked)
+        self.name_lbl.configure(text=name)
+        self.path_lbl.configure(text=path[:50] + "..." if len(path) > 50 else path)
+        self.size_lbl.configure(text=size_str)
+
+    def toggled(self):
+        self.items.set_checked(self.index, self.var.get())
+
+
+class CleanFrame(ctk.CTkFrame):
+    def __init__(self, master):
+        super().__init__(master, fg_color="transparent")
+        
+        self.title = ctk.CTkLabel(self, text="Clean Files", font=("Segoe UI", 24, "bold"), text_color=TEXT_COLOR)
+        self.title.pack(anchor="w", pady=(0, 5))
+        
+        self.subtitle = ctk.CTkLabel(self, text="Select directories to clean and free up space", font=("Segoe UI", 12), text_color="gray")
+        self.subtitle.pack(anchor="w", pady=(0, 20))
+
+        # Header Card
+        self.header = ctk.CTkFrame(self, fg_color=CARD_COLOR, corner_radius=10)
+        self.header.pack(fill="x", pady=(0, 20), ipady=10)
+        
+        ctk.CTkLabel(self.header, text="✨", font=("Segoe UI", 24)).pack(side="left", padx=20)
+        
+        info = ctk.CTkFrame(self.header, fg_color="transparent")
+        info.pack(side="left")
+        ctk.CTkLabel(info, text="Ready to Clean", font=("Segoe UI", 14, "bold"), text_color=TEXT_COLOR).pack(anchor="w")
+        self.selected_label = ctk.CTkLabel(info, text="0 directories selected", font=("Segoe UI", 12), text_color="gray")
+        self.selected_label.pack(anchor="w")
+        
+        self.total_size_label = ctk.CTkLabel(self.header, text="0 MB", font=("Segoe UI", 20, "bold"), text_color=BRAND_COLOR)
+        self.total_size_label.pack(side="right", padx=20)
+
+        # List
+        self.items = VirtualList(self, ListModel(), lambda parent: CleanRow(parent, self.items), row_height=64,
+                                 empty_text="No junk files found. Run a scan first!", on_change=self.update_selection)
+        self.items.pack(fill="both", expand=True, pady=(0, 20))
+
+        self.manifests = {} # Target path -> Manifest recorded by the scan
+        self.expected = {} # Target path -> (files, bytes) the scan found, to weight clean progress
+        
+        # Initial empty state or default
+        self.set_items([])
+
+        # Quarantine moves the files aside instead; they can be restored until purged
+        options = ctk.CTkFrame(self, fg_color="transparent")
+        options.pack(fill="x", pady=(0, 10))
+        self.quarantine_var = ctk.BooleanVar(value=False)
+        ctk.CTkCheckBox(options, text=f"Quarantine instead of deleting (restorable for {PURGE_AFTER_HOURS} h)", variable=self.quarantine_var,
+                        font=("Segoe UI", 12), text_color=TEXT_COLOR, border_color=BRAND_COLOR, fg_color=BRAND_COLOR).pack(side="left")
+        self.restore_btn = ctk.CTkButton(options, text="Restore Quarantined", fg_color="transparent", border_width=1, border_color=BRAND_COLOR,
+                                         text_color=BRAND_COLOR, hover_color="#FFE5E6", command=self.restore_quarantine)
+        self.restore_btn.pack(side="right")
+
+        # Action
+        self.clean_btn = ctk.CTkButton(self, text="Clean Selected", fg_color=BRAND_COLOR, hover_color="#D92630", height=50, font=("Segoe UI", 16, "bold"), command=self.clean_files)
+        self.clean_btn.pack(fill="x")
+
+    def clear_items(self):
+        self.set_items([])
+
+    def set_items(self, items):
+        # items: (name, path, size_str, size_bytes), all selected
+        self.items.model.set_rows(items, checked=True)
+        self.manifests = {}
+        self.expected = {}
+        self.items.refresh()
+        self.update_selection()
+
+    def add_item(self, name, path, size_str, size_bytes, manifest=None, files=None):
+        self.items.model.append((name, path, size_str, size_bytes), checked=True)
+        if manifest is not None:
+            self.manifests[path] = manifest
+        if files is not None:
+            self.expected[path] = (files, size_bytes)
+        self.items.refresh()
+
+    def update_selection(self):
+        selected = self.items.model.checked_rows()
+        count = len(selected)
+        total_bytes = sum(size for _, _, _, size in selected)
+        
+        self.selected_label.configure(text=f"{count} directories selected")
+        
+        size_str = f"{total_bytes / (1024*1024):.1f} MB"
+        if total_bytes > 1024*1024*1024:
+            size_str = f"{total_bytes / (1024*1024*1024):.2f} GB"
+        self.total_size_label.configure(text=size_str)
+        
+    def clean_files(self):
+        quarantine = self.quarantine_var.get()
+        if quarantine:
+            question = f"Move these files to quarantine? They are deleted after {PURGE_AFTER_HOURS} hours and can be restored until then."
+        else:
+            question = "Are you sure you want to permanently delete these files?"
+        if not messagebox.askyesno("Confirm Clean", question):
+            return
+            
+        self.clean_btn.configure(state="disabled", text="Cleaning...")
+        rows = self.items.model.checked_rows()
+        targets = [(name, path) for name, path, _, _ in rows]
+        sizes = {path: size for _, path, _, size in rows}
+        progress = ProgressBus()
+        progress.expect([self.expected.get(path) for _, path in targets])
+        threading.Thread(target=self.run_clean, args=(targets, progress, quarantine, sizes), daemon=True).start()
+        self.after(RENDER_MS, self.poll_clean, progress)
+
+    def run_clean(self, targets, progress, quarantine=False, sizes=None):
+        # Delete what the scan recorded; the manifests are stale afterwards.
+        # Runs off the UI thread: the outcome goes back through the bus.
+        manifests, self.manifests = self.manifests, {}
+        try:
+            results = engine.clean(targets, manifests=manifests, progress=progress, quarantine=quarantine, sizes=sizes)
+        except Exception as e:
+            progress.finish(("Cleaning Failed", str(e)))
+            return
+
+        summary = "\n".join(engine.describe_clean(r) for r in results) or "Nothing selected."
+        freed = sum(r.bytes_freed for r in results)
+        title = "Cleaning Completed" if not any(r.files_skipped for r in results) else "Cleaning Completed With Skipped Files"
+        progress.finish((title, f"Freed {engine.format_size(freed)}\n\n{summary}"))
+
+    def poll_clean(self, progress):
+        snap = progress.snapshot()
+        if not snap.finished:
+            eta = format_eta(snap.eta)
+            self.clean_btn.configure(text=f"Cleaning... {int(snap.fraction * 100)}% • {engine.format_size(snap.bytes)} freed"
+                                          + (f" • {eta}" if eta else ""))
+            self.after(RENDER_MS, self.poll_clean, progress)
+            return
+        self.clean_btn.configure(state="normal", text="Clean Selected")
+        messagebox.showinfo(*progress.result)
+
+    def restore_quarantine(self):
+        if not messagebox.askyesno("Restore Quarantine", "Move every quarantined file back where it came from?"):
+            return
+        self.restore_btn.configure(state="disabled", text="Restoring...")
+        progress = ProgressBus()
+        threading.Thread(target=self.run_restore, args=(progress,), daemon=True).start()
+        self.after(RENDER_MS, self.poll_restore, progress)
+
+    def run_restore(self, progress):
+        try:
+            restored = engine.restore_quarantine()
+        except Exception as e:
+            progress.finish(("Restore Failed", str(e)))
+            return
+        if not restored:
+            progress.finish(("Restore Quarantine", "Nothing is in quarantine."))
+            return
+        lines = [f"{entry.name}: {moved} items restored" + (f", {len(failures)} failed" if failures else "")
+                 for entry, moved, failures in restored]
+        title = "Restore Completed" if not any(failures for _, _, failures in restored) else "Restore Completed With Errors"
+        progress.finish((title, "\n".join(lines)))
+
+    def poll_restore(self, progress):
+        if not progress.finished:
+            self.after(RENDER_MS, self.poll_restore, progress)
+            return
+        self.restore_btn.configure(state="normal", text="Restore Quarantined")
+        messagebox.showinfo(*progress.result)
+
+
+class AccordionItem(ctk.CTkFrame):
+    def __init__(self, master, title, icon_color, icon_text, options):
+        super().__init__(master, fg_color=CARD_COLOR, corner_radius=10)
+        self.options = options
+        self.is_expanded = False
+        
+        # Header (Always visible)
+        self.header = ctk.CTkFrame(self, fg_color="transparent")
+        self.header.pack(fill="x", ipady=5)
+        self.header.bind("<Button-1>", self.toggle)
+        
+        # Icon
+        self.icon_frame = ctk.CTkFrame(self.header, width=40, height=40, corner_radius=20, fg_color="#F0F0F0") 
+        self.icon_frame.pack_propagate(False)
+        self.icon_frame.pack(side="left", padx=20, pady=10)
+        
+
+        self.icon_label = ctk.CTkLabel(self.icon_frame, text=icon_text, font=("Segoe UI Emoji", 20), text_color=icon_color, anchor="center")
+        self.icon_label.pack(expand=True, fill="both")
+        
+        # Title & Subtitle
+        self.text_frame = ctk.CTkFrame(self.header, fg_color="transparent")
+        self.text_frame.pack(side="left", fill="y", pady=10)
+        
+        self.title_label = ctk.CTkLabel(self.text_frame, text=title, font=("Segoe UI", 14, "bold"), text_color=TEXT_COLOR)
+        self.title_label.pack(anchor="w")
+        
+        enabled_count = sum(1 for opt in options if isinstance(opt, tuple) and len(opt) > 3 and opt[3]) # Check if enabled by default
+        self.subtitle_label = ctk.CTkLabel(self.text_frame, text=f"{enabled_count} of {len(options)} enabled", font=("Segoe UI", 12), text_color="gray")
+        self.subtitle_label.pack(anchor="w")
+        
+        # Arrow
+        self.arrow_label = ctk.CTkLabel(self.header, text=">", font=("Segoe UI", 14, "bold"), text_color="gray")
+        self.arrow_label.pack(side="right", padx=20)
+        
+        # Option state lives here as plain data (what apply_changes reads); the
+        # content widgets are only built the first time the section is expanded
+        self.state = {item[1]: item[3] if len(item) > 3 else False for item in options}
+        self.content = None
+        self.option_vars = {}
+
+    def build_content(self):
+        self.content = ctk.CTkFrame(self, fg_color="transparent")
+        for item in self.options:
+            text = item[0]
+            key = item[1]
+            command = item[2] if len(item) > 2 else None
+            
+            row = ctk.CTkFrame(self.content, fg_color="transparent")
+            row.pack(fill="x", padx=20, pady=5)
+            
+            var = ctk.BooleanVar(value=self.state[key])
+            self.option_vars[key] = var
+            
+            cb = ctk.CTkCheckBox(row, text=text, variable=var, font=("Segoe UI", 12), text_color=TEXT_COLOR, border_color=BRAND_COLOR, fg_color=BRAND_COLOR,
+                                 command=lambda k=key, c=command: self.option_toggled(k, c))
+            cb.pack(anchor="w")
+
+    def option_toggled(self, key, command):
+        self.state[key] = self.option_vars[key].get()
+        if command:
+            command()
+
+    def set_option(self, key, value):
+        self.state[key] = value
+        if key in self.option_vars:
+            self.option_vars[key].set(value)
+
+    def toggle(self, event=None):
+        if self.content is None:
+            self.build_content()
+        if self.is_expanded:
+            self.content.pack_forget()
+            self.arrow_label.configure(text=">")
+        else:
+            self.content.pack(fill="x", pady=(0, 15))
+            self.arrow_label.configure(text="v")
+        self.is_expanded = not self.is_expanded
+
+class BoostFrame(ctk.CTkFrame):
+    def __init__(self, master):
+        super().__init__(master, fg_color="transparent")
+        
+        self.title = ctk.CTkLabel(self, text="Boost System", font=("Segoe UI", 24, "bold"), text_color=TEXT_COLOR)
+        self.title.pack(anchor="w", pady=(0, 5))
+        
+        self.subtitle = ctk.CTkLabel(self, text="Optimize your system with advanced tweaks and settings", font=("Segoe UI", 12), text_color="gray")
+        self.subtitle.pack(anchor="w", pady=(0, 20))
+
+        # Scrollable Container
+        self.scroll = ctk.CTkScrollableFrame(self, fg_color="transparent")
+        self.scroll.pack(fill="both", expand=True)
+
+        # Active Status Card
+        self.status_card = ctk.CTkFrame(self.scroll, fg_color=CARD_COLOR, corner_radius=10)
+        self.status_card.pack(fill="x", pady=(0, 15), ipady=10)
+        
+        # Icon
+        icon_bg = ctk.CTkFrame(self.status_card, width=50, height=50, corner_radius=25, fg_color=BRAND_COLOR)
+        icon_bg.pack(side="left", padx=20)
+        ctk.CTkLabel(icon_bg, text="⚡", font=("Segoe UI", 24), text_color="white").place(relx=0.5, rely=0.5, anchor="center")
+        
+        # Text
+        text_frame = ctk.CTkFrame(self.status_card, fg_color="transparent")
+        text_frame.pack(side="left", fill="y")
+        ctk.CTkLabel(text_frame, text="7 Optimizations Active", font=("Segoe UI", 16, "bold"), text_color=TEXT_COLOR).pack(anchor="w")
+        ctk.CTkLabel(text_frame, text="Full multilingual support • 24 languages available", font=("Segoe UI", 12), text_color="gray").pack(anchor="w")
+        
+        # Quick Actions Grid
+        self.quick_actions = ctk.CTkFrame(self.scroll, fg_color="transparent")
+        self.quick_actions.pack(fill="x", pady=(0, 15))
+        
+        actions = [
+            ("Clean Drive", "💾", self.go_to_clean),
+            ("Ping Test", "📶", self.run_ping_test),
+            ("Hardware Info", "👁️", self.run_hardware_info)
+        ]
+        
+        for i, (text, icon, cmd) in enumerate(actions):
+            card = ctk.CTkButton(self.quick_actions, text="", fg_color=CARD_COLOR, corner_radius=10, height=80, hover_color="#E0E0E0", command=cmd)
+            card.grid(row=0, column=i, sticky="ew", padx=5)
+            self.quick_actions.grid_columnconfigure(i, weight=1)
+            
+            card.destroy()
+            
+            card = ctk.CTkFrame(self.quick_actions, fg_color=CARD_COLOR, corner_radius=10, height=80)
+            card.grid(row=0, column=i, sticky="ew", padx=5)
+            card.pack_propagate(False)
+            self.quick_actions.grid_columnconfigure(i, weight=1)
+            
+            # Bind click to frame and children
+            card.bind("<Button-1>", lambda e, c=cmd: c())
+            
+            icon_lbl = ctk.CTkLabel(card, text=icon, font=("Segoe UI", 16), text_color=BRAND_COLOR)
+            icon_lbl.pack(pady=(15, 5))
+            icon_lbl.bind("<Button-1>", lambda e, c=cmd: c())
+            
+            text_lbl = ctk.CTkLabel(card, text=text, font=("Segoe UI", 11, "bold"), text_color=TEXT_COLOR)
+            text_lbl.pack()
+            text_lbl.bind("<Button-1>", lambda e, c=cmd: c())
+
+        # Accordions
+        self.accordions = []
+        
+        # Appearance & Performance
+        self.add_accordion("Appearance & Performance", "#4A90E2", "🎨", [
+            ("Enable Dark Theme", "dark_mode", None, False),
+            ("Disable Desktop Animations", "disable_anim", None, False),
+            ("Disable Transparency Effects", "disable_transparency", None, False),
+            ("Enable UTC Time Globally", "utc_time", None, False)
+        ])
+        
+        # Privacy & Telemetry
+        self.add_accordion("Privacy & Telemetry", "#FF2E38", "🛡️", [
+            ("Turn off Windows telemetry, Cortana, and more", "disable_telemetry", None, False),
+            ("Disable Office telemetry (2016+)", "office_telemetry", None, False),
+            ("Disable CoPilot AI in Windows 11 & Edge", "disable_copilot", None, False),
+            ("Block Ad Tracking", "block_ads", None, False)
+        ])
+        
+        # System Services
+        self.add_accordion("System Services", "#9013FE", "⚙️", [
+            ("Disable unnecessary Windows services", "disable_services", None, False),
+            ("Stop automatic Windows 10/11 updates", "stop_updates", None, False),
+            ("Disable OneDrive", "disable_onedrive", None, False),
+            ("Disable HPET", "disable_hpet", None, False)
+        ])
+        
+        # Network Optimization
+        self.add_accordion("Network Optimization", "#50E3C2", "📶", [
+            ("Enhance system and network performance", "perf_tweak", None, False),
+            ("Clean browser profiles", "clean_browsers", None, False),
+            ("Flush DNS cache", "flush_dns", None, False)
+        ])
+        
+        # Registry & Advanced
+        self.add_accordion("Registry & Advanced", "#F5A623", "🔧", [
+            ("Fix common registry issues", "registry_fix", None, False),
+            ("Support silent runs (Template)", "silent_run", None, False),
+            ("Add items to desktop right-click menu", "context_menu", None, False)
+        ])
+
+        # Footer Actions
+        self.footer = ctk.CTkFrame(self.scroll, fg_color="transparent")
+        self.footer.pack(fill="x", pady=20)
+        
+        self.apply_btn = ctk.CTkButton(self.footer, text="Apply All Changes", fg_color=BRAND_COLOR, hover_color="#D92630", height=50, font=("Segoe UI", 16, "bold"), command=self.apply_changes)
+        self.apply_btn.pack(fill="x", pady=(0, 10))
+
+        self.undo_btn = ctk.CTkButton(self.footer, text="Undo Last Apply", fg_color=CARD_COLOR, text_color=TEXT_COLOR, hover_color="#E0E0E0", height=40, command=self.undo_changes)
+        self.undo_btn.pack(fill="x")
+        if not load_snapshot():
+            self.undo_btn.configure(state="disabled")
+
+        self.tweak_engine = TweakEngine(registry.default_backend())
+        self.select_tweaks(master.suggested_tweaks)
+
+    def go_to_clean(self):
+        self.master.show_frame("clean")
+
+    def run_ping_test(self):
+        import webbrowser
+        webbrowser.open("https://www.speedtest.net")
+
+    def run_hardware_info(self):
+        try:
+            import subprocess
+            subprocess.Popen("msinfo32")
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not open System Information: {e}")
+
+    def add_accordion(self, title, color, icon, options):
+        acc = AccordionItem(self.scroll, title, color, icon, options)
+        acc.pack(fill="x", pady=5)
+        self.accordions.append(acc)
+
+    def set_theme(self, new_mode):
+        # Follows a successful dark_mode apply; ticking the box changes nothing
+        ctk.set_appearance_mode(new_mode)
+        
+        # Update colors for dark mode if needed (simple override)
+        global TEXT_COLOR, CARD_COLOR, SIDEBAR_COLOR, BG_COLOR
+        if new_mode == "Dark":
+            TEXT_COLOR = "#FFFFFF"
+            CARD_COLOR = "#2B2D31"
+            SIDEBAR_COLOR = "#1E1F22"
+            BG_COLOR = "#111111"
+        else:
+            TEXT_COLOR = "#333333"
+            CARD_COLOR = "#FFFFFF"
+            SIDEBAR_COLOR = "#FFFFFF"
+            BG_COLOR = "#F4F5F7"
+
+    def select_tweaks(self, keys):
+        keys = set(keys)
+        for acc in self.accordions:
+            for key in acc.state:
+                if key in keys:
+                    acc.set_option(key, True)
+
+    def apply_changes(self):
+        # Collect all enabled options
+        changes = []
+        for acc in self.accordions:
+            for key, enabled in acc.state.items():
+                if enabled:
+                    changes.append(key)
+
+        # Preview first (reads only), then confirm and apply; registry calls stay off the UI thread
+        self.apply_btn.configure(state="disabled", text="Checking...")
+        self.start_tweak_job(self.run_tweaks, changes, True)
+
+    def start_tweak_job(self, target, *args):
+        # The worker only puts its (handler, args) on the queue; the handler
+        # runs here on the Tk main loop once poll_tweak_job picks it up
+        job_queue = queue.Queue()
+        threading.Thread(target=target, args=(job_queue,) + args, daemon=True).start()
+        self.after(50, self.poll_tweak_job, job_queue)
+
+    def poll_tweak_job(self, job_queue):
+        try:
+            handler, args = job_queue.get_nowait()
+        except queue.Empty:
+            self.after(50, self.poll_tweak_job, job_queue)
+            return
+        handler(*args)
+
+    def run_tweaks(self, job_queue, keys, dry_run):
+        try:
+            run = self.tweak_engine.apply(keys, dry_run=dry_run)
+            if not dry_run:
+                save_snapshot(run)
+        except Exception as e:
+            job_queue.put((self.tweaks_failed, (e,)))
+            return
+        job_queue.put((self.confirm_tweaks, (keys, run)) if dry_run else (self.show_tweak_results, (run,)))
+
+    def confirm_tweaks(self, keys, run):
+        planned = [r for r in run.results if r.status == "planned"]
+        if not planned:
+            self.apply_btn.configure(state="normal", text="Apply All Changes")
+            messagebox.showinfo("Apply", "\n".join(["Nothing to change."] + run.summary()))
+            return
+        diff = [c.describe() for r in planned for c in r.changes]
+        if not messagebox.askyesno("Apply", f"{len(planned)} optimizations will change {len(diff)} registry values:\n\n" + "\n".join(diff) + "\n\nContinue?"):
+            self.apply_btn.configure(state="normal", text="Apply All Changes")
+            return
+        self.apply_btn.configure(text="Applying...")
+        self.start_tweak_job(self.run_tweaks, [r.key for r in planned], False)
+
+    def show_tweak_results(self, run):
+        self.apply_btn.configure(state="normal", text="Apply All Changes")
+        self.undo_btn.configure(state="normal" if load_snapshot() else "disabled")
+        if any(r.key == "dark_mode" and r.status == "applied" for r in run.results):
+            self.set_theme("Dark")
+        title = "Optimizations Applied" if not run.count("failed") else "Some Optimizations Failed"
+        messagebox.showinfo(title, "\n".join(run.summary()))
+
+    def tweaks_failed(self, error):
+        self.apply_btn.configure(state="normal", text="Apply All Changes")
+        messagebox.showerror("Error", f"Failed to change registry: {error}")
+
+    def undo_changes(self):
+        if not messagebox.askyesno("Undo", "Restore the registry values changed by the last apply?"):
+            return
+        self.undo_btn.configure(state="disabled")
+        self.start_tweak_job(self.run_undo)
+
+    def run_undo(self, job_queue):
+        try:
+            errors = self.tweak_engine.rollback(load_snapshot())
+        except Exception as e:
+            errors = [("registry", str(e))]
+        if not errors:
+            clear_snapshot()
+        text = "Previous values restored." if not errors else "\n".join(f"{loc}: {reason}" for loc, reason in errors)
+        job_queue.put((self.show_undo_result, (text,)))
+
+    def show_undo_result(self, text):
+        messagebox.showinfo("Undo", text)
+        self.undo_btn.configure(state="normal" if load_snapshot() else "disabled")
+
+class ProgramRow:
+    # One recycled row of the Programs list
+    def __init__(self, parent, programs):
+        self.programs = programs
+        self.index = -1
+        self.frame = ctk.CTkFrame(parent, fg_color=CARD_COLOR, corner_radius=8, height=60)
+        self.frame.pack_propagate(False)
+
+        self.var = ctk.BooleanVar()
+        ctk.CTkCheckBox(self.frame, text="", variable=self.var, width=20, border_color=BRAND_COLOR, fg_color=BRAND_COLOR, command=self.toggled).pack(side="left", padx=15, pady=15)
+        self.icon_lbl = ctk.CTkLabel(self.frame, text="📦", font=("Segoe UI", 20))
+        self.icon_lbl.pack(side="left", padx=10)
+
+        info = ctk.CTkFrame(self.frame, fg_color="transparent")
+        info.pack(side="left", fill="x", expand=True)
+        self.name_lbl = ctk.CTkLabel(info, text="", font=("Segoe UI", 12, "bold"), text_color=TEXT_COLOR)
+        self.name_lbl.pack(anchor="w")
+        self.date_lbl = ctk.CTkLabel(info, text="", font=("Segoe UI", 10), text_color="gray")
+        self.date_lbl.pack(anchor="w")
+
+        self.size_lbl = ctk.CTkLabel(self.frame, text="-- MB", font=("Segoe UI", 12, "bold"), text_color=TEXT_COLOR)
+        self.size_lbl.pack(side="right", padx=15)
+        self.tag = ctk.CTkLabel(self.frame, text="Old", fg_color="#FFF3CD", text_color="#856404", corner_radius=5, padx=5)
+
+    def show(self, index, row, checked):
+        name, date, is_old, size_str = row[:4]
+        self.index = index
+        self.var.set(checked)
+        self.icon_lbl.configure(text="🏚️" if is_old else "📦")
+        self.name_lbl.configure(text=name)
+        self.date_lbl.configure(text=date)
+        self.size_lbl.configure(text=size_str)
+        if is_old:
+            self.tag.pack(side="right", padx=15, before=self.size_lbl)
+        else:
+            self.tag.pack_forget()
+
+    def toggled(self):
+        self.programs.set_checked(self.index, self.var.get())
+
+
+class ProgramsFrame(ctk.CTkFrame):
+    def __init__(self, master):
+        super().__init__(master, fg_color="transparent")
+        
+        self.title = ctk.CTkLabel(self, text="Installed Programs", font=("Segoe UI", 24, "bold"), text_color=TEXT_COLOR)
+        self.title.pack(anchor="w", pady=(0, 5))
+        
+        self.subtitle = ctk.CTkLabel(self, text="Review and uninstall programs installed over 1 year ago", font=("Segoe UI", 12), text_color="gray")
+        self.subtitle.pack(anchor="w", pady=(0, 20))
+
+        # Stats
+        self.stats = ctk.CTkFrame(self, fg_color=CARD_COLOR, corner_radius=10)
+        self.stats.pack(fill="x", pady=(0, 20), ipady=10)
+        
+        ctk.CTkLabel(self.stats, text="📦", font=("Segoe UI", 24), text_color=BRAND_COLOR).pack(side="left", padx=20)
+        
+        info_frame = ctk.CTkFrame(self.stats, fg_color="transparent")
+        info_frame.pack(side="left")
+        
+        self.count_label = ctk.CTkLabel(info_frame, text="Loading...", font=("Segoe UI", 14, "bold"), text_color=TEXT_COLOR)
+        self.count_label.pack(anchor="w")
+        
+        self.old_count_label = ctk.CTkLabel(info_frame, text="", font=("Segoe UI", 12), text_color="#FFB000")
+        self.old_count_label.pack(anchor="w")
+        
+        self.select_old_btn = ctk.CTkButton(self.stats, text="Select All Old", width=100, height=30, fg_color="#FFB000", hover_color="#E0A000", text_color="white", command=self.select_old_apps)
+        self.select_old_btn.pack(side="right", padx=20)
+
+        # List
+        self.programs = VirtualList(self, ListModel(), lambda parent: ProgramRow(parent, self.programs), row_height=60,
+                                    on_change=self.update_uninstall_btn)
+        self.programs.pack(fill="both", expand=True, pady=(0, 20))
+
+        self.inventory = ProgramInventory(registry.default_backend())
+        self.sizer = ProgramSizer(self.inventory)
+        self.load_queue = queue.Queue() # Worker -> UI rows and install sizes, drained by poll_programs
+        self.registry_progress = self.size_progress = None # ProgressBus per phase of the running load
+        self.program_count = None
+        self.load_error = None # Why the running load could not list or size everything
+        self.load_generation = 0
+        self.row_index = {} # (hive, key) -> row in the list
+
+        # Action Bar
+        self.action_bar = ctk.CTkFrame(self, fg_color="transparent")
+        self.action_bar.pack(fill="x", pady=10)
+        
+        self.uninstall_btn = ctk.CTkButton(self.action_bar, text="Uninstall 0 Programs", fg_color="#FF9999", hover_color="#FF2E38", height=40, state="disabled")
+        self.uninstall_btn.pack(side="left", fill="x", expand=True, padx=(0, 10))
+        
+        ctk.CTkButton(self.action_bar, text="Refresh List", fg_color=CARD_COLOR, text_color=TEXT_COLOR, hover_color="#E0E0E0", height=40, width=100, command=self.load_programs).pack(side="right")
+
+        self.sort_btn = ctk.CTkButton(self.action_bar, text="Largest First", fg_color=CARD_COLOR, text_color=TEXT_COLOR, hover_color="#E0E0E0", height=40, width=100, state="disabled", command=self.sort_by_size)
+        self.sort_btn.pack(side="right", padx=(0, 10))
+
+    def on_first_show(self):
+        self.load_programs()
+
+    def load_programs(self):
+        self.programs.model.clear()
+        self.programs.refresh()
+        self.update_uninstall_btn()
+        self.sort_btn.configure(state="disabled")
+        self.load_generation += 1 # Results from an earlier load are dropped
+        self.registry_progress = ProgressBus()
+        self.size_progress = ProgressBus()
+        self.program_count = None
+        self.load_error = None
+
+        self.count_label.configure(text="Scanning Registry...")
+        self.old_count_label.configure(text="")
+        threading.Thread(target=self.fetch_programs, args=(self.load_generation, self.registry_progress, self.size_progress),
+                         daemon=True).start()
+        self.after(RENDER_MS, self.poll_programs, self.load_generation)
+
+    def fetch_programs(self, generation, registry_progress, size_progress):
+        programs = []
+        try:
+            # Only Uninstall subkeys written since the last refresh are read
+            now = datetime.now()
+            for program in self.inventory.installed(registry_progress):
+                date_str, is_old = program.describe(now)
+                programs.append((is_old, program, date_str))
+        except Exception as e:
+            self.load_queue.put((generation, "error", f"could not read installed programs: {e}"))
+
+        # Sort: Oldest first
+        programs.sort(key=lambda x: x[0], reverse=True)
+        rows = [(program.name, date_str, is_old, "-- MB", None, (program.hive, program.key))
+                for is_old, program, date_str in programs]
+        self.load_queue.put((generation, "rows", rows))
+
+        # Sizes fill in as they arrive; cached and EstimatedSize ones first
+        def on_size(program, size, source):
+            self.load_queue.put((generation, "size", ((program.hive, program.key), size)))
+        try:
+            self.sizer.sizes([program for _, program, _ in programs], on_size, size_progress)
+        except Exception as e:
+            self.load_queue.put((generation, "error", f"could not size programs: {e}"))
+        self.load_queue.put((generation, "done", None))
+
+    def display_programs(self, programs):
+        self.program_count = len(programs)
+        self.count_label.configure(text=f"{len(programs)} Programs Installed")
+        old_count = sum(1 for p in programs if p[2])
+        self.old_count_label.configure(text=f"{old_count} old programs detected")
+        
+        if old_count > 0:
+             self.old_count_label.configure(text_color="#FFB000")
+             self.select_old_btn.configure(state="normal")
+        else:
+             self.select_old_btn.configure(state="disabled")
+
+        self.programs.model.set_rows(programs)
+        self.row_index = {row[5]: i for i, row in enumerate(programs)}
+        self.programs.scroll_to(0)
+        self.update_uninstall_btn()
+
+    def poll_programs(self, current):
+        # Apply the rows and every size that arrived since the last frame, then
+        # redraw once. A newer load starts its own poll loop, so this one just stops.
+        if current != self.load_generation:
+            return
+        model = self.programs.model
+        finished = False
+        changed = False
+        try:
+            while True:
+                generation, kind, payload = self.load_queue.get_nowait()
+                if generation != self.load_generation:
+                    continue
+                if kind == "rows":
+                    self.display_programs(payload)
+                elif kind == "size":
+                    key, size = payload
+                    index = self.row_index.get(key)
+                    if index is not None:
+                        name, date_str, is_old, _, _, _ = model.rows[index]
+                        size_str = engine.format_size(size) if size is not None else "Unknown"
+                        model.update(index, (name, date_str, is_old, size_str, size, key))
+                        changed = True
+                elif kind == "error":
+                    self.load_error = payload
+                else:
+                    finished = True
+                    break
+        except queue.Empty:
+            pass
+        if changed:
+            self.programs.refresh()
+
+        if self.program_count is None:
+            snap = self.registry_progress.snapshot()
+            self.count_label.configure(text=f"Scanning Registry... {snap.entries:,} entries")
+        elif not finished:
+            snap = self.size_progress.snapshot()
+            if snap.total:
+                self.count_label.configure(text=f"{self.program_count} Programs Installed • sizing folders {snap.done}/{snap.total}")
+        else:
+            self.count_label.configure(text=f"{self.program_count} Programs Installed"
+                                            + (f" • {self.load_error}" if self.load_error else ""))
+
+        if finished:
+            self.sort_btn.configure(state="normal")
+        else:
+            self.after(RENDER_MS, self.poll_programs, current)
+
+    def sort_by_size(self):
+        self.programs.model.sort(lambda row: row[4] or 0, reverse=True)
+        self.row_index = {row[5]: i for i, row in enumerate(self.programs.model.rows)}
+        self.programs.scroll_to(0)
+
+    def select_old_apps(self):
+        self.programs.model.check_where(lambda program: program[2])
+        self.programs.refresh()
+        self.update_uninstall_btn()
+
+    def update_uninstall_btn(self):
+        count = self.programs.model.checked_count()
+        self.uninstall_btn.configure(text=f"Uninstall {count} Programs")
+        if count > 0:
+            self.uninstall_btn.configure(state="normal", fg_color=BRAND_COLOR)
+        else:
+            self.uninstall_btn.configure(state="disabled", fg_color="#FF9999")
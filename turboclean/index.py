@@ -0,0 +1,185 @@
+import os
+import sqlite3
+import sys
+from array import array
+from contextlib import closing
+
+# Lives next to the app, alongside turbocleaner.py
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scan_index.db")
+
+# Bumped whenever the row layout changes; older indexes are dropped, not migrated
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS dirs (
+    path BLOB PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    files INTEGER NOT NULL,
+    subdirs BLOB NOT NULL,
+    ages BLOB NOT NULL,
+    top_sizes BLOB NOT NULL,
+    top_names BLOB NOT NULL
+) WITHOUT ROWID
+"""
+
+# Paths are stored as filesystem bytes so undecodable names round-trip and
+# prefix range scans compare the same way on every platform
+SEP = os.fsencode(os.sep)
+
+
+def _key(path):
+    return os.fsencode(path)
+
+
+def _range(root):
+    prefix = _key(root).rstrip(SEP) + SEP
+    upper = prefix[:-1] + bytes([prefix[-1] + 1])
+    return _key(root), prefix, upper
+
+
+def _pack_names(names):
+    return b"\0".join(os.fsencode(n) for n in names)
+
+
+def _unpack_names(blob):
+    return tuple(os.fsdecode(n) for n in blob.split(b"\0")) if blob else ()
+
+
+def _pack_top(top):
+    return array("Q", (size for size, _ in top)).tobytes(), _pack_names(name for _, name in top)
+
+
+def _unpack_top(sizes, names):
+    return tuple(zip(array("Q", sizes), _unpack_names(names)))
+
+
+class ScanIndex:
+    # Per-directory cache of the directory's own file bytes/count and its child
+    # directory names, keyed on the directory's mtime. Adding, removing or
+    # renaming an entry bumps the directory's mtime, so an unchanged mtime means
+    # the listing can be reused without opening the directory.
+    #
+    # Each row also carries the directory's statistics summary (files by
+    # last-use day and its largest files, see stats.DirSummary).
+    #
+    # Files rewritten in place do not touch the directory mtime; their old size
+    # is reported until something else in that directory changes.
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS dirs")
+                conn.execute(SCHEMA)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return conn
+
+    def load(self, root):
+        # Returns {path: (mtime_ns, size, files, subdir_names, ages, top)} for
+        # root's subtree. The index is only a cache, so any failure just means a
+        # full walk.
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT path, mtime_ns, size, files, subdirs, ages, top_sizes, top_names FROM dirs "
+                    "WHERE path = ? OR (path >= ? AND path < ?)",
+                    _range(root)
+                ).fetchall()
+        except (sqlite3.Error, OSError):
+            return {}
+        return {
+            os.fsdecode(p): (m, s, f, _unpack_names(d), array("q", a), _unpack_top(ts, tn))
+            for p, m, s, f, d, a, ts, tn in rows
+        }
+
+    def replace(self, root, records):
+        # records: iterable of (path, mtime_ns, size, files, subdir_names, ages, top)
+        # for every directory seen under root. Rows for directories that are gone
+        # are dropped.
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", _range(root))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((_key(p), m, s, f, _pack_names(d), a.tobytes()) + _pack_top(t) for p, m, s, f, d, a, t in records)
+                )
+            return True
+        except (sqlite3.Error, OSError):
+            return False
+
+    def clear(self, root=None):
+        with closing(self._connect()) as conn, conn:
+            if root is None:
+                cur = conn.execute("DELETE FROM dirs")
+            else:
+                cur = conn.execute("DELETE FROM dirs WHERE path = ? OR (path >= ? AND path < ?)", _range(root))
+            removed = cur.rowcount
+        if root is None:
+            with closing(sqlite3.connect(self.path)) as conn:
+                conn.execute("VACUUM")
+        return removed
+
+    def subtree(self, root):
+        # Cached totals for root as of the last scan: (dirs, files, bytes)
+        with closing(self._connect()) as conn:
+            dirs, files, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(files), 0), COALESCE(SUM(size), 0) FROM dirs WHERE path = ? OR (path >= ? AND path < ?)",
+                _range(root)
+            ).fetchone()
+        return dirs, files, size
+
+    def estimate(self, root):
+        # (entries, bytes) root had at the last scan, or None if it was never
+        # scanned. Used to weight progress, so failures just mean no estimate.
+        try:
+            dirs, files, size = self.subtree(root)
+        except (sqlite3.Error, OSError):
+            return None
+        return (dirs + files, size) if dirs else None
+
+    def stats(self):
+        with closing(self._connect()) as conn:
+            dirs, files, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(files), 0), COALESCE(SUM(size), 0) FROM dirs"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "dirs": dirs,
+            "files": files,
+            "bytes": size,
+            "db_bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+        }
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m turboclean.index", description="Inspect or invalidate the TurboClean scan index")
+    parser.add_argument("--db", default=DEFAULT_INDEX_PATH, help="index file (default: %(default)s)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="show index totals")
+    show = sub.add_parser("show", help="show cached totals for a directory tree")
+    show.add_argument("path")
+    clear = sub.add_parser("clear", help="invalidate the whole index or one directory tree")
+    clear.add_argument("path", nargs="?")
+    args = parser.parse_args(argv)
+
+    index = ScanIndex(args.db)
+    if args.command == "stats":
+        for key, value in index.stats().items():
+            print(f"{key}: {value}")
+    elif args.command == "show":
+        dirs, files, size = index.subtree(args.path)
+        print(f"{args.path}: {dirs} dirs, {files} files, {size} bytes")
+    elif args.command == "clear":
+        removed = index.clear(args.path)
+        print(f"Removed {removed} entries")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from turboclean.registry import RegistryBackend
+from turboclean.tweaks import PERSONALIZE, TWEAKS, TweakEngine
+
+# System issue detection. Each rule is a check that produces a Finding; rules
+# built from a Boost tweak report an issue exactly when that tweak is not in
+# place, so the issue and its fix cannot drift apart.
+
+MAX_WORKERS = 4
+
+
+class Finding:
+    __slots__ = ("rule", "title", "severity", "details", "fix")
+
+    def __init__(self, rule, title, severity, details=(), fix=None):
+        self.rule = rule
+        self.title = title
+        self.severity = severity # low, medium, high
+        self.details = list(details)
+        self.fix = fix # Boost tweak key that resolves it, if any
+
+    def as_dict(self):
+        return {"rule": self.rule, "title": self.title, "severity": self.severity,
+                "details": self.details, "fix": self.fix}
+
+    def __repr__(self):
+        return f"Finding({self.rule!r}, {self.severity})"
+
+
+class IssueReport:
+    __slots__ = ("findings", "errors")
+
+    def __init__(self):
+        self.findings = []
+        self.errors = [] # (rule id, reason) for rules that could not be evaluated
+
+    def __len__(self):
+        return len(self.findings)
+
+    def as_dict(self):
+        return {"findings": [f.as_dict() for f in self.findings], "errors": [list(e) for e in self.errors]}
+
+
+class Rule:
+    def __init__(self, id, title, severity="low"):
+        self.id = id
+        self.title = title
+        self.severity = severity
+
+    def check(self, session):
+        # Finding or None; may raise OSError
+        raise NotImplementedError
+
+
+class TweakRule(Rule):
+    # An issue while any of the tweak's values differs from what it sets
+    def __init__(self, tweak_key, title, severity="low"):
+        super().__init__(tweak_key, title, severity)
+        self.tweak = TWEAKS[tweak_key]
+
+    def check(self, session):
+        plan, _ = TweakEngine(session.reads, [self.tweak]).plan([self.tweak.key])
+        pending = [c.describe() for c in plan[self.tweak.key] if c.needed]
+        if not pending:
+            return None
+        return Finding(self.id, self.title, self.severity, pending, fix=self.tweak.key)
+
+
+class ValueRule(Rule):
+    # An issue while a registry value is present and set to `bad`; a missing
+    # value is the Windows default and not reported
+    def __init__(self, id, title, hive, path, name, bad, severity="low", fix=None):
+        super().__init__(id, title, severity)
+        self.hive = hive
+        self.path = path
+        self.name = name
+        self.bad = bad
+        self.fix = fix
+
+    def check(self, session):
+        found = session.reads.read_typed(self.hive, self.path, [self.name])
+        if self.name not in found or found[self.name][0] != self.bad:
+            return None
+        return Finding(self.id, self.title, self.severity, [f"{self.hive}\\{self.path}\\{self.name} is {self.bad}"], fix=self.fix)
+
+
+RULES = [
+    ValueRule("dark_mode", "Light mode is on", "HKCU", PERSONALIZE, "AppsUseLightTheme", 1, fix="dark_mode"),
+    TweakRule("disable_telemetry", "Windows telemetry is enabled", "medium"),
+]
+
+
+class CachedReads(RegistryBackend):
+    # Read-through cache over a backend for one session: every key is read at
+    # most once however many rules look at it. Values are read per key in one
+    # call, so later rules asking for other names of the same key still hit.
+    def __init__(self, backend):
+        self.backend = backend
+        self.cache = {}
+        self.lock = threading.Lock()
+
+    def read_typed(self, hive, path, names):
+        key = (hive, path.lower())
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is None:
+                entry = self.cache[key] = [threading.Lock(), {}, set()]
+        key_lock, values, asked = entry
+        with key_lock:
+            missing = [n for n in names if n not in asked]
+            if missing:
+                values.update(self.backend.read_typed(hive, path, missing))
+                asked.update(missing)
+        return {n: values[n] for n in names if n in values}
+
+
+class IssueSession:
+    # One scan's worth of issue checks. start() runs every rule on a small
+    # pool in the background (so it overlaps the file walk); result() waits
+    # and returns the same IssueReport however often it is called.
+    def __init__(self, backend, rules=RULES, max_workers=MAX_WORKERS):
+        self.reads = CachedReads(backend)
+        self.rules = rules
+        self.max_workers = max_workers
+        self._thread = None
+        self._report = None
+
+    def _run(self):
+        # Always leaves a report: a rule that fails in an unexpected way is
+        # recorded as an error like a registry failure, never lost
+        report = IssueReport()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="turboclean-issues") as pool:
+                futures = [(rule, pool.submit(rule.check, self)) for rule in self.rules]
+                for rule, fut in futures:
+                    try:
+                        finding = fut.result()
+                    except (OSError, KeyError, ValueError) as e:
+                        report.errors.append((rule.id, getattr(e, "strerror", None) or str(e) or type(e).__name__))
+                        continue
+                    except Exception as e:
+                        report.errors.append((rule.id, f"{type(e).__name__}: {e}"))
+                        continue
+                    if finding is not None:
+                        report.findings.append(finding)
+        except Exception as e:
+            report.errors.append(("session", f"{type(e).__name__}: {e}"))
+        finally:
+            self._report = report
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="turboclean-issues", daemon=True)
+            self._thread.start()
+        return self
+
+    def result(self):
+        self.start()
+        self._thread.join()
+        return self._report
+
+
+def issue_session(backend=None):
+    # Registry rules only mean something on Windows; elsewhere there is
+    # nothing to check unless a backend is given
+    if backend is None:
+        if os.name != "nt":
+            return IssueSession(None, rules=[])
+        from turboclean.registry import default_backend
+        backend = default_backend()
+    return IssueSession(backend)
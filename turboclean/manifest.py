@@ -0,0 +1,31 @@
+from turboclean.fileindex import FileIndex
+
+
+class Manifest(FileIndex):
+    # What a scan saw under one target, kept so the clean step can delete
+    # exactly those files without listing the tree again.
+    #
+    # Directories are in discovery order (parents before children). A directory
+    # served from the scan index was not opened, so its files are not recorded
+    # (listed is 0); the clean step lists those itself.
+
+    def __init__(self, root, scanned_at_ns):
+        super().__init__()
+        self.root = root
+        self.scanned_at_ns = scanned_at_ns
+        self.listed = bytearray()
+
+    def add_dir(self, path, files=None):
+        # files: (names, sizes, mtimes) for a listed directory, None otherwise
+        self.listed.append(files is not None)
+        if files is None:
+            return super().add_dir(path)
+        return super().add_dir(path, *files)
+
+    def iter_dirs(self):
+        # (path, [(name, size, mtime_ns)] or None if the directory was not listed)
+        for d, path in enumerate(self.dir_paths()):
+            yield path, self.dir_files(d) if self.listed[d] else None
+
+    def nbytes(self):
+        return super().nbytes() + len(self.listed)
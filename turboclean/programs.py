@@ -0,0 +1,280 @@
+import json
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime, timedelta
+
+from turboclean.scanner import scan_targets
+
+# Where installed programs register themselves, in the order duplicates are
+# resolved (first one seen wins)
+UNINSTALL_KEYS = (
+    ("HKLM", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKLM", r"SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"),
+    ("HKCU", r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"),
+)
+
+# Values read from each program's key
+VALUE_NAMES = ("DisplayName", "InstallDate", "EstimatedSize", "InstallLocation")
+
+# Programs installed longer ago than this are flagged as old
+OLD_AFTER_DAYS = 365
+
+DEFAULT_INVENTORY_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "program_inventory.db")
+
+# Bumped whenever the row layout or VALUE_NAMES change; older caches are dropped
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS programs (
+    hive TEXT NOT NULL,
+    key TEXT NOT NULL,
+    last_write INTEGER NOT NULL,
+    vals TEXT NOT NULL,
+    PRIMARY KEY (hive, key)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS sizes (
+    hive TEXT NOT NULL,
+    key TEXT NOT NULL,
+    last_write INTEGER NOT NULL,
+    install_date TEXT,
+    size INTEGER,
+    source TEXT NOT NULL,
+    PRIMARY KEY (hive, key)
+) WITHOUT ROWID;
+"""
+
+# Key reads in flight at once; registry calls release the GIL
+MAX_WORKERS = 8
+
+# Threads walking InstallLocation folders for programs without EstimatedSize;
+# kept low so sizing in the background does not saturate the disk
+SIZE_WORKERS = 4
+
+
+class Program:
+    __slots__ = ("hive", "key", "last_write", "values")
+
+    def __init__(self, hive, key, last_write, values):
+        self.hive = hive
+        self.key = key # Full path of the program's Uninstall subkey
+        self.last_write = last_write
+        self.values = values
+
+    @property
+    def name(self):
+        return self.values.get("DisplayName")
+
+    def estimated_size(self):
+        # EstimatedSize is a DWORD in KiB; absent or zero means unknown
+        kib = self.values.get("EstimatedSize")
+        return kib * 1024 if isinstance(kib, int) and kib > 0 else None
+
+    def install_location(self):
+        location = self.values.get("InstallLocation")
+        if not isinstance(location, str):
+            return None
+        location = location.strip().strip('"').rstrip("\\/")
+        # A bare drive or empty value would size the whole disk
+        if not location or os.path.dirname(location) == location or location.endswith(":"):
+            return None
+        return location
+
+    def install_date(self):
+        # datetime from the YYYYMMDD InstallDate value, or None
+        raw = self.values.get("InstallDate")
+        if isinstance(raw, str) and len(raw) == 8:
+            try:
+                return datetime.strptime(raw, "%Y%m%d")
+            except ValueError:
+                return None
+        return None
+
+    def describe(self, now=None):
+        # (date text, is_old) as shown in the Programs list
+        now = now or datetime.now()
+        installed = self.install_date()
+        if installed is None:
+            return "Unknown", False
+        date_str = installed.strftime("%b %d, %Y")
+        if installed < now - timedelta(days=OLD_AFTER_DAYS):
+            return f"{date_str} • {(now - installed).days} days old", True
+        return date_str, False
+
+    def __repr__(self):
+        return f"Program({self.name!r}, {self.hive}\\{self.key})"
+
+
+class ProgramInventory:
+    # Installed programs, cached between runs. Each Uninstall subkey is keyed
+    # on its last-write time: enumerating a hive already yields those times,
+    # so only subkeys that are new or have changed are opened and read.
+    # Subkeys that disappeared drop out of the cache on the next refresh.
+
+    def __init__(self, backend, path=DEFAULT_INVENTORY_PATH, max_workers=MAX_WORKERS):
+        self.backend = backend
+        self.path = path
+        self.max_workers = max_workers
+        self.reread = 0 # Subkeys read by the last refresh
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path)
+        if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            conn.executescript(f"DROP TABLE IF EXISTS programs; DROP TABLE IF EXISTS sizes; {SCHEMA} "
+                               f"PRAGMA user_version = {SCHEMA_VERSION};")
+        return conn
+
+    def load(self):
+        # {(hive, key): Program} from the last refresh. Only a cache, so any
+        # failure just means everything is read again.
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute("SELECT hive, key, last_write, vals FROM programs").fetchall()
+        except (sqlite3.Error, OSError):
+            return {}
+        return {(h, k): Program(h, k, w, json.loads(v)) for h, k, w, v in rows}
+
+    def save(self, programs):
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM programs")
+                conn.executemany(
+                    "INSERT INTO programs VALUES (?, ?, ?, ?)",
+                    ((p.hive, p.key, p.last_write, json.dumps(p.values)) for p in programs)
+                )
+            return True
+        except (sqlite3.Error, OSError):
+            return False
+
+    def _read(self, hive, key, last_write):
+        try:
+            return Program(hive, key, last_write, self.backend.read_values(hive, key, VALUE_NAMES))
+        except OSError:
+            return None # Removed between enumeration and read
+
+    def _scan_hive(self, pool, hive, path, cached):
+        # [Program or future] in enumeration order for one Uninstall key
+        try:
+            subkeys = self.backend.enum_subkeys(hive, path)
+        except OSError:
+            return []
+        out = []
+        for name, last_write in subkeys:
+            key = f"{path}\\{name}"
+            hit = cached.get((hive, key))
+            if hit is not None and hit.last_write == last_write:
+                out.append(hit)
+            else:
+                out.append(pool.submit(self._read, hive, key, last_write))
+        return out
+
+    def refresh(self, progress=None):
+        # Every registered program, including ones without a DisplayName, in
+        # UNINSTALL_KEYS order. The hives are enumerated concurrently and
+        # changed subkeys are read on the same pool. progress (a ProgressBus)
+        # counts subkeys as they are resolved.
+        cached = self.load()
+        if progress is not None:
+            progress.current = "Reading registry"
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="turboclean-programs") as pool:
+            hives = [pool.submit(self._scan_hive, pool, hive, path, cached) for hive, path in UNINSTALL_KEYS]
+            entries = [entry for fut in hives for entry in fut.result()]
+            programs = []
+            self.reread = 0
+            for entry in entries:
+                if not isinstance(entry, Program):
+                    self.reread += 1
+                    entry = entry.result()
+                if entry is not None:
+                    programs.append(entry)
+                if progress is not None:
+                    progress.add(1)
+        self.save(programs)
+        return programs
+
+    def installed(self, progress=None):
+        # Programs with a DisplayName, one per name (first registration wins)
+        seen = set()
+        out = []
+        for program in self.refresh(progress):
+            name = program.name
+            if name and name not in seen:
+                seen.add(name)
+                out.append(program)
+        return out
+
+
+class ProgramSizer:
+    # Install sizes for the Programs list, computed off the UI thread.
+    #
+    # EstimatedSize from the Uninstall key is used when present. Otherwise the
+    # InstallLocation folder is walked; all folders share one scan pool of
+    # SIZE_WORKERS threads and each size is reported as soon as its walk ends.
+    # Results are cached per program and reused while the key's last-write
+    # time and InstallDate are unchanged.
+
+    def __init__(self, inventory, max_workers=SIZE_WORKERS):
+        self.inventory = inventory
+        self.max_workers = max_workers
+        self.walked = 0 # Folders walked by the last run
+
+    def _load(self):
+        try:
+            with closing(self.inventory._connect()) as conn:
+                rows = conn.execute("SELECT hive, key, last_write, install_date, size, source FROM sizes").fetchall()
+        except (sqlite3.Error, OSError):
+            return {}
+        return {(h, k): (w, d, s, src) for h, k, w, d, s, src in rows}
+
+    def _save(self, rows):
+        try:
+            with closing(self.inventory._connect()) as conn, conn:
+                conn.execute("DELETE FROM sizes")
+                conn.executemany("INSERT INTO sizes VALUES (?, ?, ?, ?, ?, ?)", rows)
+            return True
+        except (sqlite3.Error, OSError):
+            return False
+
+    def sizes(self, programs, on_size=None, progress=None):
+        # {program: size in bytes or None}; on_size(program, size, source)
+        # fires from the calling thread for each one, cached results first.
+        # source is "cache", "registry", "folder" or "unknown". progress (a
+        # ProgressBus) follows the folder walks.
+        cached = self._load()
+        results = {}
+        rows = {}
+        walks = {} # location -> [program]
+
+        def done(program, size, source, store_source=None):
+            results[program] = size
+            rows[program.hive, program.key] = (program.hive, program.key, program.last_write,
+                                               program.values.get("InstallDate"), size, store_source or source)
+            if on_size:
+                on_size(program, size, source)
+
+        for program in programs:
+            hit = cached.get((program.hive, program.key))
+            if hit is not None and hit[:2] == (program.last_write, program.values.get("InstallDate")):
+                done(program, hit[2], "cache", hit[3])
+                continue
+            size = program.estimated_size()
+            if size is not None:
+                done(program, size, "registry")
+                continue
+            location = program.install_location()
+            if location is not None:
+                walks.setdefault(os.path.normcase(location), []).append(program)
+            else:
+                done(program, None, "unknown")
+
+        def walked(result):
+            size = result.size if result.exists else None
+            for program in walks[result.name]:
+                done(program, size, "folder" if size is not None else "unknown")
+
+        self.walked = len(walks)
+        if walks:
+            scan_targets([(location, location) for location in walks], self.max_workers, on_result=walked, progress=progress)
+        self._save(rows.values())
+        return results
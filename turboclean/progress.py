@@ -0,0 +1,146 @@
+import threading
+import time
+from collections import deque
+
+# Progress reporting from worker threads to the UI.
+#
+# Workers post counters on the hot path without taking a lock: each thread
+# adds into its own slot per target, and only the first post from a thread
+# for a target registers that slot. The UI polls snapshot() at a fixed rate
+# (RENDER_MS) and redraws once per tick, however many updates arrived in
+# between. A snapshot may lag a worker by one post, but every slot field is
+# only ever written by its own thread, so counts are never torn or lost.
+#
+# With expect() given each target's expected entries and bytes (from the last
+# scan), the bar is weighted by work rather than moving in equal steps per
+# target, and an ETA is derived from recent throughput.
+
+RENDER_MS = 50 # 20 Hz
+
+# Bytes that cost about as much as one entry: walking is per entry, deleting
+# is per file plus some per byte, so bytes count a little towards the work
+BYTES_PER_ENTRY = 1024 * 1024
+
+# An unfinished target never shows more than this share of its weight done,
+# so an estimate that was too low parks the bar instead of overshooting
+UNFINISHED_CAP = 0.95
+
+# Throughput for the ETA is measured over this many seconds of recent history
+ETA_WINDOW = 5.0
+ETA_AFTER = 1.0 # No ETA before this much has elapsed
+
+
+def work(entries, bytes):
+    return entries + bytes / BYTES_PER_ENTRY
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return ""
+    if seconds < 5:
+        return "a few seconds left"
+    if seconds < 90:
+        return f"{int(seconds)} s left"
+    if seconds < 5400:
+        return f"{round(seconds / 60)} min left"
+    return f"{seconds / 3600:.1f} h left"
+
+
+class Snapshot:
+    __slots__ = ("entries", "bytes", "done", "total", "current", "elapsed", "finished", "fraction", "eta")
+
+    def __init__(self, entries, bytes, done, total, current, elapsed, finished, fraction, eta):
+        self.entries = entries # Files and directories seen (or programs read)
+        self.bytes = bytes
+        self.done = done # Targets finished
+        self.total = total
+        self.current = current # What is being worked on, for display
+        self.elapsed = elapsed
+        self.finished = finished
+        self.fraction = fraction # 0..1, weighted by expected work when known
+        self.eta = eta # Seconds left, or None while unknown
+
+
+class ProgressBus:
+    def __init__(self, total=0):
+        self.total = total
+        self.current = None
+        self.started = time.perf_counter()
+        self.finished = False
+        self.result = None # Set by finish() for the UI to pick up
+        self.expected = None # Work per target, from expect()
+        self._slots = [] # (target, [entries, bytes, done])
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._history = deque() # (time, fraction), for the ETA; UI thread only
+
+    def expect(self, estimates):
+        # estimates: (entries, bytes) or None per target, in target order.
+        # Unknown targets are weighted like the average known one.
+        known = [work(*e) for e in estimates if e is not None]
+        default = sum(known) / len(known) if known else 1.0
+        self.expected = [max(work(*e), 1.0) if e is not None else default for e in estimates]
+        self.total = len(estimates)
+
+    def _slot(self, target):
+        slots = getattr(self._local, "slots", None)
+        if slots is None:
+            slots = self._local.slots = {}
+        slot = slots[target] = [0, 0, 0]
+        with self._lock:
+            self._slots.append((target, slot))
+        return slot
+
+    def add(self, entries=0, bytes=0, done=0, target=0):
+        slots = getattr(self._local, "slots", None)
+        slot = slots.get(target) if slots is not None else None
+        if slot is None:
+            slot = self._slot(target)
+        slot[0] += entries
+        slot[1] += bytes
+        slot[2] += done
+
+    def finish(self, result=None):
+        self.result = result
+        self.finished = True
+
+    def _fraction(self, per_target, done):
+        if self.finished:
+            return 1.0
+        if self.expected is None:
+            return done / self.total if self.total else 0.0
+        total = sum(self.expected)
+        progress = 0.0
+        for target, expected in enumerate(self.expected):
+            entries, size, finished = per_target.get(target, (0, 0, 0))
+            if finished:
+                progress += expected
+            else:
+                progress += min(work(entries, size) / expected, UNFINISHED_CAP) * expected
+        return progress / total
+
+    def _eta(self, now, fraction):
+        history = self._history
+        history.append((now, fraction))
+        while len(history) > 2 and now - history[0][0] > ETA_WINDOW:
+            history.popleft()
+        then, before = history[0]
+        if self.finished or now - self.started < ETA_AFTER or now <= then or fraction <= before:
+            return None
+        return (1.0 - fraction) * (now - then) / (fraction - before)
+
+    def snapshot(self):
+        # Called from the UI thread only
+        with self._lock:
+            slots = list(self._slots)
+        per_target = {}
+        for target, (entries, size, done) in slots:
+            e, b, d = per_target.get(target, (0, 0, 0))
+            per_target[target] = (e + entries, b + size, d + done)
+        entries = sum(e for e, _, _ in per_target.values())
+        size = sum(b for _, b, _ in per_target.values())
+        done = sum(d for _, _, d in per_target.values())
+        now = time.perf_counter()
+        fraction = self._fraction(per_target, done)
+        return Snapshot(entries, size, done, self.total, self.current, now - self.started, self.finished,
+                        fraction, self._eta(now, fraction))
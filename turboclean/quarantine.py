@@ -0,0 +1,467 @@
+import json
+import os
+import sys
+import time
+
+from turboclean.cleaner import CleanResult, _unlink, error_reason
+from turboclean.rules import ConfigError, load_targets
+from turboclean.scanner import FILE_ATTRIBUTE_REPARSE_POINT, QUARANTINE_DIR, is_link
+
+# Quarantine: instead of deleting a target's contents, move them with renames
+# into <target>/.turboclean-quarantine/<id>. A rename within one directory
+# tree never crosses volumes, so it is a metadata change however large the
+# tree is. The moves are journaled (quarantine.json next to the app) and can
+# be restored until the purge runs, which deletes entries older than
+# PURGE_AFTER_HOURS from a separate low-priority process, pausing between
+# batches so it stays out of the way of foreground work.
+#
+# An entry is journaled before anything is moved. The journal is still not
+# the only record: listing and purging also look for quarantine directories
+# under the known targets, so an entry the journal lost is still found.
+
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "quarantine.json")
+
+PURGE_AFTER_HOURS = 24
+
+# The purge deletes this many files, then sleeps PURGE_PAUSE seconds
+PURGE_BATCH = 64
+PURGE_PAUSE = 0.05
+
+# A purge that started this long ago without finishing is assumed dead
+PURGE_STALE = 3600
+
+# Journal changes wait this long for the lock; a lock file older than
+# LOCK_STALE seconds was left by a process that died holding it
+LOCK_TIMEOUT = 10
+LOCK_STALE = 60
+
+
+class QuarantineEntry:
+    __slots__ = ("id", "name", "target", "path", "created", "bytes", "purging", "state")
+
+    def __init__(self, id, name, target, path, created, bytes=None, purging=None, state="held"):
+        self.id = id
+        self.name = name
+        self.target = target # Where the contents came from
+        self.path = path # Where they are now
+        self.created = created
+        self.bytes = bytes # Size the scan reported, if known
+        self.purging = purging # When a purge of this entry started
+        self.state = state # "moving" until the move finished, "found" if only on disk
+
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{slot: data[slot] for slot in cls.__slots__ if slot in data})
+
+    def due(self, now, after_hours=PURGE_AFTER_HOURS):
+        if self.purging is not None and now - self.purging < PURGE_STALE:
+            return False
+        return now - self.created >= after_hours * 3600
+
+
+class Journal:
+    # The list of quarantined entries. Both the app and the purge process
+    # write it, so every change holds an exclusive lock file while it
+    # re-reads the file and replaces it whole.
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+
+    def _read(self):
+        # Raises ValueError if the file cannot be parsed
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return []
+        try:
+            return [QuarantineEntry.from_dict(e) for e in data]
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"bad journal entry: {e}") from None
+
+    def entries(self):
+        # For reading only; a damaged journal reads as empty (see update)
+        try:
+            return self._read()
+        except (OSError, ValueError):
+            return []
+
+    def _lock(self):
+        lock = self.path + ".lock"
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return lock
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(lock) > LOCK_STALE:
+                        os.unlink(lock)
+                        continue
+                except OSError:
+                    continue # Released meanwhile
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{lock} is held by another process") from None
+                time.sleep(0.05)
+
+    def update(self, change):
+        # change(entries) edits the list in place. A journal that cannot be
+        # parsed is kept as quarantine.json.damaged-<time> rather than
+        # overwritten; its entries are found again on disk (find_entries).
+        lock = self._lock()
+        try:
+            try:
+                entries = self._read()
+            except ValueError:
+                os.replace(self.path, f"{self.path}.damaged-{int(time.time())}")
+                entries = []
+            change(entries)
+            tmp = self.path + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump([e.as_dict() for e in entries], f, indent=2)
+            os.replace(tmp, self.path)
+        finally:
+            os.unlink(lock)
+
+    def save(self, entry):
+        # Adds entry, or replaces the one with its id
+        def change(entries):
+            entries[:] = [e for e in entries if e.id != entry.id] + [entry]
+        self.update(change)
+
+    def remove(self, entry_id):
+        def change(entries):
+            entries[:] = [e for e in entries if e.id != entry_id]
+        self.update(change)
+
+
+def _entry_created(entry_id, path):
+    # Entry ids are the hex time_ns of the quarantine
+    try:
+        return int(entry_id, 16) / 1e9
+    except ValueError:
+        return os.path.getmtime(path)
+
+
+def find_entries(journal, targets=None):
+    # The journal's entries plus quarantine directories found on disk under
+    # the configured targets and the targets the journal knows of, which the
+    # journal lost (damaged, or a write that never happened). targets: extra
+    # (name, path) pairs to look under.
+    entries = journal.entries()
+    known = {os.path.normcase(e.path) for e in entries}
+    roots = [(e.name, e.target) for e in entries] + list(targets or [])
+    try:
+        roots += [(spec.name, spec.path) for spec in load_targets()]
+    except ConfigError:
+        pass
+    seen = set()
+    for name, target in roots:
+        root = os.path.join(target, QUARANTINE_DIR)
+        if os.path.normcase(root) in seen:
+            continue
+        seen.add(os.path.normcase(root))
+        try:
+            with os.scandir(root) as it:
+                found = [d for d in it if d.is_dir(follow_symlinks=False) and os.path.normcase(d.path) not in known]
+        except OSError:
+            continue
+        for d in found:
+            try:
+                created = _entry_created(d.name, d.path)
+            except OSError:
+                continue
+            entries.append(QuarantineEntry(d.name, name, target, d.path, created, state="found"))
+            known.add(os.path.normcase(d.path))
+    return entries
+
+
+def _move_tree(src_root, dst_root, skip=None):
+    # Moves everything under src_root to the same relative place under
+    # dst_root. A directory that cannot be renamed whole (something inside is
+    # in use) is descended into and its contents moved one by one; existing
+    # directories at the destination are merged into, existing files are
+    # never overwritten. Returns (entries moved, [(path, reason)]).
+    moved = 0
+    failures = []
+    stack = [""]
+    while stack:
+        rel = stack.pop()
+        try:
+            os.makedirs(os.path.join(dst_root, rel), exist_ok=True)
+            with os.scandir(os.path.join(src_root, rel)) as it:
+                entries = list(it)
+        except OSError as e:
+            failures.append((os.path.join(src_root, rel), error_reason(e)))
+            continue
+        for entry in entries:
+            if not rel and entry.name == skip:
+                continue
+            dst = os.path.join(dst_root, rel, entry.name)
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False) and not is_link(entry)
+                if os.path.lexists(dst):
+                    if is_dir and os.path.isdir(dst) and not os.path.islink(dst):
+                        stack.append(os.path.join(rel, entry.name))
+                    else:
+                        failures.append((entry.path, "already exists"))
+                    continue
+                os.rename(entry.path, dst)
+                moved += 1
+            except OSError as e:
+                if is_dir:
+                    stack.append(os.path.join(rel, entry.name))
+                else:
+                    failures.append((entry.path, error_reason(e)))
+    return moved, failures
+
+
+def _remove_empty(root):
+    # Bottom-up rmdir of whatever directories are left empty under root
+    dirs = [root]
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                        stack.append(entry.path)
+                        dirs.append(entry.path)
+        except OSError:
+            pass
+    for d in reversed(dirs):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+    return not os.path.lexists(root)
+
+
+def _is_link_path(path):
+    # A target that is itself a link or junction is not quarantined: the
+    # quarantine would land wherever it points
+    try:
+        return os.path.islink(path) or bool(getattr(os.lstat(path), "st_file_attributes", 0) & FILE_ATTRIBUTE_REPARSE_POINT)
+    except OSError:
+        return False
+
+
+def quarantine_target(name, path, journal=None, size=None):
+    # Moves the contents of path into its quarantine; the directory itself is
+    # kept. The CleanResult frees nothing yet: quarantined counts the entries
+    # moved (a directory renamed whole counts once).
+    journal = journal or Journal()
+    result = CleanResult(name, path)
+    if not os.path.isdir(path) or _is_link_path(path):
+        return result
+    entry_id = f"{time.time_ns():x}"
+    dest = os.path.join(path, QUARANTINE_DIR, entry_id)
+    entry = QuarantineEntry(entry_id, name, path, dest, time.time(), size, state="moving")
+    # Journal first: nothing is moved that the journal does not know about
+    try:
+        journal.save(entry)
+    except OSError as e:
+        result.add_error(journal.path, f"journal not writable: {error_reason(e)}")
+        return result
+
+    moved, failures = _move_tree(path, dest, skip=QUARANTINE_DIR)
+    for failed_path, reason in failures:
+        result.files_skipped += 1
+        result.add_error(failed_path, reason)
+    try:
+        if moved:
+            entry.state = "held"
+            journal.save(entry)
+        else:
+            journal.remove(entry_id)
+    except OSError as e:
+        # The entry may not survive; put everything back rather than risk it
+        result.add_error(journal.path, f"journal not writable: {error_reason(e)}")
+        _move_tree(dest, path)
+        moved = 0
+    if not moved:
+        _remove_empty(os.path.join(path, QUARANTINE_DIR))
+    result.quarantined = moved
+    return result
+
+
+def restore(entry_ids=None, journal=None):
+    # Moves quarantined entries (all of them by default) back where they came
+    # from. Entries a purge is working on are left alone. Returns
+    # [(entry, moved, failures)].
+    journal = journal or Journal()
+    now = time.time()
+    done = []
+    for entry in find_entries(journal):
+        if entry_ids is not None and entry.id not in entry_ids:
+            continue
+        if entry.purging is not None and now - entry.purging < PURGE_STALE:
+            done.append((entry, 0, [(entry.path, "being purged")]))
+            continue
+        if not os.path.lexists(entry.path):
+            journal.remove(entry.id) # Nothing was moved, or it was moved back
+            continue
+        moved, failures = _move_tree(entry.path, entry.target)
+        if _remove_empty(entry.path) and entry.state != "found":
+            journal.remove(entry.id)
+            _remove_empty(os.path.dirname(entry.path))
+        done.append((entry, moved, failures))
+    return done
+
+
+def _purge_tree(root, pause=PURGE_PAUSE, batch=PURGE_BATCH):
+    # Deletes root one file at a time, sleeping after every batch of files.
+    # Links are unlinked, never descended into. Returns (bytes, files, failures).
+    freed = deleted = since_pause = 0
+    failures = []
+    dirs = [root]
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError as e:
+            failures.append((current, error_reason(e)))
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False) and not is_link(entry):
+                    stack.append(entry.path)
+                    dirs.append(entry.path)
+                    continue
+                size = entry.stat(follow_symlinks=False).st_size
+                _unlink(entry.path)
+            except OSError as e:
+                failures.append((entry.path, error_reason(e)))
+                continue
+            freed += size
+            deleted += 1
+            since_pause += 1
+            if pause and since_pause >= batch:
+                time.sleep(pause)
+                since_pause = 0
+    for d in reversed(dirs):
+        try:
+            os.rmdir(d)
+        except OSError:
+            pass
+    return freed, deleted, failures
+
+
+def purge(journal=None, after_hours=PURGE_AFTER_HOURS, pause=PURGE_PAUSE):
+    # Deletes the entries that have been quarantined for after_hours or more.
+    # An entry whose files cannot all be deleted stays in the journal for the
+    # next purge. Returns [(entry, bytes, files, failures)].
+    journal = journal or Journal()
+    now = time.time()
+    done = []
+    for entry in find_entries(journal):
+        if not entry.due(now, after_hours):
+            continue
+        entry.purging = time.time()
+        journal.save(entry)
+        freed, deleted, failures = _purge_tree(entry.path, pause)
+        if os.path.lexists(entry.path):
+            entry.purging = None
+            journal.save(entry)
+        else:
+            journal.remove(entry.id)
+            _remove_empty(os.path.dirname(entry.path))
+        done.append((entry, freed, deleted, failures))
+    return done
+
+
+def lower_priority():
+    # Idle CPU and very low I/O priority for this process. Best effort: the
+    # purge still runs, throttled, where priorities cannot be changed.
+    try:
+        import psutil
+    except ImportError:
+        return
+    try:
+        process = psutil.Process()
+        if os.name == "nt":
+            process.nice(psutil.IDLE_PRIORITY_CLASS)
+            process.ionice(psutil.IOPRIO_VERYLOW)
+        else:
+            process.nice(19)
+            process.ionice(psutil.IOPRIO_CLASS_IDLE)
+    except (OSError, psutil.Error, AttributeError):
+        pass # AttributeError: no ionice on this platform (macOS)
+
+
+def start_background_purge(journal=None):
+    # Launches `quarantine purge --background` as a detached process if any
+    # entry is due. Returns the Popen, or None when there was nothing to do.
+    journal = journal or Journal()
+    now = time.time()
+    if not any(entry.due(now) for entry in find_entries(journal)):
+        return None
+    import subprocess
+    if getattr(sys, "frozen", False):
+        command = [sys.executable, "quarantine"]
+    else:
+        command = [sys.executable, "-m", "turboclean.quarantine"]
+    command += ["purge", "--background", "--journal", journal.path]
+    kwargs = {"stdin": subprocess.DEVNULL, "stdout": subprocess.DEVNULL, "stderr": subprocess.DEVNULL,
+              "cwd": os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.IDLE_PRIORITY_CLASS | subprocess.CREATE_NO_WINDOW
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        return subprocess.Popen(command, **kwargs)
+    except OSError:
+        return None
+
+
+def main(argv=None):
+    import argparse
+
+    # --journal goes after the subcommand, so `turbocleaner.py quarantine ...` can pass it through
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--journal", default=DEFAULT_JOURNAL_PATH, help="quarantine journal (default: %(default)s)")
+    parser = argparse.ArgumentParser(prog="python -m turboclean.quarantine", description="List, restore or purge quarantined files")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", parents=[common], help="show quarantined entries")
+    restore_cmd = sub.add_parser("restore", parents=[common], help="move quarantined entries back")
+    restore_cmd.add_argument("id", nargs="*", help="entries to restore (default: all)")
+    purge_cmd = sub.add_parser("purge", parents=[common], help=f"delete entries quarantined {PURGE_AFTER_HOURS}+ hours ago")
+    purge_cmd.add_argument("--all", action="store_true", help="delete every entry now")
+    purge_cmd.add_argument("--background", action="store_true", help="run at idle priority")
+    args = parser.parse_args(argv)
+
+    journal = Journal(args.journal)
+    if args.command == "list":
+        now = time.time()
+        for entry in find_entries(journal):
+            size = f"{entry.bytes / (1024 * 1024):.1f} MB" if entry.bytes is not None else "?"
+            state = "purging" if entry.purging is not None else f"{(now - entry.created) / 3600:.1f} h old"
+            if entry.state != "held":
+                state += f", {entry.state}"
+            print(f"{entry.id}  {entry.name:<24} {size:>10}  {state}  {entry.target}")
+        return 0
+    if args.command == "restore":
+        failed = 0
+        for entry, moved, failures in restore(set(args.id) or None, journal):
+            print(f"{entry.id}  {entry.name}: {moved} restored, {len(failures)} failed")
+            for path, reason in failures[:10]:
+                print(f"    {path}: {reason}")
+            failed += len(failures)
+        return 1 if failed else 0
+    if args.background:
+        lower_priority()
+    failed = 0
+    for entry, freed, deleted, failures in purge(journal, 0 if args.all else PURGE_AFTER_HOURS,
+                                                 PURGE_PAUSE if args.background else 0):
+        print(f"{entry.id}  {entry.name}: {freed / (1024 * 1024):.1f} MB in {deleted} files purged, {len(failures)} failed")
+        failed += len(failures)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+import itertools
+import os
+import threading
+import time
+
+# Registry access behind a small interface so the inventory and tweak code can
+# run against the real registry on Windows and an in-memory stand-in
+# elsewhere (benchmarks, development on Linux).
+#
+# Hives are named by string ("HKLM", "HKCU"); paths use backslashes and, like
+# the real registry, are case-insensitive. Last-write times are FILETIME
+# integers (100 ns ticks since 1601), as QueryInfoKey returns them.
+
+HIVES = ("HKLM", "HKCU")
+
+# Value types by their winreg names
+VALUE_TYPES = ("REG_SZ", "REG_EXPAND_SZ", "REG_BINARY", "REG_DWORD", "REG_MULTI_SZ", "REG_QWORD")
+
+ERROR_NO_MORE_ITEMS = 259
+MAX_KEY_NAME = 256
+
+
+class RegistryBackend:
+    def enum_subkeys(self, hive, path):
+        # [(subkey name, last_write)] for every direct subkey; OSError if the key is missing
+        raise NotImplementedError
+
+    def read_values(self, hive, path, names):
+        # {name: value} for those of `names` the key has; OSError if the key is missing
+        raise NotImplementedError
+
+    def read_typed(self, hive, path, names):
+        # {name: (value, type name)} for those of `names` the key has; {} if
+        # the key is missing
+        raise NotImplementedError
+
+    def write_values(self, hive, path, writes):
+        # Opens (creating if needed) the key once and applies every
+        # (name, value, type name) in order; value None deletes the value.
+        # Returns [(name, OSError or None)]; deleting what is absent succeeds.
+        raise NotImplementedError
+
+
+class WinRegBackend(RegistryBackend):
+    def __init__(self):
+        import winreg
+        self.winreg = winreg
+        self.roots = {"HKLM": winreg.HKEY_LOCAL_MACHINE, "HKCU": winreg.HKEY_CURRENT_USER}
+        self.types = {name: getattr(winreg, name) for name in VALUE_TYPES}
+        self.type_names = {code: name for name, code in self.types.items()}
+        self._enum_ex = self._load_enum_ex()
+
+    def _load_enum_ex(self):
+        # RegEnumKeyExW returns each subkey's last-write time during enumeration,
+        # so unchanged programs are recognised without opening their keys.
+        # winreg.EnumKey drops that field; fall back to it if ctypes is unusable.
+        try:
+            import ctypes
+            from ctypes import wintypes
+            fn = ctypes.windll.advapi32.RegEnumKeyExW
+        except (ImportError, AttributeError, OSError):
+            return None
+        fn.argtypes = [wintypes.HKEY, wintypes.DWORD, wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD),
+                       ctypes.POINTER(wintypes.DWORD), wintypes.LPWSTR, ctypes.POINTER(wintypes.DWORD),
+                       ctypes.POINTER(wintypes.FILETIME)]
+        fn.restype = wintypes.LONG
+
+        def enum(key, count):
+            name = ctypes.create_unicode_buffer(MAX_KEY_NAME)
+            size = wintypes.DWORD()
+            stamp = wintypes.FILETIME()
+            out = []
+            for i in range(count):
+                size.value = MAX_KEY_NAME
+                rc = fn(key.handle, i, name, ctypes.byref(size), None, None, None, ctypes.byref(stamp))
+                if rc == ERROR_NO_MORE_ITEMS:
+                    break
+                if rc == 0:
+                    out.append((name.value, (stamp.dwHighDateTime << 32) | stamp.dwLowDateTime))
+            return out
+        return enum
+
+    def enum_subkeys(self, hive, path):
+        winreg = self.winreg
+        with winreg.OpenKey(self.roots[hive], path) as key:
+            count = winreg.QueryInfoKey(key)[0]
+            if self._enum_ex is not None:
+                return self._enum_ex(key, count)
+            out = []
+            for i in range(count):
+                try:
+                    name = winreg.EnumKey(key, i)
+                    with winreg.OpenKey(key, name) as sub:
+                        out.append((name, winreg.QueryInfoKey(sub)[2]))
+                except OSError:
+                    pass
+            return out
+
+    def read_values(self, hive, path, names):
+        winreg = self.winreg
+        values = {}
+        with winreg.OpenKey(self.roots[hive], path) as key:
+            for name in names:
+                try:
+                    values[name] = winreg.QueryValueEx(key, name)[0]
+                except OSError:
+                    pass
+        return values
+
+    # Tweaks always address the native (64-bit) view, whatever the Python build
+
+    def read_typed(self, hive, path, names):
+        winreg = self.winreg
+        values = {}
+        try:
+            key = winreg.OpenKey(self.roots[hive], path, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY)
+        except FileNotFoundError:
+            return values
+        with key:
+            for name in names:
+                try:
+                    value, code = winreg.QueryValueEx(key, name)
+                except FileNotFoundError:
+                    continue
+                values[name] = (value, self.type_names.get(code, str(code)))
+        return values
+
+    def write_values(self, hive, path, writes):
+        winreg = self.winreg
+        access = winreg.KEY_SET_VALUE | winreg.KEY_QUERY_VALUE | winreg.KEY_WOW64_64KEY
+        try:
+            if all(value is None for _, value, _ in writes):
+                # Only deletions: a missing key already has none of the values
+                try:
+                    key = winreg.OpenKey(self.roots[hive], path, 0, access)
+                except FileNotFoundError:
+                    return [(name, None) for name, _, _ in writes]
+            else:
+                key = winreg.CreateKeyEx(self.roots[hive], path, 0, access)
+        except OSError as e:
+            return [(name, e) for name, _, _ in writes]
+
+        results = []
+        with key:
+            for name, value, type_name in writes:
+                try:
+                    if value is None:
+                        try:
+                            winreg.DeleteValue(key, name)
+                        except FileNotFoundError:
+                            pass
+                    else:
+                        winreg.SetValueEx(key, name, 0, self.types[type_name], value)
+                    results.append((name, None))
+                except OSError as e:
+                    results.append((name, e))
+        return results
+
+
+class _MemoryKey:
+    __slots__ = ("name", "values", "types", "subkeys", "last_write")
+
+    def __init__(self, name, last_write):
+        self.name = name
+        self.values = {}
+        self.types = {} # Value name -> type name, for values not of the default type
+        self.subkeys = {} # lowercased name -> _MemoryKey
+        self.last_write = last_write
+
+
+class MemoryRegistry(RegistryBackend):
+    # In-memory stand-in. Every write bumps the key's last-write time like the
+    # real registry does. `latency` (seconds) is slept per call to model the
+    # cost of a registry round trip in benchmarks; sleeping releases the GIL
+    # just as winreg calls do.
+
+    def __init__(self, latency=0.0, read_only=()):
+        self.latency = latency
+        # (hive, path prefix) pairs that refuse writes, like HKLM without elevation
+        self.read_only = [(hive, prefix.lower()) for hive, prefix in read_only]
+        self.roots = {hive: _MemoryKey(hive, 0) for hive in HIVES}
+        self._clock = itertools.count(int(time.time() * 10**7) + 116444736000000000)
+        self._lock = threading.Lock()
+
+    def _wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _find(self, hive, path, create=False):
+        key = self.roots[hive]
+        for part in filter(None, path.split("\\")):
+            sub = key.subkeys.get(part.lower())
+            if sub is None:
+                if not create:
+                    raise FileNotFoundError(2, "The system cannot find the file specified", f"{hive}\\{path}")
+                sub = key.subkeys[part.lower()] = _MemoryKey(part, next(self._clock))
+                key.last_write = next(self._clock)
+            key = sub
+        return key
+
+    # Reads
+
+    def enum_subkeys(self, hive, path):
+        self._wait()
+        with self._lock:
+            return [(k.name, k.last_write) for k in self._find(hive, path).subkeys.values()]
+
+    def read_values(self, hive, path, names):
+        self._wait()
+        with self._lock:
+            key = self._find(hive, path)
+            return {name: key.values[name] for name in names if name in key.values}
+
+    def read_typed(self, hive, path, names):
+        self._wait()
+        with self._lock:
+            try:
+                key = self._find(hive, path)
+            except FileNotFoundError:
+                return {}
+            return {name: (key.values[name], key.types.get(name) or _default_type(key.values[name]))
+                    for name in names if name in key.values}
+
+    def write_values(self, hive, path, writes):
+        self._wait()
+        lowered = path.lower()
+        if any(hive == h and lowered.startswith(prefix) for h, prefix in self.read_only):
+            denied = PermissionError(13, "Access is denied", f"{hive}\\{path}")
+            return [(name, denied) for name, _, _ in writes]
+        with self._lock:
+            if all(value is None for _, value, _ in writes):
+                try:
+                    key = self._find(hive, path)
+                except FileNotFoundError:
+                    return [(name, None) for name, _, _ in writes]
+            else:
+                key = self._find(hive, path, create=True)
+            for name, value, type_name in writes:
+                if value is None:
+                    key.values.pop(name, None)
+                    key.types.pop(name, None)
+                else:
+                    key.values[name] = value
+                    key.types[name] = type_name
+            key.last_write = next(self._clock)
+        return [(name, None) for name, _, _ in writes]
+
+    # Writes (fixture setup; also what a real install or uninstall does)
+
+    def create_key(self, hive, path, values=None):
+        with self._lock:
+            key = self._find(hive, path, create=True)
+            if values:
+                key.values.update(values)
+                key.last_write = next(self._clock)
+            return key
+
+    def set_value(self, hive, path, name, value):
+        with self._lock:
+            key = self._find(hive, path, create=True)
+            key.values[name] = value
+            key.last_write = next(self._clock)
+
+    def delete_key(self, hive, path):
+        parent, _, name = path.rpartition("\\")
+        with self._lock:
+            key = self._find(hive, parent)
+            if key.subkeys.pop(name.lower(), None) is None:
+                raise FileNotFoundError(2, "The system cannot find the file specified", f"{hive}\\{path}")
+            key.last_write = next(self._clock)
+
+
+def _default_type(value):
+    return "REG_DWORD" if isinstance(value, int) else "REG_SZ"
+
+
+def default_backend():
+    # The real registry on Windows; an empty stand-in anywhere else
+    if os.name == "nt":
+        return WinRegBackend()
+    return MemoryRegistry()
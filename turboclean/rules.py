@@ -0,0 +1,261 @@
+import json
+import os
+import re
+import time
+from fnmatch import translate
+
+from turboclean.fileindex import DAY_NS
+
+# Scan/clean targets and their file rules, loaded from targets.json next to
+# the app. A target without rules is emptied completely; with rules, only
+# files some rule selects are counted and deleted. A rule selects a file when
+# its name matches one of the include globs and none of the exclude globs,
+# and the age and size limits hold:
+#
+#   {"name": "User Temp", "path": "%LOCALAPPDATA%\\Temp", "rules": [
+#       {"include": ["*.tmp"], "exclude": ["*.lock"], "older_than_days": 7}]}
+#
+# A target with "cap_mb" is not emptied but trimmed to that size, least
+# recently used files first (see cleaner.Cleaner.clean_capped).
+#
+# All of a target's rules compile into one Matcher, which checks a file name
+# against the few globs that could match it instead of every rule in turn.
+
+DEFAULT_TARGETS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "targets.json")
+
+RULE_KEYS = {"include", "exclude", "older_than_days", "min_size", "max_size"}
+TARGET_KEYS = {"name", "path", "rules", "cap_mb"}
+
+WILDCARDS = re.compile(r"[*?\[]")
+ENV_VAR = re.compile(r"%([^%]+)%")
+
+
+class ConfigError(ValueError):
+    pass
+
+
+class Rule:
+    __slots__ = ("include", "exclude", "older_than_days", "min_size", "max_size")
+
+    def __init__(self, include=("*",), exclude=(), older_than_days=None, min_size=None, max_size=None):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.older_than_days = older_than_days # Not used (modified or accessed) for this long
+        self.min_size = min_size
+        self.max_size = max_size
+
+    @classmethod
+    def from_dict(cls, data):
+        if not isinstance(data, dict):
+            raise ConfigError(f"a rule must be an object, not {data!r}")
+        unknown = set(data) - RULE_KEYS
+        if unknown:
+            raise ConfigError(f"unknown rule keys: {', '.join(sorted(unknown))}")
+        for key in ("include", "exclude"):
+            globs = data.get(key, [])
+            if isinstance(globs, str) or not all(isinstance(g, str) and g for g in globs):
+                raise ConfigError(f"{key} must be a list of globs")
+        for key in ("older_than_days", "min_size", "max_size"):
+            value = data.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value < 0):
+                raise ConfigError(f"{key} must be a non-negative number")
+        return cls(data.get("include", ["*"]), data.get("exclude", []), data.get("older_than_days"),
+                   data.get("min_size"), data.get("max_size"))
+
+    def limited(self):
+        return self.older_than_days is not None or self.min_size is not None or self.max_size is not None
+
+
+class _GlobIndex:
+    # Which of a set of globs match a name, as a bitmask of the rules that own
+    # them. Globs are filed under their literal head ("prefix*") or, failing
+    # that, tail ("*.ext"), so a name only meets the globs that can match it:
+    # one dict probe per distinct literal length. Pure literals on one side
+    # need no pattern matching at all; other globs in a bucket are checked
+    # with their own regex. The few with wildcards at both ends go through one
+    # combined regex first, so names matching none of them cost one search.
+    __slots__ = ("always", "exact", "heads", "head_lengths", "tails", "tail_lengths", "loose", "any_loose")
+
+    def __init__(self):
+        self.always = 0
+        self.exact = {}
+        self.heads = {} # literal -> [mask, [(regex, mask)]]
+        self.tails = {}
+        self.loose = {} # glob -> mask
+        self.head_lengths = self.tail_lengths = ()
+        self.any_loose = None
+
+    def _file(self, buckets, literal, glob, bit):
+        bucket = buckets.setdefault(literal, [0, {}])
+        if glob is None:
+            bucket[0] |= bit
+        else:
+            bucket[1][glob] = bucket[1].get(glob, 0) | bit
+
+    def add(self, glob, bit):
+        glob = glob.lower()
+        if glob.strip("*") == "":
+            self.always |= bit
+            return
+        first = WILDCARDS.search(glob)
+        if first is None:
+            self.exact[glob] = self.exact.get(glob, 0) | bit
+            return
+        head = glob[:first.start()]
+        tail = glob[max(glob.rfind("*"), glob.rfind("?"), glob.rfind("]")) + 1:]
+        if head:
+            self._file(self.heads, head, None if glob == head + "*" else glob, bit)
+        elif tail:
+            self._file(self.tails, tail, None if glob == "*" + tail else glob, bit)
+        else:
+            self.loose[glob] = self.loose.get(glob, 0) | bit
+
+    def seal(self):
+        for buckets in (self.heads, self.tails):
+            for bucket in buckets.values():
+                bucket[1] = [(re.compile(translate(g)), mask) for g, mask in bucket[1].items()]
+        self.head_lengths = tuple(sorted({len(h) for h in self.heads}))
+        self.tail_lengths = tuple(sorted({len(t) for t in self.tails}))
+        if self.loose:
+            self.any_loose = re.compile("|".join(f"(?:{translate(g)})" for g in self.loose))
+            self.loose = [(re.compile(translate(g)), mask) for g, mask in self.loose.items()]
+
+    def find(self, name):
+        # name is already lower-cased
+        mask = self.always
+        if self.exact:
+            mask |= self.exact.get(name, 0)
+        for lengths, buckets, sliced in ((self.head_lengths, self.heads, False), (self.tail_lengths, self.tails, True)):
+            for length in lengths:
+                if length > len(name):
+                    break
+                bucket = buckets.get(name[-length:] if sliced else name[:length])
+                if bucket is not None:
+                    mask |= bucket[0]
+                    for pattern, bits in bucket[1]:
+                        if pattern.match(name):
+                            mask |= bits
+        if self.any_loose is not None and self.any_loose.match(name):
+            for pattern, bits in self.loose:
+                if pattern.match(name):
+                    mask |= bits
+        return mask
+
+
+class Matcher:
+    # All of a target's rules, compiled once. Names compare case-insensitively,
+    # as Windows does. Age is measured against the time of compiling, from the
+    # later of modification and access (as in the scan statistics).
+    __slots__ = ("rules", "includes", "excludes", "unlimited", "limits")
+
+    def __init__(self, rules, now_ns=None):
+        now_ns = time.time_ns() if now_ns is None else now_ns
+        self.rules = list(rules)
+        self.includes = _GlobIndex()
+        self.excludes = _GlobIndex()
+        self.unlimited = 0 # Rules with no age or size limit
+        self.limits = {} # bit -> (used before, min size, max size) for the rest
+        for i, rule in enumerate(self.rules):
+            bit = 1 << i
+            for glob in rule.include:
+                self.includes.add(glob, bit)
+            for glob in rule.exclude:
+                self.excludes.add(glob, bit)
+            if not rule.limited():
+                self.unlimited |= bit
+                continue
+            cutoff = now_ns - int(rule.older_than_days * DAY_NS) if rule.older_than_days is not None else None
+            self.limits[bit] = (cutoff, rule.min_size, rule.max_size)
+        self.includes.seal()
+        self.excludes.seal()
+
+    def match(self, name, size, mtime_ns, atime_ns):
+        name = name.lower()
+        mask = self.includes.find(name)
+        if not mask:
+            return False
+        mask &= ~self.excludes.find(name)
+        if mask & self.unlimited:
+            return True
+        if not mask:
+            return False
+        used = mtime_ns if mtime_ns > atime_ns else atime_ns
+        while mask:
+            bit = mask & -mask
+            mask ^= bit
+            cutoff, min_size, max_size = self.limits[bit]
+            if cutoff is not None and used >= cutoff:
+                continue
+            if min_size is not None and size < min_size:
+                continue
+            if max_size is not None and size > max_size:
+                continue
+            return True
+        return False
+
+
+def expand_path(path):
+    # %VAR% expansion on every platform; None if a variable is not set
+    missing = []
+
+    def var(m):
+        value = os.environ.get(m.group(1))
+        if value is None:
+            missing.append(m.group(1))
+            return m.group(0)
+        return value
+    expanded = ENV_VAR.sub(var, path)
+    return None if missing else os.path.expanduser(expanded)
+
+
+class TargetSpec:
+    __slots__ = ("name", "path", "matcher", "cap")
+
+    def __init__(self, name, path, matcher=None, cap=None):
+        self.name = name
+        self.path = path
+        self.matcher = matcher # None: the whole directory
+        self.cap = cap # Bytes to keep, or None to empty it
+
+
+def parse_targets(data, now_ns=None):
+    # data: the decoded config. "path" may be a list of candidates; the first
+    # whose variables are all set is used, and a target with none is left out.
+    if not isinstance(data, dict) or not isinstance(data.get("targets"), list):
+        raise ConfigError('expected an object with a "targets" list')
+    specs = []
+    for entry in data["targets"]:
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str) or "path" not in entry:
+            raise ConfigError(f"a target needs a name and a path: {entry!r}")
+        unknown = set(entry) - TARGET_KEYS
+        if unknown:
+            raise ConfigError(f"{entry['name']}: unknown target keys: {', '.join(sorted(unknown))}")
+        candidates = entry["path"] if isinstance(entry["path"], list) else [entry["path"]]
+        if not candidates or not all(isinstance(c, str) and c for c in candidates):
+            raise ConfigError(f"{entry['name']}: path must be a string or a list of strings")
+        try:
+            rules = [Rule.from_dict(rule) for rule in entry.get("rules", [])]
+        except ConfigError as e:
+            raise ConfigError(f"{entry['name']}: {e}") from None
+        cap_mb = entry.get("cap_mb")
+        if cap_mb is not None and (isinstance(cap_mb, bool) or not isinstance(cap_mb, (int, float)) or cap_mb < 0):
+            raise ConfigError(f"{entry['name']}: cap_mb must be a non-negative number")
+        path = next((p for p in map(expand_path, candidates) if p is not None), None)
+        if path is not None:
+            specs.append(TargetSpec(entry["name"], path, Matcher(rules, now_ns) if rules else None,
+                                    int(cap_mb * 1024 * 1024) if cap_mb is not None else None))
+    return specs
+
+
+def load_targets(path=DEFAULT_TARGETS_PATH, now_ns=None):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except OSError as e:
+        raise ConfigError(f"cannot read {path}: {e.strerror}") from None
+    except ValueError as e:
+        raise ConfigError(f"{path}: {e}") from None
+    try:
+        return parse_targets(data, now_ns)
+    except ConfigError as e:
+        raise ConfigError(f"{path}: {e}") from None
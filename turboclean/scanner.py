@@ -0,0 +1,341 @@
+import os
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import ExitStack
+
+from turboclean.manifest import Manifest
+from turboclean.stats import DirSummary, ScanStats
+
+# Directories a worker walks off its own stack before handing the rest back to
+# the pool, so deep trees fan out across workers instead of pinning one thread
+BATCH_DIRS = 32
+
+# Directories modified this close to the scan start are not trusted on the
+# next run: a change in the same timestamp tick would leave the mtime unchanged
+RACY_WINDOW_NS = 2 * 10**9
+
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Where a target's quarantined contents wait for the purge (see quarantine.py);
+# never counted as part of the target
+QUARANTINE_DIR = ".turboclean-quarantine"
+
+
+def is_link(entry):
+    # Symlinks and Windows reparse points (junctions, mount points). Python
+    # reports junctions as plain directories, so they are recognised by their
+    # attributes, which DirEntry has cached on Windows.
+    if entry.is_symlink():
+        return True
+    if os.name == "nt":
+        attrs = entry.stat(follow_symlinks=False).st_file_attributes
+        return bool(attrs & FILE_ATTRIBUTE_REPARSE_POINT)
+    return False
+
+
+def default_workers():
+    # Directory walking is I/O bound, so oversubscribe the CPUs a little
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+class TargetResult:
+    __slots__ = ("name", "path", "exists", "size", "files", "dirs", "errors", "manifest", "stats")
+
+    def __init__(self, name, path):
+        self.name = name
+        self.path = path
+        self.exists = False
+        self.size = 0
+        self.files = 0
+        self.dirs = 0
+        self.errors = 0
+        self.manifest = None
+        self.stats = None
+
+    def __repr__(self):
+        return f"TargetResult({self.name!r}, size={self.size}, files={self.files}, dirs={self.dirs})"
+
+
+class _Options:
+    # Per-target walk settings shared by every chunk of that target. Only the
+    # visited and linked maps are written, and only through dict.setdefault,
+    # which is atomic, so the first worker to claim a key wins.
+    __slots__ = ("budget", "cache", "trust_before", "record", "now_ns", "progress", "target",
+                 "follow_links", "matcher", "visited", "linked")
+
+    def __init__(self, budget, cache=None, trust_before=0, record=False, now_ns=None, progress=None, target=0,
+                 follow_links=False, matcher=None):
+        self.budget = budget
+        self.cache = cache
+        self.trust_before = trust_before
+        self.record = record
+        self.now_ns = now_ns
+        self.progress = progress
+        self.target = target # Index of the target, for progress
+        self.follow_links = follow_links
+        self.matcher = matcher # rules.Matcher; only files it selects are counted
+        self.visited = {} # (st_dev, st_ino) -> path of every directory walked
+        self.linked = {} # (st_dev, st_ino) -> path of files with more than one link
+
+
+class _Chunk:
+    # What one worker task found: totals plus the directories it did not get to
+    __slots__ = ("size", "files", "dirs", "errors", "stack", "records", "listing", "stats")
+
+    def __init__(self, stack, opts):
+        self.size = self.files = self.dirs = self.errors = 0
+        self.stack = stack
+        self.records = [] if opts.cache is not None else None
+        self.listing = [] if opts.record else None
+        self.stats = ScanStats(opts.now_ns) if opts.now_ns is not None else None
+
+
+def _walk(stack, opts):
+    # Iterative walk over an explicit stack; no recursion so depth is unbounded.
+    # DirEntry.is_dir/is_file answer from the cached directory entry and on
+    # Windows stat() does too, so a file costs no extra syscall there.
+    #
+    # With a cache ({path: (mtime_ns, size, files, subdirs, ages, top)}), a
+    # directory whose mtime still matches is not opened; its cached totals,
+    # children and statistics summary are used.
+    # With record set, every directory's files (names, sizes, mtimes) are kept
+    # for the manifest; cached directories are recorded as not listed.
+    # With stats (opts.now_ns set), the age histogram and largest files are
+    # gathered in the same pass.
+    #
+    # Symlinked and junctioned directories are skipped unless follow_links is
+    # set. Either way each directory (by st_dev, st_ino) is walked once, so a
+    # link cycle or a second route into the same tree ends the descent. Files
+    # with several hard links count once, at the first name seen; every name
+    # still goes into the manifest. DirEntry carries no link count on Windows,
+    # so hard links are only recognised where stat() reports them. A directory
+    # holding such files is never served from the index: its totals would skip
+    # claiming them, and another name walked later would count them again.
+    # Skipped links are recorded as zero-size files (the link itself, which
+    # the clean step unlinks) but not counted.
+    #
+    # With a matcher, files its rules do not select are neither counted nor
+    # recorded, so the clean step leaves them alone too.
+    chunk = _Chunk(stack, opts)
+    cache = opts.cache
+    budget = opts.budget
+    follow = opts.follow_links
+    visited = opts.visited
+    linked = opts.linked
+    matcher = opts.matcher
+    summarize = cache is not None or chunk.stats is not None
+    while stack and budget > 0:
+        path = stack.pop()
+        budget -= 1
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            chunk.errors += 1
+            continue
+        if visited.setdefault((st.st_dev, st.st_ino), path) != path:
+            continue
+        mtime = st.st_mtime_ns
+        if cache is not None:
+            hit = cache.get(path)
+            if hit is not None and hit[0] == mtime:
+                _, own_size, own_files, subdirs, ages, top = hit
+                chunk.size += own_size
+                chunk.files += own_files
+                chunk.dirs += 1
+                stack.extend(os.path.join(path, name) for name in subdirs)
+                chunk.records.append((path, mtime, own_size, own_files, subdirs, ages, top))
+                if chunk.listing is not None:
+                    chunk.listing.append((path, None))
+                if chunk.stats is not None:
+                    chunk.stats.add_dir(path, ages, top)
+                continue
+
+        own_size = own_files = 0
+        has_links = False
+        subdirs = []
+        names = [] if opts.record else None
+        sizes = array("Q") if opts.record else None
+        mtimes = array("q") if opts.record else None
+        summary = DirSummary() if summarize else None
+        complete = True
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if not follow and is_link(entry):
+                            if names is not None:
+                                st = entry.stat(follow_symlinks=False)
+                                if matcher is None or matcher.match(entry.name, st.st_size, st.st_mtime_ns, st.st_atime_ns):
+                                    names.append(entry.name)
+                                    sizes.append(0)
+                                    mtimes.append(st.st_mtime_ns)
+                        elif entry.is_dir(follow_symlinks=follow):
+                            if entry.name != QUARANTINE_DIR:
+                                subdirs.append(entry.name)
+                        elif entry.is_file(follow_symlinks=follow):
+                            st = entry.stat(follow_symlinks=follow)
+                            if matcher is not None and not matcher.match(entry.name, st.st_size, st.st_mtime_ns, st.st_atime_ns):
+                                continue
+                            if names is not None:
+                                names.append(entry.name)
+                                sizes.append(st.st_size)
+                                mtimes.append(st.st_mtime_ns)
+                            if st.st_nlink > 1:
+                                has_links = True
+                                if linked.setdefault((st.st_dev, st.st_ino), entry.path) != entry.path:
+                                    continue
+                            own_size += st.st_size
+                            own_files += 1
+                            if summary is not None:
+                                summary.add(entry.name, st.st_size, st.st_mtime_ns, st.st_atime_ns)
+                    except OSError:
+                        chunk.errors += 1
+        except OSError:
+            chunk.errors += 1
+            complete = False
+            if not own_files and not subdirs:
+                continue
+
+        chunk.size += own_size
+        chunk.files += own_files
+        chunk.dirs += 1
+        stack.extend(os.path.join(path, name) for name in subdirs)
+        if summary is not None:
+            ages, top = summary.packed()
+            if chunk.stats is not None:
+                chunk.stats.add_dir(path, ages, top)
+            if chunk.records is not None and complete:
+                trusted = mtime < opts.trust_before and not has_links
+                chunk.records.append((path, mtime if trusted else 0, own_size, own_files,
+                                      tuple(subdirs), ages, top))
+        if chunk.listing is not None:
+            chunk.listing.append((path, (names, sizes, mtimes)))
+    if opts.progress is not None:
+        opts.progress.add(chunk.files + chunk.dirs, chunk.size, target=opts.target)
+    return chunk
+
+
+class SizeWalker:
+    def __init__(self, max_workers=None, batch=BATCH_DIRS, index=None, record=False, stats=False, follow_links=False):
+        self.max_workers = max_workers or default_workers()
+        self.batch = batch
+        self.index = index
+        self.record = record
+        self.stats = stats
+        self.follow_links = follow_links
+
+    def _split(self, stack, in_flight):
+        # Hand leftover directories to idle workers, keeping a small backlog queued
+        idle = self.max_workers * 2 - in_flight
+        parts = max(1, min(len(stack), idle))
+        return [stack[i::parts] for i in range(parts)]
+
+    def scan(self, targets, on_result=None, progress=None, devices=None, matchers=None):
+        # targets: iterable of (name, path). One pool is shared by all targets,
+        # so small targets finish while large ones keep the remaining workers busy.
+        # devices, if given, names the physical device of each target: every
+        # device gets its own pool of max_workers, so separate disks are
+        # walked in parallel while partitions of one disk share its workers.
+        # matchers maps a target path to the rules.Matcher of its file rules.
+        # Those targets bypass the index: an age rule can select a file without
+        # its directory changing, so matched totals cannot be keyed on mtime.
+        # on_result(result) fires from the calling thread as each target completes.
+        # With record set, each result carries a Manifest of the files it saw;
+        # with stats set, a ScanStats (age histogram, largest files).
+        # progress (a ProgressBus) gets entries and bytes as workers see them
+        # and one step per finished target; call its expect() first for
+        # work-weighted progress.
+        results = [TargetResult(name, path) for name, path in targets]
+        if progress is not None:
+            progress.total = len(results)
+        devices = [None] * len(results) if devices is None else list(devices)
+        pending = [0] * len(results)
+        futures = {}
+        options = [None] * len(results)
+        records = [[] for _ in results]
+        started = time.time_ns()
+        trust_before = started - RACY_WINDOW_NS
+        pools = {}
+        in_flight = {} # device -> tasks queued or running on its pool
+
+        with ExitStack() as exit_stack:
+            def submit(idx, dirs):
+                device = devices[idx]
+                pool = pools.get(device)
+                if pool is None:
+                    pool = pools[device] = exit_stack.enter_context(ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix=f"turboclean-scan-{len(pools)}"))
+                pending[idx] += 1
+                in_flight[device] = in_flight.get(device, 0) + 1
+                futures[pool.submit(_walk, dirs, options[idx])] = idx
+
+            for idx, result in enumerate(results):
+                if os.path.isdir(result.path):
+                    result.exists = True
+                    matcher = matchers.get(result.path) if matchers else None
+                    cache = self.index.load(result.path) if self.index is not None and matcher is None else None
+                    options[idx] = _Options(self.batch, cache, trust_before, self.record, started if self.stats else None,
+                                            progress, idx, self.follow_links, matcher)
+                    if self.record:
+                        result.manifest = Manifest(result.path, started)
+                    if self.stats:
+                        result.stats = ScanStats(started)
+                    submit(idx, [result.path])
+                    continue
+                if progress is not None:
+                    progress.add(done=1, target=idx)
+                if on_result:
+                    on_result(result)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    idx = futures.pop(fut)
+                    pending[idx] -= 1
+                    in_flight[devices[idx]] -= 1
+                    result = results[idx]
+                    if progress is not None:
+                        progress.current = result.name
+
+                    chunk = fut.result()
+                    result.size += chunk.size
+                    result.files += chunk.files
+                    result.dirs += chunk.dirs
+                    result.errors += chunk.errors
+                    if chunk.records:
+                        records[idx].extend(chunk.records)
+                    if chunk.listing:
+                        for path, listed in chunk.listing:
+                            result.manifest.add_dir(path, listed)
+                    if chunk.stats is not None:
+                        result.stats.merge(chunk.stats)
+
+                    if chunk.stack:
+                        for part in self._split(chunk.stack, in_flight[devices[idx]]):
+                            submit(idx, part)
+
+                    if not pending[idx]:
+                        if result.manifest is not None:
+                            result.manifest.seal()
+                        if options[idx].cache is not None:
+                            self.index.replace(result.path, records[idx])
+                            records[idx] = None
+                        if progress is not None:
+                            progress.add(done=1, target=idx)
+                        if on_result:
+                            on_result(result)
+
+        return results
+
+
+def scan_targets(targets, max_workers=None, on_result=None, index=None, record=False, stats=False, progress=None,
+                 follow_links=False, devices=None, matchers=None):
+    return SizeWalker(max_workers, index=index, record=record, stats=stats, follow_links=follow_links).scan(
+        targets, on_result, progress, devices, matchers)
+
+
+def dir_size(path, max_workers=None):
+    result = scan_targets([(path, path)], max_workers)[0]
+    return result.size, result.files
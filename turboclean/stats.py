@@ -0,0 +1,97 @@
+import heapq
+import os
+from array import array
+from bisect import bisect_right
+
+from turboclean.fileindex import AGE_EDGES_DAYS, DAY_NS
+
+# Largest files kept per target, and per directory in the scan index
+TOP_FILES = 20
+
+# Files not modified or accessed for this long count as old
+OLD_AFTER_DAYS = 30
+
+AGE_LABELS = ("< 7 days", "7-30 days", "30-90 days", "90-365 days", "1 year+")
+
+
+class DirSummary:
+    # Per-directory accumulator filled while its files are listed: a histogram
+    # of files by last-use day and the directory's own largest files. This is
+    # also what the scan index stores, so cached directories contribute to the
+    # statistics without being opened.
+    __slots__ = ("days", "top")
+
+    def __init__(self):
+        self.days = {} # epoch day -> [files, bytes]
+        self.top = [] # min-heap of (size, name), at most TOP_FILES long
+
+    def add(self, name, size, mtime_ns, atime_ns):
+        # Last use is the later of modification and access; atime alone is
+        # unreliable where last-access updates are disabled
+        day = (mtime_ns if mtime_ns > atime_ns else atime_ns) // DAY_NS
+        slot = self.days.get(day)
+        if slot is None:
+            self.days[day] = [1, size]
+        else:
+            slot[0] += 1
+            slot[1] += size
+        top = self.top
+        if len(top) < TOP_FILES:
+            heapq.heappush(top, (size, name))
+        elif size > top[0][0]:
+            heapq.heapreplace(top, (size, name))
+
+    def packed(self):
+        # (ages, top): ages is array('q') of [day, files, bytes, ...]
+        ages = array("q")
+        for day, (files, size) in self.days.items():
+            ages.extend((day, files, size))
+        return ages, tuple(self.top)
+
+
+class ScanStats:
+    # Per-target statistics built in the same pass as the size walk, in
+    # constant memory: one counter pair per age bucket and a bounded heap of
+    # the largest files. Ages are at day granularity.
+    __slots__ = ("today", "files", "bytes", "largest")
+
+    def __init__(self, now_ns):
+        self.today = now_ns // DAY_NS
+        self.files = [0] * (len(AGE_EDGES_DAYS) + 1)
+        self.bytes = [0] * (len(AGE_EDGES_DAYS) + 1)
+        self.largest = [] # min-heap of (size, path)
+
+    def add_dir(self, path, ages, top):
+        for i in range(0, len(ages), 3):
+            bucket = bisect_right(AGE_EDGES_DAYS, self.today - ages[i])
+            self.files[bucket] += ages[i + 1]
+            self.bytes[bucket] += ages[i + 2]
+        largest = self.largest
+        for size, name in top:
+            if len(largest) < TOP_FILES:
+                heapq.heappush(largest, (size, os.path.join(path, name)))
+            elif size > largest[0][0]:
+                heapq.heapreplace(largest, (size, os.path.join(path, name)))
+
+    def merge(self, other):
+        for i in range(len(self.files)):
+            self.files[i] += other.files[i]
+            self.bytes[i] += other.bytes[i]
+        for item in other.largest:
+            if len(self.largest) < TOP_FILES:
+                heapq.heappush(self.largest, item)
+            elif item[0] > self.largest[0][0]:
+                heapq.heapreplace(self.largest, item)
+
+    def histogram(self):
+        # [(label, files, bytes)], youngest first
+        return list(zip(AGE_LABELS, self.files, self.bytes))
+
+    def old(self, days=OLD_AFTER_DAYS):
+        # (files, bytes) last used at least `days` ago; days must be a bucket edge
+        first = AGE_EDGES_DAYS.index(days) + 1
+        return sum(self.files[first:]), sum(self.bytes[first:])
+
+    def top(self, n=TOP_FILES):
+        # [(size, path)], biggest first
+        return sorted(self.largest, reverse=True)[:n]
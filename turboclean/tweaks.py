@@ -0,0 +1,319 @@
+import json
+import os
+import time
+
+# Declarative Boost tweaks. Each one is a set of registry writes: the value to
+# set when applied, and the value that undoes it (None = delete the value,
+# i.e. back to the Windows default). The engine below plans, applies and rolls
+# back any selection of them.
+
+DEFAULT_SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tweak_snapshot.json")
+
+
+class RegWrite:
+    __slots__ = ("hive", "path", "name", "value", "type", "revert")
+
+    def __init__(self, hive, path, name, value, type="REG_DWORD", revert=None):
+        self.hive = hive
+        self.path = path
+        self.name = name
+        self.value = value
+        self.type = type
+        self.revert = revert
+
+    @property
+    def location(self):
+        return f"{self.hive}\\{self.path}\\{self.name}"
+
+
+class Tweak:
+    __slots__ = ("key", "title", "writes")
+
+    def __init__(self, key, title, writes):
+        self.key = key # Same key as the Boost option it backs
+        self.title = title
+        self.writes = writes
+
+
+PERSONALIZE = r"Software\Microsoft\Windows\CurrentVersion\Themes\Personalize"
+
+CATALOG = [
+    Tweak("dark_mode", "Enable Dark Theme", [
+        RegWrite("HKCU", PERSONALIZE, "AppsUseLightTheme", 0, revert=1),
+        RegWrite("HKCU", PERSONALIZE, "SystemUsesLightTheme", 0, revert=1),
+    ]),
+    Tweak("disable_anim", "Disable Desktop Animations", [
+        # 2 = Adjust for best performance
+        RegWrite("HKCU", r"Software\Microsoft\Windows\CurrentVersion\Explorer\VisualEffects", "VisualFXSetting", 2, revert=0),
+    ]),
+    Tweak("disable_transparency", "Disable Transparency Effects", [
+        RegWrite("HKCU", PERSONALIZE, "EnableTransparency", 0, revert=1),
+    ]),
+    Tweak("utc_time", "Enable UTC Time Globally", [
+        RegWrite("HKLM", r"SYSTEM\CurrentControlSet\Control\TimeZoneInformation", "RealTimeIsUniversal", 1),
+    ]),
+    Tweak("disable_telemetry", "Turn off Windows telemetry and Cortana", [
+        RegWrite("HKLM", r"SOFTWARE\Policies\Microsoft\Windows\DataCollection", "AllowTelemetry", 0),
+        RegWrite("HKLM", r"SOFTWARE\Policies\Microsoft\Windows\Windows Search", "AllowCortana", 0),
+    ]),
+    Tweak("office_telemetry", "Disable Office telemetry (2016+)", [
+        RegWrite("HKCU", r"Software\Policies\Microsoft\office\common\clienttelemetry", "DisableTelemetry", 1),
+    ]),
+    Tweak("disable_copilot", "Disable CoPilot AI in Windows 11 & Edge", [
+        RegWrite("HKCU", r"Software\Policies\Microsoft\Windows\WindowsCopilot", "TurnOffWindowsCopilot", 1),
+        RegWrite("HKLM", r"SOFTWARE\Policies\Microsoft\Edge", "HubsSidebarEnabled", 0),
+    ]),
+    Tweak("block_ads", "Block Ad Tracking", [
+        RegWrite("HKCU", r"Software\Microsoft\Windows\CurrentVersion\AdvertisingInfo", "Enabled", 0, revert=1),
+    ]),
+    Tweak("disable_services", "Disable unnecessary Windows services", [
+        # Start 4 = disabled; the reverts are the services' stock start types
+        RegWrite("HKLM", r"SYSTEM\CurrentControlSet\Services\DiagTrack", "Start", 4, revert=2),
+        RegWrite("HKLM", r"SYSTEM\CurrentControlSet\Services\dmwappushservice", "Start", 4, revert=3),
+    ]),
+    Tweak("stop_updates", "Stop automatic Windows 10/11 updates", [
+        RegWrite("HKLM", r"SOFTWARE\Policies\Microsoft\Windows\WindowsUpdate\AU", "NoAutoUpdate", 1),
+    ]),
+    Tweak("disable_onedrive", "Disable OneDrive", [
+        RegWrite("HKLM", r"SOFTWARE\Policies\Microsoft\Windows\OneDrive", "DisableFileSyncNGSC", 1),
+    ]),
+    Tweak("perf_tweak", "Enhance system and network performance", [
+        RegWrite("HKLM", r"SYSTEM\CurrentControlSet\Control\PriorityControl", "Win32PrioritySeparation", 38, revert=2),
+        RegWrite("HKLM", r"SOFTWARE\Microsoft\Windows NT\CurrentVersion\Multimedia\SystemProfile",
+                 "NetworkThrottlingIndex", 0xFFFFFFFF, revert=10),
+    ]),
+]
+
+TWEAKS = {tweak.key: tweak for tweak in CATALOG}
+
+
+class Change:
+    # One planned write: what is there now and what the tweak wants
+    __slots__ = ("tweak", "write", "current", "target")
+
+    def __init__(self, tweak, write, current, target):
+        self.tweak = tweak
+        self.write = write
+        self.current = current # (value, type) or None if absent
+        self.target = target # value, or None to delete
+
+    @property
+    def needed(self):
+        if self.target is None:
+            return self.current is not None
+        return self.current is None or self.current != (self.target, self.write.type)
+
+    def describe(self):
+        before = "(absent)" if self.current is None else repr(self.current[0])
+        after = "(absent)" if self.target is None else repr(self.target)
+        return f"{self.write.location}: {before} -> {after}"
+
+
+class TweakResult:
+    # Outcome of one tweak in a run
+    __slots__ = ("key", "title", "status", "changes", "errors")
+
+    def __init__(self, key, title, status, changes=(), errors=()):
+        self.key = key
+        self.title = title
+        self.status = status # applied, unchanged, planned, failed, unsupported
+        self.changes = list(changes)
+        self.errors = list(errors) # (location, reason)
+
+    def as_dict(self):
+        return {
+            "key": self.key,
+            "title": self.title,
+            "status": self.status,
+            "changes": [c.describe() for c in self.changes],
+            "errors": [list(e) for e in self.errors],
+        }
+
+
+class ApplyRun:
+    # Everything one apply did: per-tweak results plus the prior values of
+    # every write it made, which is what rollback() restores
+    __slots__ = ("results", "snapshot", "dry_run", "started")
+
+    def __init__(self, dry_run):
+        self.results = []
+        self.snapshot = [] # (hive, path, name, value or None, type or None)
+        self.dry_run = dry_run
+        self.started = time.time()
+
+    def count(self, status):
+        return sum(1 for r in self.results if r.status == status)
+
+    def summary(self):
+        # One line per tweak, e.g. "Disable OneDrive: failed (HKLM\...: access denied)"
+        lines = []
+        for r in self.results:
+            line = f"{r.title}: {r.status}"
+            if r.errors:
+                line += " (" + ", ".join(f"{loc}: {reason}" for loc, reason in r.errors) + ")"
+            elif r.status in ("applied", "planned"):
+                line += f" ({len(r.changes)} values)"
+            lines.append(line)
+        return lines
+
+    def as_dict(self):
+        return {
+            "dry_run": self.dry_run,
+            "started": self.started,
+            "results": [r.as_dict() for r in self.results],
+            "snapshot": [[hive, path, name, _encode_value(value), type_name] for hive, path, name, value, type_name in self.snapshot],
+        }
+
+
+def _reason(exc):
+    if isinstance(exc, PermissionError) or getattr(exc, "winerror", None) == 5:
+        return "access denied (run as administrator)"
+    return exc.strerror or type(exc).__name__
+
+
+def _group(items, location):
+    # {(hive, path): [item]} preserving order, so each key is opened once
+    groups = {}
+    for item in items:
+        groups.setdefault(location(item), []).append(item)
+    return groups
+
+
+class TweakEngine:
+    # Applies tweaks against a RegistryBackend:
+    #   1. read every touched key once and plan the writes that are needed
+    #   2. write them grouped by key, so each key is opened once
+    #   3. a tweak is all-or-nothing: if any of its writes fails, the ones
+    #      that succeeded are put back, and it is reported as failed
+    # The prior value of everything written goes into the run's snapshot.
+    # Registry calls block, so callers run this off the UI thread.
+
+    def __init__(self, backend, catalog=CATALOG):
+        self.backend = backend
+        self.tweaks = {tweak.key: tweak for tweak in catalog}
+
+    def _read(self, writes):
+        # {(hive, path, name): (value, type)} for the values present now
+        current = {}
+        for (hive, path), group in _group(writes, lambda w: (w.hive, w.path)).items():
+            names = list(dict.fromkeys(w.name for w in group))
+            for name, typed in self.backend.read_typed(hive, path, names).items():
+                current[hive, path, name] = typed
+        return current
+
+    def plan(self, keys, revert=False):
+        # ({key: [Change]}, [unknown keys]) with one registry read per key
+        tweaks = [self.tweaks[k] for k in keys if k in self.tweaks]
+        unknown = [k for k in keys if k not in self.tweaks]
+        current = self._read([w for t in tweaks for w in t.writes])
+        plan = {}
+        for tweak in tweaks:
+            plan[tweak.key] = [Change(tweak, w, current.get((w.hive, w.path, w.name)), w.revert if revert else w.value)
+                               for w in tweak.writes]
+        return plan, unknown
+
+    def status(self, keys=None):
+        # {key: True if every write is already in place}
+        plan, _ = self.plan(list(self.tweaks) if keys is None else keys)
+        return {key: not any(c.needed for c in changes) for key, changes in plan.items()}
+
+    def apply(self, keys, dry_run=False, revert=False):
+        run = ApplyRun(dry_run)
+        plan, unknown = self.plan(keys, revert)
+        pending = {key: [c for c in changes if c.needed] for key, changes in plan.items()}
+
+        if not dry_run:
+            changes = [c for cs in pending.values() for c in cs]
+            failed = self._write(changes, lambda c: (c.write.name, c.target, c.write.type))
+            undo = [c for c in changes if c.tweak.key in failed and (c.write.hive, c.write.path, c.write.name) not in failed[c.tweak.key]]
+            if undo:
+                # Put back the parts of failed tweaks that did get written
+                self._write(undo, lambda c: (c.write.name, c.current[0] if c.current else None,
+                                             c.current[1] if c.current else c.write.type))
+            for c in changes:
+                if c.tweak.key not in failed:
+                    run.snapshot.append((c.write.hive, c.write.path, c.write.name,
+                                         *(c.current if c.current else (None, None))))
+        else:
+            failed = {}
+
+        for key, changes in plan.items():
+            tweak = self.tweaks[key]
+            todo = pending[key]
+            if key in failed:
+                errors = [(f"{h}\\{p}\\{n}", reason) for (h, p, n), reason in failed[key].items()]
+                run.results.append(TweakResult(key, tweak.title, "failed", todo, errors))
+            elif not todo:
+                run.results.append(TweakResult(key, tweak.title, "unchanged"))
+            else:
+                run.results.append(TweakResult(key, tweak.title, "planned" if dry_run else "applied", todo))
+        for key in unknown:
+            run.results.append(TweakResult(key, key, "unsupported"))
+        return run
+
+    def _write(self, changes, entry):
+        # Grouped writes; returns {tweak key: {(hive, path, name): reason}} for failures
+        failed = {}
+        for (hive, path), group in _group(changes, lambda c: (c.write.hive, c.write.path)).items():
+            results = self.backend.write_values(hive, path, [entry(c) for c in group])
+            for c, (_, error) in zip(group, results):
+                if error is not None:
+                    failed.setdefault(c.tweak.key, {})[hive, path, c.write.name] = _reason(error)
+        return failed
+
+    def rollback(self, snapshot):
+        # Restore prior values from an ApplyRun snapshot; returns [(location, reason)] failures
+        errors = []
+        grouped = _group(snapshot, lambda s: (s[0], s[1]))
+        for (hive, path), entries in grouped.items():
+            writes = [(name, value, type_name or "REG_DWORD") for _, _, name, value, type_name in entries]
+            for name, error in self.backend.write_values(hive, path, writes):
+                if error is not None:
+                    errors.append((f"{hive}\\{path}\\{name}", _reason(error)))
+        return errors
+
+
+def _encode_value(value):
+    # REG_BINARY values are bytes, which JSON cannot hold; stored as tagged hex
+    return {"hex": value.hex()} if isinstance(value, (bytes, bytearray)) else value
+
+
+def _decode_value(value):
+    return bytes.fromhex(value["hex"]) if isinstance(value, dict) else value
+
+
+def save_snapshot(run, path=DEFAULT_SNAPSHOT_PATH):
+    # Keeps the last real run's prior values so it can be undone after a restart.
+    # Written beside the old one and swapped in, so a failed write never costs
+    # the snapshot already on disk.
+    if run.dry_run or not run.snapshot:
+        return False
+    snapshot = [(hive, key, name, _encode_value(value), type_name) for hive, key, name, value, type_name in run.snapshot]
+    tmp = path + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"started": run.started, "snapshot": snapshot}, f)
+        os.replace(tmp, path)
+        return True
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        return False
+
+
+def load_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return [(hive, key, name, _decode_value(value), type_name)
+                    for hive, key, name, value, type_name in json.load(f)["snapshot"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        return []
+
+
+def clear_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,175 @@
+import sys
+
+import customtkinter as ctk
+
+
+class ListModel:
+    # Plain data behind a VirtualList: the rows and which of them are ticked.
+    # Widgets only ever show a window of it, so it can hold any number of rows.
+
+    def __init__(self, rows=(), checked=False):
+        self.rows = list(rows)
+        self.checked = bytearray([checked]) * len(self.rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def append(self, row, checked=False):
+        self.rows.append(row)
+        self.checked.append(checked)
+        return len(self.rows) - 1
+
+    def set_rows(self, rows, checked=False):
+        self.rows = list(rows)
+        self.checked = bytearray([checked]) * len(self.rows)
+
+    def clear(self):
+        self.set_rows(())
+
+    def update(self, index, row):
+        self.rows[index] = row
+
+    def set_checked(self, index, value):
+        self.checked[index] = bool(value)
+
+    def sort(self, key, reverse=False):
+        # Reorder rows, keeping each row's tick with it
+        order = sorted(range(len(self.rows)), key=lambda i: key(self.rows[i]), reverse=reverse)
+        self.rows = [self.rows[i] for i in order]
+        self.checked = bytearray(self.checked[i] for i in order)
+
+    def check_where(self, predicate, value=True):
+        for i, row in enumerate(self.rows):
+            if predicate(row):
+                self.checked[i] = value
+
+    def checked_count(self):
+        return self.checked.count(1)
+
+    def checked_rows(self):
+        return [row for row, on in zip(self.rows, self.checked) if on]
+
+
+class VirtualList(ctk.CTkFrame):
+    # Scrolling list that creates only enough row widgets to fill the viewport
+    # (plus one) and rebinds them to different model rows as it scrolls, so
+    # widget count and render time do not grow with the number of rows.
+    #
+    # make_row(parent) builds one pooled row; it returns an object with a
+    # `frame` (created with height=row_height) and a `show(index, row, checked)`
+    # method that rewrites its labels for another model row. Rows report ticks
+    # back through VirtualList.set_checked.
+
+    def __init__(self, master, model, make_row, row_height, row_gap=10, empty_text="", on_change=None, **kwargs):
+        super().__init__(master, fg_color="transparent", **kwargs)
+        self.model = model
+        self.make_row = make_row
+        self.row_height = row_height
+        self.stride = row_height + row_gap
+        self.on_change = on_change
+        self.top = 0 # Scroll offset in unscaled pixels
+        self.pool = []
+
+        self.viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self.viewport.pack(side="left", fill="both", expand=True)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.yview)
+        self.scrollbar.pack(side="right", fill="y")
+        self.empty_label = ctk.CTkLabel(self.viewport, text=empty_text, text_color="gray")
+
+        self.viewport.bind("<Configure>", lambda _: self.refresh())
+        if sys.platform.startswith("linux"):
+            self.bind_all("<Button-4>", self._on_wheel, add="+")
+            self.bind_all("<Button-5>", self._on_wheel, add="+")
+        else:
+            self.bind_all("<MouseWheel>", self._on_wheel, add="+")
+
+    # Geometry, all in unscaled pixels like the rest of CTk
+
+    def _view_height(self):
+        return max(1, self.viewport.winfo_height() / self._get_widget_scaling())
+
+    def _content_height(self):
+        return len(self.model) * self.stride
+
+    def _max_top(self):
+        return max(0, self._content_height() - self._view_height())
+
+    # Scrolling
+
+    def yview(self, *args):
+        # Scrollbar protocol: ("moveto", fraction) or ("scroll", n, "units"/"pages")
+        if args[0] == "moveto":
+            self.scroll_to(float(args[1]) * self._content_height())
+        elif args[0] == "scroll":
+            step = self._view_height() if args[2] == "pages" else self.stride
+            self.scroll_to(self.top + int(args[1]) * step)
+
+    def scroll_to(self, top):
+        self.top = min(max(0, int(top)), int(self._max_top()))
+        self.refresh()
+
+    def see(self, index):
+        if index * self.stride < self.top:
+            self.scroll_to(index * self.stride)
+        elif (index + 1) * self.stride > self.top + self._view_height():
+            self.scroll_to((index + 1) * self.stride - self._view_height())
+
+    def _on_wheel(self, event):
+        # Bound application-wide; only react when the pointer is over this list
+        # (the scrollbar handles its own wheel events)
+        widget = event.widget
+        if isinstance(widget, str) or str(widget).startswith(str(self.scrollbar)):
+            return
+        if str(widget).startswith(str(self)):
+            if event.num == 4 or event.delta > 0:
+                self.scroll_to(self.top - 3 * self.stride)
+            else:
+                self.scroll_to(self.top + 3 * self.stride)
+
+    # Rendering
+
+    def refresh(self):
+        # Rebind the pooled rows to the rows now in view. Cheap enough to call
+        # after every model change.
+        view = self._view_height()
+        self.top = min(self.top, int(self._max_top()))
+        needed = int(view // self.stride) + 2
+        while len(self.pool) < needed:
+            self.pool.append(self.make_row(self.viewport))
+
+        if not self.model.rows:
+            for row in self.pool:
+                row.frame.place_forget()
+            self.empty_label.place(relx=0.5, y=20, anchor="n")
+        else:
+            self.empty_label.place_forget()
+            first = self.top // self.stride
+            offset = first * self.stride - self.top
+            for slot, row in enumerate(self.pool):
+                index = first + slot
+                if slot < needed and index < len(self.model):
+                    row.show(index, self.model.rows[index], self.model.checked[index])
+                    row.frame.place(x=0, y=offset + slot * self.stride, relwidth=1)
+                else:
+                    row.frame.place_forget()
+
+        content = self._content_height()
+        if content <= view:
+            self.scrollbar.set(0, 1)
+        else:
+            self.scrollbar.set(self.top / content, (self.top + view) / content)
+
+    def set_checked(self, index, value):
+        self.model.set_checked(index, value)
+        if self.on_change:
+            self.on_change()
+
+    def widget_count(self):
+        # Tk widgets currently backing the list, for measurement
+        count = 0
+        pending = [self]
+        while pending:
+            widget = pending.pop()
+            count += 1
+            pending.extend(widget.winfo_children())
+        return count